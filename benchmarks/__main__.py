@@ -0,0 +1,46 @@
+"""Runs the benchmark suite, and compares the mappers with equivalent hand-written code.
+
+Usage::
+
+    python -m benchmarks [--number 10000] [--repeat 5] [--filter enums]
+"""
+import argparse
+import timeit
+from typing import Callable, List, Optional, Sequence
+
+from .cases import Case, all_cases
+
+
+def measure(function: Callable, number: int, repeat: int) -> float:
+    """Best time of one call in microseconds"""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+
+def check(case: Case) -> None:
+    mapped, handwritten = case.mapped(), case.handwritten()
+    if mapped != handwritten:
+        raise AssertionError(f"{case.name} ({case.backend}): {mapped!r} != {handwritten!r}")
+
+
+def run(cases: List[Case], number: int, repeat: int) -> None:
+    print(f"{'case':<32}{'backend':<14}{'mapper [µs]':>12}{'by hand [µs]':>14}{'ratio':>8}")
+    for case in cases:
+        check(case)
+        mapped = measure(case.mapped, number, repeat)
+        handwritten = measure(case.handwritten, number, repeat)
+        print(f"{case.name:<32}{case.backend:<14}{mapped:>12.3f}{handwritten:>14.3f}{mapped / handwritten:>8.2f}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=10000, help="calls per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per case, the best one is reported")
+    parser.add_argument("--filter", default="", help="only run the cases whose name contains this text")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in all_cases() if args.filter in case.name]
+    run(cases, number=args.number, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
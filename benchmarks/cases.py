@@ -0,0 +1,281 @@
+"""Benchmark cases: every kind of assignment, mapped once with ``map_to`` and once with equivalent hand-written code.
+
+The classes are defined once per backend (dataclasses, and the installed Pydantic version), so every case measures
+the same mapping with every backend.
+"""
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Any, Callable, Dict, List, Optional
+
+from dataclass_mapper import enum_mapper, init_with_default, map_to, mapper, provide_with_extra
+from dataclass_mapper.implementations.utils import parse_version
+
+
+@dataclass
+class Case:
+    """One benchmark case
+
+    :param name: what the case measures
+    :param backend: the kind of classes (dataclasses or Pydantic)
+    :param mapped: maps the source object with the library
+    :param handwritten: maps the source object with equivalent hand-written code
+    """
+
+    name: str
+    backend: str
+    mapped: Callable[[], Any]
+    handwritten: Callable[[], Any]
+
+
+class Status(Enum):
+    OPEN = auto()
+    CLOSED = auto()
+
+
+@enum_mapper(Status)
+class StatusData(Enum):
+    OPEN = auto()
+    CLOSED = auto()
+
+
+STATUS_TABLE = {StatusData.OPEN: Status.OPEN, StatusData.CLOSED: Status.CLOSED}
+
+
+def backends() -> Dict[str, Any]:
+    """The base class and the class decorator for every available backend"""
+    result: Dict[str, Any] = {"dataclasses": (object, dataclass)}
+    try:
+        import pydantic
+    except ImportError:
+        return result
+    major = parse_version(pydantic.VERSION)[0]
+    result[f"pydantic v{major}"] = (pydantic.BaseModel, lambda cls: cls)
+    return result
+
+
+def constructor(cls: Any) -> Callable[..., Any]:
+    """The function that the generated code uses for creating objects (Pydantic models without validators are
+    created without validation)"""
+    if hasattr(cls, "model_construct"):
+        return cls.model_construct  # type: ignore[no-any-return]
+    if hasattr(cls, "construct"):
+        return cls.construct  # type: ignore[no-any-return]
+    return cls  # type: ignore[no-any-return]
+
+
+def cases_for_backend(backend: str, Base: Any, decorator: Callable[[Any], Any]) -> List[Case]:
+    @decorator
+    class Item(Base):
+        name: str
+        price: int
+        count: int
+
+    @mapper(Item)
+    @decorator
+    class ItemData(Base):
+        name: str
+        price: int
+        count: int
+
+    new_item = constructor(Item)
+
+    def item_by_hand(obj: Any) -> Any:
+        return new_item(name=obj.name, price=obj.price, count=obj.count)
+
+    # SimpleAssignment
+    @decorator
+    class Point(Base):
+        x: int
+        y: int
+        z: int
+        label: str
+
+    @mapper(Point)
+    @decorator
+    class PointData(Base):
+        x: int
+        y: int
+        z: int
+        label: str
+
+    new_point = constructor(Point)
+    point = PointData(x=1, y=2, z=3, label="a")
+
+    # optional fields: Optional -> Optional, and Optional -> field with default
+    @decorator
+    class Entry(Base):
+        item: Optional[Item]
+        note: Optional[str]
+        count: int = 0
+
+    @mapper(Entry)
+    @decorator
+    class EntryData(Base):
+        item: Optional[ItemData]
+        note: Optional[str]
+        count: Optional[int]
+
+    new_entry = constructor(Entry)
+    entry = EntryData(item=None, note="n", count=None)
+
+    def entry_by_hand(obj: Any) -> Any:
+        kwargs = {}
+        if obj.count is not None:
+            kwargs["count"] = obj.count
+        return new_entry(item=None if obj.item is None else item_by_hand(obj.item), note=obj.note, **kwargs)
+
+    # fields that are initialized with their defaults (Pydantic models: the construction without validation)
+    @decorator
+    class Record(Base):
+        a: int
+        b: int
+        c: str
+        d: str
+        e: float
+        f: float
+        g: int = 0
+        h: str = ""
+        i: Optional[int] = None
+        j: bool = False
+
+    @mapper(
+        Record, {"g": init_with_default(), "h": init_with_default(), "i": init_with_default(), "j": init_with_default()}
+    )
+    @decorator
+    class RecordData(Base):
+        a: int
+        b: int
+        c: str
+        d: str
+        e: float
+        f: float
+
+    new_record = constructor(Record)
+    record = RecordData(a=1, b=2, c="c", d="d", e=1.5, f=2.5)
+
+    # RecursiveAssignment, ListRecursiveAssignment and DictRecursiveAssignment
+    @decorator
+    class Order(Base):
+        first: Item
+        items: List[Item]
+        by_name: Dict[str, Item]
+
+    @mapper(Order)
+    @decorator
+    class OrderData(Base):
+        first: ItemData
+        items: List[ItemData]
+        by_name: Dict[str, ItemData]
+
+    new_order = constructor(Order)
+    items = [ItemData(name=str(i), price=i, count=1) for i in range(20)]
+    order = OrderData(first=items[0], items=items, by_name={item.name: item for item in items})
+
+    # FunctionAssignment
+    @decorator
+    class Total(Base):
+        name: str
+        total: int
+
+    @mapper(Total, {"total": lambda self: self.price * self.count})
+    @decorator
+    class TotalData(Base):
+        name: str
+        price: int
+        count: int
+
+    new_total = constructor(Total)
+    total = TotalData(name="a", price=2, count=3)
+
+    # provide_with_extra
+    @decorator
+    class Owned(Base):
+        name: str
+        owner: str
+
+    @mapper(Owned, {"owner": provide_with_extra()})
+    @decorator
+    class OwnedData(Base):
+        name: str
+
+    new_owned = constructor(Owned)
+    owned = OwnedData(name="a")
+    extra = {"owner": "me"}
+
+    def owned_by_hand(obj: Any, extra: Dict[str, Any]) -> Any:
+        if "owner" not in extra:
+            raise TypeError("owner needs to be provided")
+        return new_owned(name=obj.name, owner=extra["owner"])
+
+    # enum mapping
+    @decorator
+    class Ticket(Base):
+        status: Status
+        history: List[Status]
+
+    @mapper(Ticket)
+    @decorator
+    class TicketData(Base):
+        status: StatusData
+        history: List[StatusData]
+
+    new_ticket = constructor(Ticket)
+    ticket = TicketData(status=StatusData.OPEN, history=[StatusData.OPEN, StatusData.CLOSED] * 10)
+
+    return [
+        Case(
+            "simple fields",
+            backend,
+            lambda: map_to(point, Point),
+            lambda: new_point(x=point.x, y=point.y, z=point.z, label=point.label),
+        ),
+        Case("optional fields", backend, lambda: map_to(entry, Entry), lambda: entry_by_hand(entry)),
+        Case(
+            "default values",
+            backend,
+            lambda: map_to(record, Record),
+            lambda: new_record(a=record.a, b=record.b, c=record.c, d=record.d, e=record.e, f=record.f),
+        ),
+        Case(
+            "nested object",
+            backend,
+            lambda: map_to(order.first, Item),
+            lambda: item_by_hand(order.first),
+        ),
+        Case(
+            "list + dict of nested objects",
+            backend,
+            lambda: map_to(order, Order),
+            lambda: new_order(
+                first=item_by_hand(order.first),
+                items=[item_by_hand(x) for x in order.items],
+                by_name={k: item_by_hand(v) for k, v in order.by_name.items()},
+            ),
+        ),
+        Case(
+            "conversion function",
+            backend,
+            lambda: map_to(total, Total),
+            lambda: new_total(name=total.name, total=total.price * total.count),
+        ),
+        Case(
+            "provide_with_extra",
+            backend,
+            lambda: map_to(owned, Owned, extra=extra),
+            lambda: owned_by_hand(owned, extra),
+        ),
+        Case(
+            "enums",
+            backend,
+            lambda: map_to(ticket, Ticket),
+            lambda: new_ticket(status=STATUS_TABLE[ticket.status], history=[STATUS_TABLE[x] for x in ticket.history]),
+        ),
+    ]
+
+
+def all_cases() -> List[Case]:
+    return [
+        case
+        for backend, (Base, decorator) in backends().items()
+        for case in cases_for_backend(backend, Base, decorator)
+    ]
@@ -1,11 +1,32 @@
-from .mapper import enum_mapper, enum_mapper_from, map_to, mapper, mapper_from
+from .cache import set_cache_dir
+from .columns import map_from_columns, map_to_columns
+from .instrumentation import MapperStats, enable_stats, reset_stats, stats
+from .mapper import (
+    compile_all,
+    enable_trusted,
+    enum_mapper,
+    enum_mapper_from,
+    get_mapper,
+    inspect_mapper,
+    map_many,
+    map_to,
+    mapper,
+    mapper_from,
+)
 from .mapping_method import Spezial, assume_not_none, init_with_default, provide_with_extra
+from .streaming import amap_iter
 
 USE_DEFAULT = Spezial.USE_DEFAULT
 IGNORE_MISSING_MAPPING = Spezial.IGNORE_MISSING_MAPPING
 
 __all__ = [
     "map_to",
+    "map_many",
+    "map_to_columns",
+    "map_from_columns",
+    "amap_iter",
+    "get_mapper",
+    "inspect_mapper",
     "mapper",
     "mapper_from",
     "enum_mapper",
@@ -15,4 +36,11 @@ __all__ = [
     "init_with_default",
     "assume_not_none",
     "provide_with_extra",
+    "compile_all",
+    "enable_trusted",
+    "set_cache_dir",
+    "enable_stats",
+    "stats",
+    "reset_stats",
+    "MapperStats",
 ]
@@ -1,19 +1,36 @@
 from .assignment import Assignment
 from .dict import DictRecursiveAssignment
+from .enum import DictEnumAssignment, EnumAssignment, ListEnumAssignment, get_enum_table, get_enum_table_name
 from .function import CallableWithMax1Parameter, FunctionAssignment
 from .list import ListRecursiveAssignment
 from .recursive import RecursiveAssignment
 from .simple import SimpleAssignment
-from .utils import get_map_to_func_name, get_var_name
+from .utils import (
+    Variables,
+    get_map_many_func_name,
+    get_map_many_without_extra_func_name,
+    get_map_to_func_name,
+    get_map_without_extra_func_name,
+    get_var_name,
+)
 
 __all__ = [
     "Assignment",
     "CallableWithMax1Parameter",
     "DictRecursiveAssignment",
+    "EnumAssignment",
+    "ListEnumAssignment",
+    "DictEnumAssignment",
     "SimpleAssignment",
     "RecursiveAssignment",
     "ListRecursiveAssignment",
     "FunctionAssignment",
+    "Variables",
     "get_var_name",
     "get_map_to_func_name",
+    "get_map_many_func_name",
+    "get_map_without_extra_func_name",
+    "get_map_many_without_extra_func_name",
+    "get_enum_table",
+    "get_enum_table_name",
 ]
@@ -1,16 +1,19 @@
 from abc import ABC, abstractmethod
 
 from ..implementations.base import FieldMeta
+from .utils import Variables
 
 
 class Assignment(ABC):
-    def __init__(self, source: FieldMeta, target: FieldMeta):
+    def __init__(self, source: FieldMeta, target: FieldMeta, variables: Variables = Variables()):
         """
         :param source: meta infos about the source field
         :param target: meta infos about the target field
+        :param variables: names of the variables in the generated code
         """
         self.source = source
         self.target = target
+        self.variables = variables
 
     @abstractmethod
     def applicable(self) -> bool:
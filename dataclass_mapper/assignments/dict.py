@@ -1,7 +1,8 @@
-from typing import get_args, get_origin
+from typing import Any, List, Tuple, get_args, get_origin
 
+from .. import code_generator as cg
 from .recursive import RecursiveAssignment
-from .utils import get_var_name, is_mappable_to
+from .utils import Variables, is_mappable_to
 
 
 class DictRecursiveAssignment(RecursiveAssignment):
@@ -15,6 +16,30 @@ class DictRecursiveAssignment(RecursiveAssignment):
 
     def right_side(self) -> str:
         target_value_type = get_args(self.target.type)[1]
+        if self.variables.extra is None:
+            map_func = self._get_map_func("v", target_cls=target_value_type, extra_str="")
+            return f"{{k: {map_func} for k, v in {self._source_var_name()}.items()}}"
         extra_str = self.extra_str() + ".get(k, {})"
         value_map_expression = self._get_map_func("v", target_cls=target_value_type, extra_str=extra_str)
-        return f"{{k: {value_map_expression} for k, v in {get_var_name(self.source)}.items()}}"
+        return f"{{k: {value_map_expression} for k, v in {self._source_var_name()}.items()}}"
+
+    def item_types(self) -> Tuple[Any, Any]:
+        return get_args(self.source.type)[1], get_args(self.target.type)[1]
+
+    def inlined_right_side(
+        self, variables: Variables, body: List[cg.Statement], constructor_call: str
+    ) -> Tuple[List[cg.Statement], str]:
+        result = variables.temporary("dict")
+        key = variables.temporary("key")
+        loop_body: List[cg.Statement] = [*body, cg.Assignment(name=f"{result}[{key}]", rhs=constructor_call)]
+        if variables.extra is not None:
+            loop_body.insert(0, cg.Assignment(name=variables.extra, rhs=self.extra_str() + f".get({key}, {{}})"))
+        statements: List[cg.Statement] = [
+            cg.Assignment(name=result, rhs="{}"),
+            cg.For(
+                variables=f"{key}, {variables.obj}",
+                iterable=f"{self._source_var_name()}.items()",
+                body=cg.Block(*loop_body),
+            ),
+        ]
+        return statements, result
@@ -0,0 +1,62 @@
+from enum import Enum
+from typing import Any, Dict, Optional, cast, get_args, get_origin
+
+from ..utils import get_class_identifier
+from .assignment import Assignment
+from .utils import get_map_to_func_name
+
+
+def get_enum_table(source_cls: Any, target_cls: Any) -> Optional[Dict[Any, Any]]:
+    """The lookup table of the enum mapper between the two enum classes, if such an enum mapper exists"""
+    if not all(isinstance(cls, type) and issubclass(cls, Enum) for cls in (source_cls, target_cls)):
+        return None
+    convert = getattr(source_cls, get_map_to_func_name(target_cls), None)
+    return cast(Optional[Dict[Any, Any]], getattr(convert, "d", None))
+
+
+def get_enum_table_name(source_cls: Any, target_cls: Any) -> str:
+    """Name of the global variable with the lookup table in the generated code"""
+    return f"_table_{get_class_identifier(source_cls)}_{get_class_identifier(target_cls)}"
+
+
+class EnumAssignment(Assignment):
+    """Maps an enum member by looking it up in the table of the enum mapper, instead of calling the mapper method"""
+
+    def applicable(self) -> bool:
+        return get_enum_table(self.source.type, self.target.type) is not None and not (
+            self.source.allow_none and self.target.disallow_none
+        )
+
+    def right_side(self) -> str:
+        table = get_enum_table_name(self.source.type, self.target.type)
+        return f"{table}[{self._source_var_name()}]"
+
+    def _source_var_name(self) -> str:
+        return self.variables.source(self.source)
+
+
+class ListEnumAssignment(EnumAssignment):
+    def applicable(self) -> bool:
+        return (
+            get_origin(self.source.type) is list
+            and get_origin(self.target.type) is list
+            and get_enum_table(get_args(self.source.type)[0], get_args(self.target.type)[0]) is not None
+        )
+
+    def right_side(self) -> str:
+        table = get_enum_table_name(get_args(self.source.type)[0], get_args(self.target.type)[0])
+        return f"[{table}[x] for x in {self._source_var_name()}]"
+
+
+class DictEnumAssignment(EnumAssignment):
+    def applicable(self) -> bool:
+        if not (get_origin(self.source.type) is dict and get_origin(self.target.type) is dict):
+            return False
+
+        source_key_type, source_value_type = get_args(self.source.type)
+        target_key_type, target_value_type = get_args(self.target.type)
+        return source_key_type == target_key_type and get_enum_table(source_value_type, target_value_type) is not None
+
+    def right_side(self) -> str:
+        table = get_enum_table_name(get_args(self.source.type)[1], get_args(self.target.type)[1])
+        return f"{{k: {table}[v] for k, v in {self._source_var_name()}.items()}}"
@@ -1,6 +1,5 @@
 from inspect import signature
-from typing import Any, Callable, Dict, Union, cast
-from uuid import uuid4
+from typing import Any, Callable, Optional, Union
 
 from ..implementations.base import FieldMeta
 
@@ -9,21 +8,41 @@ CallableWithMax1Parameter = Union[Callable[[], Any], Callable[[Any], Any]]
 
 class FunctionAssignment:
     def __init__(
-        self, function: CallableWithMax1Parameter, target: FieldMeta, methods: Dict[str, Callable], target_cls_name: str
+        self,
+        function: CallableWithMax1Parameter,
+        target: FieldMeta,
+        target_cls_name: str,
+        source_cls_alias_name: str,
+        target_cls_alias_name: str,
+        obj: Optional[str] = "self",
     ):
+        """
+        :param obj: the source object, that gets passed to functions with one parameter
+            (``None`` if there is no source object, e.g. when mapping from columns)
+        """
         self.function = function
         self.target = target
-        self.methods = methods
         self.target_cls_name = target_cls_name
+        self.source_cls_alias_name = source_cls_alias_name
+        self.target_cls_alias_name = target_cls_alias_name
+        self.obj = obj
+
+    def function_name(self) -> str:
+        # deterministic name, so that the generated code is always identical,
+        # and unique between the mappers that get inlined into each other
+        return f"_f{self.source_cls_alias_name}{self.target_cls_alias_name}_{self.target.name}"
 
     def right_side(self) -> str:
-        name = f"_{uuid4().hex}"
+        name = self.function_name()
         if (parameter_cnt := len(signature(self.function).parameters)) < 2:
             if parameter_cnt == 0:
-                self.methods[name] = cast(Callable, staticmethod(cast(Callable, self.function)))
-            else:
-                self.methods[name] = self.function
-            return f"self.{name}()"
+                return f"{name}()"
+            if self.obj is None:
+                raise ValueError(
+                    f"'{self.target.name}' of '{self.target_cls_name}' cannot be mapped from columns "
+                    "using a function with a parameter, as there is no source object"
+                )
+            return f"{name}({self.obj})"
 
         # can only happen, if the typing annotation fails (e.g. because mypy is not installed)
         raise ValueError(
@@ -1,7 +1,8 @@
-from typing import get_args, get_origin
+from typing import Any, List, Tuple, get_args, get_origin
 
+from .. import code_generator as cg
 from .recursive import RecursiveAssignment
-from .utils import get_var_name, is_mappable_to
+from .utils import Variables, is_mappable_to
 
 
 class ListRecursiveAssignment(RecursiveAssignment):
@@ -14,5 +15,33 @@ class ListRecursiveAssignment(RecursiveAssignment):
 
     def right_side(self) -> str:
         list_item_type = get_args(self.target.type)[0]
-        zipped = f"self.__zip_longest({get_var_name(self.source)}, {self.extra_str('[]')}, fillvalue=dict())"
-        return f'[{self._get_map_func("x", target_cls=list_item_type, extra_str="e")} for x, e in {zipped}]'
+        if self.variables.extra is None:
+            map_func = self._get_map_func("x", target_cls=list_item_type, extra_str="")
+            return f"[{map_func} for x in {self._source_var_name()}]"
+        return f'[{self._get_map_func("x", target_cls=list_item_type, extra_str="e")} for x, e in {self._zipped()}]'
+
+    def item_types(self) -> Tuple[Any, Any]:
+        return get_args(self.source.type)[0], get_args(self.target.type)[0]
+
+    def inlined_right_side(
+        self, variables: Variables, body: List[cg.Statement], constructor_call: str
+    ) -> Tuple[List[cg.Statement], str]:
+        result = variables.temporary("list")
+        append_object = cg.ExpressionStatement(f"{result}.append({constructor_call})")
+        if variables.extra is None:
+            loop = cg.For(
+                variables=variables.obj, iterable=self._source_var_name(), body=cg.Block(*body, append_object)
+            )
+        else:
+            loop = cg.For(
+                variables=f"{variables.obj}, {variables.extra}",
+                iterable=self._zipped(),
+                body=cg.Block(*body, append_object),
+            )
+        statements: List[cg.Statement] = [cg.Assignment(name=result, rhs="[]"), loop]
+        return statements, result
+
+    def _zipped(self) -> str:
+        return (
+            f"{self.variables.obj}.__zip_longest({self._source_var_name()}, {self.extra_str('[]')}, fillvalue=dict())"
+        )
@@ -1,7 +1,13 @@
-from typing import Any
+from typing import Any, List, Tuple
 
+from .. import code_generator as cg
 from .assignment import Assignment
-from .utils import get_map_to_func_name, get_var_name, is_mappable_to
+from .utils import (
+    Variables,
+    get_map_to_func_name,
+    get_map_without_extra_func_name,
+    is_mappable_to,
+)
 
 
 class RecursiveAssignment(Assignment):
@@ -11,11 +17,36 @@ class RecursiveAssignment(Assignment):
         )
 
     def right_side(self) -> str:
-        return self._get_map_func(get_var_name(self.source), target_cls=self.target.type, extra_str=self.extra_str())
+        return self._get_map_func(self._source_var_name(), target_cls=self.target.type, extra_str=self.extra_str())
+
+    def item_types(self) -> Tuple[Any, Any]:
+        """The source and target class of the objects, that get mapped with a nested mapper"""
+        return self.source.type, self.target.type
+
+    def inlined_right_side(
+        self, variables: Variables, body: List[cg.Statement], constructor_call: str
+    ) -> Tuple[List[cg.Statement], str]:
+        """Inlines the code of the nested mapper, instead of calling its mapper method.
+
+        :param variables: the variables used by the code of the nested mapper
+        :param body: the statements of the nested mapper, that fill the dictionary ``variables.d``
+        :param constructor_call: the expression that creates the object of the nested mapper
+        :return: the statements that need to run before the assignment, and the right side of the assignment
+        """
+        statements: List[cg.Statement] = [cg.Assignment(name=variables.obj, rhs=self._source_var_name())]
+        if variables.extra is not None:
+            statements.append(cg.Assignment(name=variables.extra, rhs=self.extra_str()))
+        statements.extend(body)
+        return statements, constructor_call
 
     def extra_str(self, default: str = "{}") -> str:
-        return f'extra.get("{self.target.name}", {default})'
+        return f'{self.variables.extra}.get("{self.target.name}", {default})'
+
+    def _source_var_name(self) -> str:
+        return self.variables.source(self.source)
 
     def _get_map_func(self, name: str, target_cls: Any, extra_str: str) -> str:
+        if self.variables.extra is None:
+            return f"{name}.{get_map_without_extra_func_name(target_cls)}()"
         func_name = get_map_to_func_name(target_cls)
         return f"{name}.{func_name}({extra_str})"
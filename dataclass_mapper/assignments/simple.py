@@ -1,6 +1,5 @@
 from ..utils import is_union_subtype
 from .assignment import Assignment
-from .utils import get_var_name
 
 
 class SimpleAssignment(Assignment):
@@ -8,4 +7,4 @@ class SimpleAssignment(Assignment):
         return is_union_subtype(self.source.type, self.target.type)
 
     def right_side(self) -> str:
-        return get_var_name(self.source)
+        return self.variables.source(self.source)
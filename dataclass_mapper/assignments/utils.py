@@ -1,10 +1,60 @@
-from typing import Any
+from dataclasses import dataclass, replace
+from typing import Any, FrozenSet, Optional
 
 from ..implementations.base import FieldMeta
+from ..utils import get_class_identifier
 
 
-def get_var_name(fieldmeta: FieldMeta) -> str:
-    return f"self.{fieldmeta.name}"
+@dataclass(frozen=True)
+class Variables:
+    """Names of the variables in the generated code of one mapping.
+    Nested mappings, whose code gets inlined into the code of the parent mapping, use numbered variables.
+    If ``extra`` is ``None``, the code is generated for mapping without any ``extra`` dictionary.
+    If ``columns`` is ``True``, there is no source object, the values of the source fields are read from the
+    local variables of the current row instead (e.g. ``_row_x`` instead of ``self.x``).
+    The source fields in ``loaded`` are read once into local variables (e.g. ``_source_x = self.x``), and the code
+    uses the local variables instead of the attributes.
+    """
+
+    obj: str = "self"
+    d: str = "d"
+    extra: Optional[str] = "extra"
+    suffix: str = ""
+    columns: bool = False
+    loaded: FrozenSet[str] = frozenset()
+
+    def nested(self, number: int) -> "Variables":
+        """Variables for the inlined code of a nested mapping"""
+        extra = None if self.extra is None else f"_extra{number}"
+        return Variables(obj=f"_obj{number}", d=f"_d{number}", extra=extra, suffix=str(number))
+
+    def without_extra(self) -> "Variables":
+        """Variables for code that doesn't use any ``extra`` dictionary"""
+        return replace(self, extra=None)
+
+    def source(self, field: FieldMeta) -> str:
+        """Expression for the value of a source field"""
+        if self.columns:
+            return f"_row{self.suffix}_{field.name}"
+        if field.name in self.loaded:
+            return f"_source{self.suffix}_{field.name}"
+        return get_var_name(field, self.obj)
+
+    def load(self, field_name: str) -> "Variables":
+        """Variables, that read the source field from a local variable instead of the attribute"""
+        return replace(self, loaded=self.loaded | {field_name})
+
+    def local(self, field_name: str) -> str:
+        """Name for the local variable, that holds the value of a target field"""
+        return f"_value{self.suffix}_{field_name}"
+
+    def temporary(self, name: str) -> str:
+        """Name for a helper variable, that doesn't collide with the variables of other mappings"""
+        return f"_{name}{self.suffix}"
+
+
+def get_var_name(fieldmeta: FieldMeta, obj: str = "self") -> str:
+    return f"{obj}.{fieldmeta.name}"
 
 
 def is_mappable_to(SourceCls: Any, TargetCls: Any) -> bool:
@@ -16,8 +66,16 @@ def is_mappable_to(SourceCls: Any, TargetCls: Any) -> bool:
 
 
 def get_map_to_func_name(cls: Any) -> str:
-    try:
-        identifier = f"{cls.__name__}_{id(cls)}"
-        return f"_map_to_{identifier}"
-    except AttributeError:
-        raise TypeError("Bad Type")
+    return f"_map_to_{get_class_identifier(cls)}"
+
+
+def get_map_many_func_name(cls: Any) -> str:
+    return f"_map_many_to_{get_class_identifier(cls)}"
+
+
+def get_map_without_extra_func_name(cls: Any) -> str:
+    return f"_map_without_extra_to_{get_class_identifier(cls)}"
+
+
+def get_map_many_without_extra_func_name(cls: Any) -> str:
+    return f"_map_many_without_extra_to_{get_class_identifier(cls)}"
@@ -0,0 +1,203 @@
+"""Persistent cache for the compiled mapper functions, similar to Python's ``__pycache__``.
+
+The cache is disabled by default.
+It can be enabled with the environment variable ``DATACLASS_MAPPER_CACHE_DIR``, or with ``set_cache_dir``.
+
+Additionally mapper functions can be precompiled ahead of time into a Python module
+(see ``python -m dataclass_mapper.compile``), which registers them with ``register_precompiled``.
+"""
+import marshal
+import os
+import warnings
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from importlib.util import MAGIC_NUMBER
+from inspect import signature
+from pathlib import Path
+from types import CodeType, FunctionType
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .assignments.utils import is_mappable_to
+from .implementations.base import ClassMeta
+from .mapping_method import StringFieldMapping
+from .registry import CompiledMapper, MapperFunctions, nested_compiled_mappers
+from .utils import get_class_identifier, type_atoms
+
+_cache_dir: Optional[Path] = (
+    Path(os.environ["DATACLASS_MAPPER_CACHE_DIR"]) if os.environ.get("DATACLASS_MAPPER_CACHE_DIR") else None
+)
+_generator_version: Optional[Tuple] = None
+# precompiled mapper functions (see `MapperFunctions`) for each fingerprint
+_precompiled: Dict[str, Tuple[Callable, ...]] = {}
+
+
+def set_cache_dir(path: Union[str, "os.PathLike[str]", None]) -> None:
+    """Enables the persistent cache for the generated mapper code in the given directory.
+    Mappers that are compiled afterwards, will load their code from that directory, instead of generating it.
+    ``None`` disables the cache.
+    """
+    global _cache_dir
+    _cache_dir = Path(path) if path is not None else None
+
+
+def get_cache_dir() -> Optional[Path]:
+    return _cache_dir
+
+
+def get_library_version() -> str:
+    try:
+        return version("dataclass-mapper")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def get_generator_version() -> Tuple:
+    """Identifies the exact state of the library files, so that changes in the code generator invalidate the cache"""
+    global _generator_version
+    if _generator_version is None:
+        package_dir = Path(__file__).parent
+        _generator_version = tuple(
+            (str(path.relative_to(package_dir)), path.stat().st_mtime_ns, path.stat().st_size)
+            for path in sorted(package_dir.rglob("*.py"))
+        )
+    return _generator_version
+
+
+def _describe_type(type_: Any) -> Tuple:
+    identifiers = []
+    for atom in type_atoms(type_):
+        try:
+            identifiers.append(get_class_identifier(atom))
+        except TypeError:
+            identifiers.append(repr(atom))
+    return (repr(type_), tuple(identifiers))
+
+
+def _describe_class(cls: Any, meta: ClassMeta) -> Tuple:
+    attributes = sorted((key, repr(value)) for key, value in vars(meta).items() if key != "fields")
+    fields = tuple(
+        (field.name, _describe_type(field.type), field.allow_none, field.required, field.alias)
+        for field in meta.fields.values()
+    )
+    return (type(meta).__qualname__, get_class_identifier(cls), tuple(attributes), fields)
+
+
+def _describe_nested_mappings(source_cls_meta: ClassMeta, target_cls_meta: ClassMeta) -> Tuple:
+    """The generated code also depends on which mappings exist between the types of the fields"""
+    source_types = {atom for field in source_cls_meta.fields.values() for atom in type_atoms(field.type)}
+    target_types = {atom for field in target_cls_meta.fields.values() for atom in type_atoms(field.type)}
+    return tuple(
+        sorted(
+            (repr(source_type), repr(target_type))
+            for source_type in source_types
+            for target_type in target_types
+            if is_mappable_to(source_type, target_type)
+        )
+    )
+
+
+def _describe_mapping(mapping: StringFieldMapping) -> Tuple:
+    descriptions = []
+    for target_field_name, origin in sorted(mapping.items()):
+        if callable(origin):
+            descriptions.append((target_field_name, f"function with {len(signature(origin).parameters)} parameters"))
+        else:
+            descriptions.append((target_field_name, repr(origin)))
+    return tuple(descriptions)
+
+
+def _describe_inlined_mappers(source_cls_meta: ClassMeta, target_cls_meta: ClassMeta) -> Tuple:
+    """The code of inlined nested mappers is part of the generated code"""
+
+    def describe(compiled_mapper: CompiledMapper) -> Tuple:
+        return (
+            _describe_class(compiled_mapper.source_cls, compiled_mapper.source_cls_meta),
+            _describe_class(compiled_mapper.target_cls, compiled_mapper.target_cls_meta),
+            _describe_mapping(compiled_mapper.mapping),
+        )
+
+    return tuple(sorted((describe(m) for m in nested_compiled_mappers(source_cls_meta, target_cls_meta)), key=repr))
+
+
+def fingerprint(
+    source_cls: Any,
+    target_cls: Any,
+    source_cls_meta: ClassMeta,
+    target_cls_meta: ClassMeta,
+    mapping: StringFieldMapping,
+    inline: bool = False,
+) -> str:
+    """Structural fingerprint of a mapping, that determines the generated code"""
+    description: Tuple = (
+        _describe_class(source_cls, source_cls_meta),
+        _describe_class(target_cls, target_cls_meta),
+        _describe_nested_mappings(source_cls_meta, target_cls_meta),
+        _describe_mapping(mapping),
+    )
+    if inline:
+        description += (_describe_inlined_mappers(source_cls_meta, target_cls_meta),)
+    return sha256(repr(description).encode()).hexdigest()
+
+
+def _cache_file(key: str) -> Path:
+    assert _cache_dir is not None
+    versioned_key = sha256(repr((get_generator_version(), key)).encode()).hexdigest()
+    return _cache_dir / f"{versioned_key}.bin"
+
+
+def load(key: str) -> Optional[CodeType]:
+    """Loads the code object for the fingerprint from the cache, or returns ``None`` if it's not cached"""
+    try:
+        data = _cache_file(key).read_bytes()
+    except OSError:
+        return None
+    if not data.startswith(MAGIC_NUMBER):
+        return None
+    try:
+        code = marshal.loads(data[len(MAGIC_NUMBER) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return code if isinstance(code, CodeType) else None
+
+
+def store(key: str, code: CodeType) -> None:
+    """Stores the code object for the fingerprint in the cache, errors are ignored like for ``__pycache__``"""
+    cache_file = _cache_file(key)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(MAGIC_NUMBER + marshal.dumps(code))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def register_precompiled(mappers: Dict[str, Tuple[Callable, ...]], library_version: str) -> None:
+    """Registers precompiled mapper functions, which will be used instead of generating the code.
+    Needs to be called before the mappers are defined.
+
+    :param mappers: the functions ``convert``, ``convert_many``, ``convert_without_extra`` and
+        ``convert_many_without_extra`` for the fingerprint of each mapper
+    :param library_version: the version of ``dataclass-mapper`` that generated the functions
+    """
+    if library_version != get_library_version():
+        warnings.warn(
+            f"The precompiled mappers were generated with dataclass-mapper {library_version}, "
+            f"but version {get_library_version()} is installed. They will be ignored.",
+            RuntimeWarning,
+        )
+        return
+    _precompiled.update(mappers)
+
+
+def has_precompiled() -> bool:
+    return bool(_precompiled)
+
+
+def get_precompiled(key: str, globals: Dict[str, Any]) -> Optional[MapperFunctions]:
+    """Returns the precompiled mapper functions for the fingerprint, using the given globals"""
+    if key not in _precompiled:
+        return None
+    return MapperFunctions(
+        *(FunctionType(function.__code__, globals, function.__name__) for function in _precompiled[key])
+    )
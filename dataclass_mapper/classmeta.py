@@ -1,15 +1,72 @@
 from enum import Enum
-from typing import Any
+from typing import Any, Dict, ForwardRef, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 from .implementations import class_meta_types
 from .implementations.base import ClassMeta
 from .namespace import Namespace
+from .utils import type_atoms
+
+# namespace for classes without forward references, their meta infos don't depend on the namespace
+_NO_NAMESPACE: Dict[str, Any] = {}
+
+# the analyzed classes (a class can take part in lots of mappings), by the id of the globals that resolved the
+# forward references (see `_cache_namespace`), together with these globals
+_class_metas: "WeakKeyDictionary[Any, Dict[int, Tuple[Dict[str, Any], ClassMeta]]]" = WeakKeyDictionary()
+
+
+def _has_forward_references(cls: Any) -> bool:
+    """If the annotations of the class (or of its base classes) contain strings or forward references, that need
+    a namespace to be resolved"""
+    return any(
+        isinstance(atom, (str, ForwardRef))
+        for base in getattr(cls, "__mro__", (cls,))
+        for annotation in base.__dict__.get("__annotations__", {}).values()
+        for atom in type_atoms(annotation)
+    )
+
+
+def _is_resolved(class_meta: ClassMeta) -> bool:
+    """If all forward references of the fields are resolved.
+    E.g. Pydantic models can be analyzed before the forward references are defined, and resolve them later with
+    ``model_rebuild``, so these meta infos must not be cached."""
+    return not any(
+        isinstance(atom, (str, ForwardRef)) for field in class_meta.fields.values() for atom in type_atoms(field.type)
+    )
+
+
+def _cache_namespace(cls: Any, namespace: Namespace) -> Optional[Dict[str, Any]]:
+    """The globals for which the meta infos of the class are cached (an empty dict if the namespace doesn't matter),
+    or None if they can't be cached.
+
+    Without forward references the namespace doesn't matter.
+    Forward references can only be cached for mappings defined in the global scope of a module (the module's
+    globals stay identical, while the locals of a function are different for every call).
+    """
+    if not _has_forward_references(cls):
+        return _NO_NAMESPACE
+    if namespace.locals is namespace.globals or not namespace.locals:
+        return namespace.globals
+    return None
 
 
 def get_class_meta(cls: Any, namespace: Namespace) -> ClassMeta:
+    """Analyzes the class, the result is cached per class.
+    The returned meta infos are shared, and must not be modified (create a copy instead).
+    """
+    cache_namespace = _cache_namespace(cls, namespace)
+    if cache_namespace is not None:
+        cached_namespace, class_meta = _class_metas.get(cls, {}).get(id(cache_namespace), (None, None))
+        if class_meta is not None and cached_namespace is cache_namespace:
+            return class_meta
+
     for class_meta_type in class_meta_types:
         if class_meta_type.applies(cls):
-            return class_meta_type.from_clazz(cls, namespace=namespace)
+            class_meta = class_meta_type.from_clazz(cls, namespace=namespace)
+            if cache_namespace is not None and _is_resolved(class_meta):
+                # only stored after the forward references got resolved successfully
+                _class_metas.setdefault(cls, {})[id(cache_namespace)] = (cache_namespace, class_meta)
+            return class_meta
 
     if issubclass(cls, Enum):
         raise ValueError("`mapper` does not support enum classes, use `enum_mapper` instead")
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Optional, Union
+from dataclasses import dataclass, field
+from keyword import iskeyword
+from typing import Dict, List, Optional, Union
 
 
 class Expression(ABC):
@@ -18,6 +19,29 @@ class DictLookup(Expression):
         return f'{self.dict_name}["{self.key}"]'
 
 
+@dataclass
+class Call(Expression):
+    """Function call with keyword arguments.
+    Names that can't be used as keyword (e.g. aliases like ``first-name``) are passed with ``**{...}``.
+    """
+
+    function: Union[str, Expression]
+    keywords: Dict[str, Union[str, Expression]] = field(default_factory=dict)
+    unpack: Optional[Union[str, Expression]] = None
+
+    def __str__(self) -> str:
+        arguments = [f"{name}={value}" for name, value in self.keywords.items() if self.is_keyword(name)]
+        if others := [f'"{name}": {value}' for name, value in self.keywords.items() if not self.is_keyword(name)]:
+            arguments.append(f"**{{{', '.join(others)}}}")
+        if self.unpack is not None:
+            arguments.append(f"**{self.unpack}")
+        return f"{self.function}({', '.join(arguments)})"
+
+    @staticmethod
+    def is_keyword(name: str) -> bool:
+        return name.isidentifier() and not iskeyword(name)
+
+
 class Statement(ABC):
     @abstractmethod
     def to_string(self, indent: int) -> str:
@@ -68,6 +92,24 @@ class IfElse(Statement):
         return "\n".join(lines)
 
 
+@dataclass
+class For(Statement):
+    variables: str
+    iterable: Union[str, Expression]
+    body: Statement
+
+    def to_string(self, indent: int) -> str:
+        return f"{' '*indent}for {self.variables} in {self.iterable}:\n{self.body.to_string(indent + 4)}"
+
+
+@dataclass
+class ExpressionStatement(Statement):
+    expression: Union[str, Expression]
+
+    def to_string(self, indent: int) -> str:
+        return f"{' '*indent}{self.expression}"
+
+
 @dataclass
 class Return(Statement):
     rhs: Union[str, Expression]
@@ -84,4 +126,4 @@ class Function(Statement):
     body: Block
 
     def to_string(self, indent: int) -> str:
-        return f'{" "*indent}def convert({self.args}) -> "{self.return_type}":\n{self.body.to_string(indent+4)}'
+        return f'{" "*indent}def {self.name}({self.args}) -> "{self.return_type}":\n{self.body.to_string(indent+4)}'
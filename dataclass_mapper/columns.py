@@ -0,0 +1,201 @@
+"""Mapping between batches of objects and columns, i.e. one array per field, e.g. for analytics with NumPy or pandas.
+
+NumPy is an optional dependency, it's only imported when the columns get converted into arrays (or when a
+``memoryview`` of records needs to be split into columns).
+"""
+import sys
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Type, TypeVar, cast
+
+from .assignments import Variables, get_map_many_without_extra_func_name
+from .classmeta import get_class_meta
+from .implementations.base import ClassMeta, FieldMeta
+from .mapper import (
+    _find_compiled_mapper,
+    _function_names,
+    _make_inliner,
+    _make_source_code,
+    _mapper_globals,
+    _register_source,
+)
+from .namespace import Namespace
+from .optimizer import optimize_function
+from .registry import CompiledMapper
+from .utils import get_class_identifier
+
+# NumPy dtypes of the field types, that can be stored without boxing every value (fields of all other types, or
+# optional fields, are stored in arrays of Python objects)
+_DTYPES = {bool: "bool", int: "int64", float: "float64", complex: "complex128"}
+
+# maps a batch of objects to one list per target field
+ColumnsFunction = Callable[[Iterable[Any]], Dict[str, List[Any]]]
+# maps a batch of rows, given as one sequence per source field, to target objects
+FromColumnsFunction = Callable[[List[Sequence[Any]]], List[Any]]
+
+T = TypeVar("T")
+
+
+def get_map_columns_func_name(cls: Any) -> str:
+    return f"_map_columns_to_{get_class_identifier(cls)}"
+
+
+def get_map_from_columns_func_name(cls: Any) -> str:
+    return f"_map_from_columns_to_{get_class_identifier(cls)}"
+
+
+def _numpy(function_name: str) -> Any:
+    try:
+        return __import__("numpy")
+    except ImportError as e:
+        raise ImportError(f"`{function_name}` requires NumPy, install it with `pip install numpy`") from e
+
+
+def _compile_function(compiled_mapper: CompiledMapper, kind: str, name: str, source: str) -> Callable:
+    """Compiles the generated function (registered in ``linecache`` like the other generated code)"""
+    source_id = get_class_identifier(compiled_mapper.source_cls)
+    target_id = get_class_identifier(compiled_mapper.target_cls)
+    filename = f"<dataclass-mapper {kind} {source_id} to {target_id}>"
+    _register_source(compiled_mapper.source_cls, filename, source)
+    d: Dict[str, Any] = {}
+    exec(compile(source, filename, "exec"), _mapper_globals(compiled_mapper), d)
+    return d[name]  # type: ignore[no-any-return]
+
+
+def _make_columns_mapper(compiled_mapper: CompiledMapper) -> ColumnsFunction:
+    """Generates the function ``map_columns_<Source>_to_<Target>``, that collects the values of the target fields
+    directly in lists without creating the target objects.
+    If that's not possible (e.g. if some fields only get set conditionally, and otherwise use their default value, or
+    if the construction can modify the values, like ``__post_init__`` or validators), the target objects are created
+    with the normal mapper, and the columns are read from them.
+    """
+    source_cls, target_cls = compiled_mapper.source_cls, compiled_mapper.target_cls
+    name = _function_names(compiled_mapper)["convert"].replace("map_", "map_columns_", 1)
+    inliner = _make_inliner(compiled_mapper) if compiled_mapper.inline else None
+    source_code = _make_source_code(compiled_mapper, variables=Variables(extra=None), inliner=inliner)
+
+    if (function := source_code.columns_function(name)) is not None:
+        return _compile_function(compiled_mapper, "columns", name, optimize_function(function).to_string(0))
+
+    convert_many = getattr(source_cls, get_map_many_without_extra_func_name(target_cls))
+    field_names = list(compiled_mapper.target_cls_meta.fields)
+
+    def map_columns_from_objects(objs: Iterable[Any]) -> Dict[str, List[Any]]:
+        targets = convert_many(objs)
+        return {field_name: [getattr(target, field_name) for target in targets] for field_name in field_names}
+
+    return map_columns_from_objects
+
+
+def _get_columns_function(compiled_mapper: CompiledMapper) -> ColumnsFunction:
+    """The columns function of the mapper (generated when it is used the first time)"""
+    func_name = get_map_columns_func_name(compiled_mapper.target_cls)
+    # looked up in the class of the compiled mapper, a subclass with its own mapper needs its own function
+    function = compiled_mapper.source_cls.__dict__.get(func_name)
+    if function is None:
+        function = staticmethod(_make_columns_mapper(compiled_mapper))
+        setattr(compiled_mapper.source_cls, func_name, function)
+    return function.__func__  # type: ignore[no-any-return]
+
+
+def _to_array(numpy: Any, values: List[Any], field: FieldMeta) -> Any:
+    dtype = None if field.allow_none else _DTYPES.get(field.type)
+    if dtype is not None:
+        return numpy.array(values, dtype=dtype)
+    # `numpy.array` would create multi-dimensional arrays from values that are sequences themselves
+    return numpy.fromiter(values, dtype=object, count=len(values))
+
+
+def map_to_columns(objs: Iterable[Any], TargetCls: Any) -> Dict[str, Any]:
+    """Maps all the given objects into the columns of ``TargetCls``: a dictionary with one NumPy array per field of
+    ``TargetCls``, instead of a list of objects.
+    The values are the same as with ``map_many``. The target objects are only created if the values depend on the
+    construction (e.g. default values of conditional fields, ``__post_init__``, validators).
+    Fields of type ``bool``, ``int``, ``float`` and ``complex`` get arrays with the corresponding NumPy dtype,
+    all other fields (and optional fields) get arrays of Python objects.
+    All objects need to be of the same class (or at least use the same mapping).
+    Requires NumPy.
+
+    :param objs: the source objects that you want to map
+    :param TargetCls: the (target) class, whose fields are the columns
+    :return: a dictionary with an array for each field of ``TargetCls``
+    """
+    numpy = _numpy("map_to_columns")
+    iterator = iter(objs)
+    for first in iterator:
+        break
+    else:
+        target_cls_meta = _target_cls_meta(TargetCls)
+        return {name: _to_array(numpy, [], field) for name, field in target_cls_meta.fields.items()}
+
+    compiled_mapper = _find_compiled_mapper(type(first), TargetCls)
+    columns = _get_columns_function(compiled_mapper)(chain((first,), iterator))
+    fields = compiled_mapper.target_cls_meta.fields
+    return {name: _to_array(numpy, values, fields[name]) for name, values in columns.items()}
+
+
+def _target_cls_meta(TargetCls: Any) -> ClassMeta:
+    """The fields of the target class, for empty batches (without any source class)"""
+    module = sys.modules[TargetCls.__module__]
+    return get_class_meta(TargetCls, Namespace(locals=module.__dict__, globals=module.__dict__))
+
+
+def _make_from_columns_mapper(compiled_mapper: CompiledMapper) -> FromColumnsFunction:
+    """Generates the function ``map_from_columns_<Source>_to_<Target>``, that iterates over the rows of the columns,
+    and reads the values of the source fields from the columns instead of from source objects"""
+    name = _function_names(compiled_mapper)["convert"].replace("map_", "map_from_columns_", 1)
+    inliner = _make_inliner(compiled_mapper) if compiled_mapper.inline else None
+    source_code = _make_source_code(compiled_mapper, variables=Variables(extra=None, columns=True), inliner=inliner)
+    return _compile_function(
+        compiled_mapper, "from columns", name, optimize_function(source_code.from_columns_function(name)).to_string(0)
+    )
+
+
+def _get_from_columns_function(compiled_mapper: CompiledMapper) -> FromColumnsFunction:
+    """The from-columns function of the mapper (generated when it is used the first time)"""
+    func_name = get_map_from_columns_func_name(compiled_mapper.target_cls)
+    function = compiled_mapper.source_cls.__dict__.get(func_name)
+    if function is None:
+        function = staticmethod(_make_from_columns_mapper(compiled_mapper))
+        setattr(compiled_mapper.source_cls, func_name, function)
+    return function.__func__  # type: ignore[no-any-return]
+
+
+def _source_columns(columns: Any, SourceCls: Any, field_names: Sequence[str]) -> List[Sequence[Any]]:
+    """The columns of the source fields, in the order of the fields (all columns need to have the same length)"""
+    if isinstance(columns, memoryview):
+        # a buffer of records (e.g. of a structured array), NumPy splits it into the columns
+        columns = _numpy("map_from_columns").asarray(columns)
+    result: List[Sequence[Any]] = []
+    for field_name in field_names:
+        try:
+            column = columns[field_name]
+        except (KeyError, ValueError, IndexError) as e:
+            raise KeyError(f"The columns don't contain the field '{field_name}' of '{SourceCls.__name__}'") from e
+        # arrays are converted into lists of Python objects (e.g. `int` instead of `numpy.int64`)
+        result.append(column.tolist() if hasattr(column, "tolist") else column)
+        # the generated loop zips the columns, which would silently drop the surplus values
+        if len(result[-1]) != len(result[0]):
+            raise ValueError(
+                f"The column '{field_name}' has {len(result[-1])} values, "
+                f"but the column '{field_names[0]}' has {len(result[0])} values"
+            )
+    return result
+
+
+def map_from_columns(columns: Any, SourceCls: Any, TargetCls: Type[T]) -> List[T]:
+    """Maps rows, that are stored in columns, to objects of type ``TargetCls``, using the mapping between
+    ``SourceCls`` and ``TargetCls``.
+    The fields of ``SourceCls`` describe the columns, but no objects of ``SourceCls`` are created: the generated
+    loop iterates over the columns and reads the values of the source fields directly from them.
+    Custom conversion functions with a parameter (the source object) are therefore not supported.
+
+    :param columns: one column per field of ``SourceCls``, either a NumPy structured array, a dictionary of
+        arrays/sequences (all with the same length, otherwise a ``ValueError`` is raised), or a ``memoryview`` of
+        records (requires NumPy)
+    :param SourceCls: the (source) class, that describes the fields of the rows
+    :param TargetCls: the (target) class that you want to map to.
+    :return: a list with the mapped objects
+    """
+    compiled_mapper = _find_compiled_mapper(SourceCls, TargetCls)
+    source_columns = _source_columns(columns, SourceCls, list(compiled_mapper.source_cls_meta.fields))
+    return cast(List[T], _get_from_columns_function(compiled_mapper)(source_columns))
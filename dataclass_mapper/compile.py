@@ -0,0 +1,101 @@
+"""Ahead-of-time compilation of the mappers into a static Python module.
+
+Usage::
+
+    python -m dataclass_mapper.compile pkg.models pkg.other_models --output pkg/precompiled_mappers.py
+
+The given modules are imported, and the code of every mapper between classes of these modules is written into one
+Python module.
+Calling its ``load()`` function before the modules with the mappers are imported, makes the mappers use the
+precompiled functions instead of generating and ``exec``-ing their code at runtime.
+"""
+import argparse
+import sys
+from importlib import import_module
+from pathlib import Path
+from textwrap import indent
+from typing import List, Optional, Sequence
+
+from . import cache
+from .mapper import _function_names, _make_mapper, compile_all
+from .registry import MapperFunctions, all_compiled_mappers
+from .utils import get_class_identifier
+
+HEADER = '''# ruff: noqa: F821
+# mypy: ignore-errors
+"""Precompiled mappers, generated by ``python -m dataclass_mapper.compile {modules}``.
+
+Don't edit this file manually, regenerate it after changing the mappings.
+Call ``load()`` before the modules with the mappings are imported.
+"""
+from dataclass_mapper.cache import register_precompiled
+
+LIBRARY_VERSION = "{library_version}"
+'''
+
+FOOTER = """
+def load() -> None:
+    register_precompiled(MAPPERS, LIBRARY_VERSION)
+"""
+
+
+def _qualified_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def generate_module(modules: Sequence[str]) -> str:
+    """Imports the modules and generates the source code of a module with all the defined mappers"""
+    for module in modules:
+        import_module(module)
+    compile_all()
+
+    compiled_mappers = sorted(
+        (m for m in all_compiled_mappers() if {m.source_cls.__module__, m.target_cls.__module__} & set(modules)),
+        key=lambda m: (get_class_identifier(m.source_cls), get_class_identifier(m.target_cls)),
+    )
+
+    parts: List[str] = [HEADER.format(modules=" ".join(modules), library_version=cache.get_library_version())]
+    entries: List[str] = []
+    for idx, compiled_mapper in enumerate(compiled_mappers):
+        key = cache.fingerprint(
+            compiled_mapper.source_cls,
+            compiled_mapper.target_cls,
+            compiled_mapper.source_cls_meta,
+            compiled_mapper.target_cls_meta,
+            compiled_mapper.mapping,
+            inline=compiled_mapper.inline,
+        )
+        code = _make_mapper(compiled_mapper)
+        names = _function_names(compiled_mapper)
+        parts.append(
+            f"\n# {_qualified_name(compiled_mapper.source_cls)} -> {_qualified_name(compiled_mapper.target_cls)}\n"
+            f"def _mapper_{idx}():\n"
+            f"{indent(code, '    ')}\n"
+            "\n"
+            f"    return {', '.join(names[field] for field in MapperFunctions._fields)}\n"
+        )
+        entries.append(f'    "{key}": _mapper_{idx}(),\n')
+
+    parts.append("\nMAPPERS = {\n" + "".join(entries) + "}\n")
+    parts.append(FOOTER)
+    return "\n".join(parts)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m dataclass_mapper.compile",
+        description="Generates a Python module with the precompiled code of all mappers in the given modules.",
+    )
+    parser.add_argument("modules", nargs="+", help="modules that define the mappers, e.g. pkg.models")
+    parser.add_argument("-o", "--output", help="path of the generated module, if not given it's printed to stdout")
+    args = parser.parse_args(argv)
+
+    source = generate_module(args.modules)
+    if args.output:
+        Path(args.output).write_text(source)
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Callable, Dict, Union, cast
+from typing import Any, Callable, Dict, Iterable, List, Union, cast
 
 # mapping between source members and target members
 EnumMapping = Dict[Union[str, Enum], Union[str, Enum]]
@@ -55,3 +55,30 @@ def make_enum_mapper(
     convert.d = full_mapping  # type: ignore
 
     return convert
+
+
+def make_enum_batch_mapper(convert: Callable) -> Callable:
+    d = convert.d  # type: ignore[attr-defined]
+
+    def convert_many(objs: Iterable[Any], extras: Iterable[Dict]) -> List[Any]:
+        return [d[obj] for obj in objs]
+
+    return convert_many
+
+
+def make_enum_mapper_without_extra(convert: Callable) -> Callable:
+    d = convert.d  # type: ignore[attr-defined]
+
+    def convert_without_extra(self: Any) -> Any:
+        return d[self]
+
+    return convert_without_extra
+
+
+def make_enum_batch_mapper_without_extra(convert: Callable) -> Callable:
+    d = convert.d  # type: ignore[attr-defined]
+
+    def convert_many_without_extra(objs: Iterable[Any]) -> List[Any]:
+        return [d[obj] for obj in objs]
+
+    return convert_many_without_extra
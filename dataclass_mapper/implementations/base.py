@@ -1,8 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Dict, Optional, cast, get_args, get_origin
-from uuid import uuid4
+from typing import Any, Collection, Dict, List, Optional, Tuple, Union, cast, get_args, get_origin
 
 import dataclass_mapper.code_generator as cg
 from dataclass_mapper.namespace import Namespace
@@ -78,11 +77,43 @@ class ClassMeta(ABC):
     def __init__(self, name: str, fields: Dict[str, FieldMeta], alias_name: Optional[str] = None) -> None:
         self.name = name
         self.fields = fields
-        self.alias_name = alias_name or f"_{uuid4().hex}"
-
-    def return_statement(self) -> cg.Return:
-        """The code for creating the object and returning it"""
-        return cg.Return(f"{self.alias_name}(**d)")
+        self.alias_name = alias_name or f"_{name}"
+
+    def constructor_call(self, arguments: Dict[str, str], d: Optional[str] = None) -> cg.Expression:
+        """The code for creating the object from the keyword arguments, and optionally from the dictionary ``d``
+        (which contains the fields that are only set under some conditions)
+        """
+        return cg.Call(self.alias_name, keywords=dict(arguments), unpack=d)
+
+    def construct(
+        self,
+        arguments: Dict[str, str],
+        d: Optional[str] = None,
+        variable: str = "obj",
+        d_keys: Collection[str] = (),
+    ) -> Tuple[List[cg.Statement], Union[str, cg.Expression]]:
+        """The code for creating the object: the statements that need to run first, and the expression of the object.
+        By default this is just the constructor call.
+
+        :param variable: name of a variable, that can be used for creating the object
+        :param d_keys: the keys that ``d`` can contain
+        """
+        return [], self.constructor_call(arguments, d)
+
+    def bypassing_init(self) -> "ClassMeta":
+        """Returns a copy, that creates the objects without calling the constructor"""
+        raise ValueError(f"'{self.name}' is not a dataclass, its objects cannot be created without calling __init__")
+
+    def keeps_argument_values(self) -> bool:
+        """If the created objects contain the values of the constructor arguments unchanged, i.e. nothing that runs
+        during the construction (like ``__post_init__`` or validators) can modify them.
+        Then the values of the fields are known without creating the objects."""
+        return False
+
+    def trusting(self) -> "ClassMeta":
+        """Returns a copy, that creates the objects without validation.
+        Classes without validation return themselves."""
+        return self
 
     @abstractmethod
     def get_assignment_name(self, field: FieldMeta) -> str:
@@ -98,9 +129,24 @@ class ClassMeta(ABC):
     def from_clazz(cls, clazz: Any, namespace: Namespace) -> "ClassMeta":
         """Parse the given class"""
 
+    @classmethod
+    def fields_set(cls, obj: str = "self") -> str:
+        """The code for the set of fields, that were explicitly set in the source object (used by ``post_process``)"""
+        raise NotImplementedError(f"{cls.__name__} doesn't check the set fields")
+
     @classmethod
     def post_process(
-        cls, code: cg.Statement, source_cls: Any, target_field: FieldMeta, source_field: FieldMeta
+        cls,
+        code: cg.Statement,
+        source_cls: Any,
+        target_field: FieldMeta,
+        source_field: FieldMeta,
+        obj: str = "self",
+        fields_set: Optional[str] = None,
     ) -> cg.Statement:
-        """Modifies the generated code for one field mapping if needed"""
+        """Modifies the generated code for one field mapping if needed
+
+        :param fields_set: name of a variable, that holds the explicitly set fields of the source object
+            (see ``fields_set``), otherwise they are read from the source object
+        """
         return code
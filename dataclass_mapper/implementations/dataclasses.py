@@ -1,9 +1,13 @@
-from dataclasses import MISSING, fields, is_dataclass
+from copy import copy
+from dataclasses import MISSING, InitVar, fields, is_dataclass
 from dataclasses import Field as DataclassField
-from typing import Any, Dict, cast, get_type_hints
+from types import MemberDescriptorType
+from typing import Any, Collection, Dict, List, Optional, Tuple, Union, cast, get_type_hints
 
+import dataclass_mapper.code_generator as cg
+from dataclass_mapper.implementations.utils import LITERAL_FACTORIES, literal_code
 from dataclass_mapper.namespace import Namespace
-from dataclass_mapper.utils import is_optional, remove_NoneType
+from dataclass_mapper.utils import get_class_identifier, is_optional, remove_NoneType
 
 from .base import ClassMeta, DataclassType, FieldMeta
 
@@ -23,9 +27,81 @@ class DataclassesFieldMeta(FieldMeta):
 class DataclassClassMeta(ClassMeta):
     _type = DataclassType.DATACLASSES
 
+    def __init__(
+        self,
+        name: str,
+        fields: Dict[str, FieldMeta],
+        alias_name: Optional[str] = None,
+        defaults: Optional[Dict[str, str]] = None,
+        slot_fields: Tuple[str, ...] = (),
+        supports_bypass_init: bool = False,
+        generated_init: bool = True,
+        bypass_init: bool = False,
+    ) -> None:
+        """
+        :param defaults: code for the default value of each field that has a default value or factory
+        :param slot_fields: the fields that are stored in ``__slots__`` instead of ``__dict__``
+        :param supports_bypass_init: if the objects can be created without calling ``__init__``
+            (no ``__post_init__`` and no ``InitVar``)
+        :param generated_init: if ``__init__`` is the one generated by the ``dataclass`` decorator, a custom
+            ``__init__`` is always called
+        :param bypass_init: create the objects without calling ``__init__``
+        """
+        super().__init__(name=name, fields=fields, alias_name=alias_name)
+        self.defaults = defaults or {}
+        self.slot_fields = slot_fields
+        self.supports_bypass_init = supports_bypass_init
+        self.generated_init = generated_init
+        self.bypass_init = bypass_init
+
+    def keeps_argument_values(self) -> bool:
+        return self.supports_bypass_init and self.generated_init
+
     def get_assignment_name(self, field: FieldMeta) -> str:
         return field.name
 
+    def bypassing_init(self) -> "DataclassClassMeta":
+        if not self.supports_bypass_init:
+            raise ValueError(
+                f"Objects of '{self.name}' cannot be created without calling __init__, "
+                "as it has a __post_init__ method or InitVar fields"
+            )
+        if not self.generated_init:
+            # the objects are created with the regular constructor call
+            return self
+        meta = copy(self)
+        meta.bypass_init = True
+        return meta
+
+    def construct(
+        self,
+        arguments: Dict[str, str],
+        d: Optional[str] = None,
+        variable: str = "obj",
+        d_keys: Collection[str] = (),
+    ) -> Tuple[List[cg.Statement], Union[str, cg.Expression]]:
+        if not self.bypass_init:
+            return super().construct(arguments, d, variable, d_keys)
+
+        # create the object with `object.__new__` and fill the fields directly, like the generated `__init__` does
+        values: Dict[str, str] = {}
+        for name in self.fields:
+            if name in arguments:
+                values[name] = arguments[name]
+            elif name in self.defaults:
+                default = self.defaults[name]
+                values[name] = default if name not in d_keys else f'{d}["{name}"] if "{name}" in {d} else {default}'
+
+        statements: List[cg.Statement] = [cg.Assignment(name=variable, rhs=f"object.__new__({self.alias_name})")]
+        if dict_values := [f'"{name}": {value}' for name, value in values.items() if name not in self.slot_fields]:
+            statements.append(cg.ExpressionStatement(f"{variable}.__dict__.update({{{', '.join(dict_values)}}})"))
+        for name in self.slot_fields:
+            if name in values:
+                statements.append(
+                    cg.ExpressionStatement(f"{self.alias_name}.{name}.__set__({variable}, {values[name]})")
+                )
+        return statements, variable
+
     @staticmethod
     def _fields(clazz: Any, namespace: Namespace) -> Dict[str, FieldMeta]:
         real_types = get_type_hints(clazz, globalns=namespace.globals, localns=namespace.locals)
@@ -34,10 +110,56 @@ class DataclassClassMeta(ClassMeta):
             for field in fields(clazz)
         }
 
+    @staticmethod
+    def _default_code(clazz_alias: str, field: DataclassField) -> Optional[str]:
+        lookup = f'{clazz_alias}.__dataclass_fields__["{field.name}"]'
+        if field.default_factory is not MISSING:
+            return LITERAL_FACTORIES.get(cast(Any, field.default_factory), f"{lookup}.default_factory()")
+        if field.default is not MISSING:
+            return literal_code(field.default) or f"{lookup}.default"
+        return None
+
+    @staticmethod
+    def _supports_bypass_init(clazz: Any) -> bool:
+        has_init_var = any(
+            isinstance(field.type, InitVar) or field.type is InitVar or "InitVar" in str(field.type)
+            for field in clazz.__dataclass_fields__.values()
+        )
+        return not hasattr(clazz, "__post_init__") and not has_init_var
+
+    @staticmethod
+    def _has_generated_init(clazz: Any) -> bool:
+        """If ``__init__`` is the one generated by the ``dataclass`` decorator of the class itself, and not written by
+        hand (which the decorator keeps), inherited, or replaced afterwards"""
+        init = clazz.__dict__.get("__init__")
+        return (
+            bool(clazz.__dataclass_params__.init)
+            and getattr(init, "__qualname__", None) == f"{clazz.__qualname__}.__init__"
+            and getattr(getattr(init, "__code__", None), "co_filename", None) == "<string>"
+        )
+
     @staticmethod
     def applies(clz: Any) -> bool:
         return cast(bool, is_dataclass(clz))
 
     @classmethod
     def from_clazz(cls, clazz: Any, namespace: Namespace) -> "DataclassClassMeta":
-        return cls(name=cast(str, clazz.__name__), fields=cls._fields(clazz, namespace))
+        alias_name = f"_{get_class_identifier(clazz)}"
+        defaults = {
+            field.name: default
+            for field in fields(clazz)
+            if (default := cls._default_code(alias_name, field)) is not None
+        }
+        return cls(
+            name=cast(str, clazz.__name__),
+            alias_name=alias_name,
+            fields=cls._fields(clazz, namespace),
+            defaults=defaults,
+            slot_fields=tuple(
+                field.name
+                for field in fields(clazz)
+                if isinstance(getattr(clazz, field.name, None), MemberDescriptorType)
+            ),
+            supports_bypass_init=cls._supports_bypass_init(clazz),
+            generated_init=cls._has_generated_init(clazz),
+        )
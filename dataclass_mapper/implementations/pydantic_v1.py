@@ -1,8 +1,10 @@
-from typing import Any, Dict, Optional, Tuple, cast
+from copy import copy
+from typing import Any, Collection, Dict, List, Optional, Tuple, Union, cast
 
 import dataclass_mapper.code_generator as cg
-from dataclass_mapper.implementations.utils import parse_version
+from dataclass_mapper.implementations.utils import LITERAL_FACTORIES, fields_dict_code, literal_code, parse_version
 from dataclass_mapper.namespace import Namespace
+from dataclass_mapper.utils import get_class_identifier
 
 from .base import ClassMeta, DataclassType, FieldMeta
 
@@ -34,20 +36,67 @@ class PydanticV1ClassMeta(ClassMeta):
         use_construct: bool,
         allow_population_by_field_name: bool = False,
         alias_name: Optional[str] = None,
+        defaults: Optional[Dict[str, str]] = None,
+        direct_construct: bool = False,
+        private_attributes: bool = False,
     ) -> None:
+        """
+        :param use_construct: create the objects without validation (the model has no validators)
+        :param defaults: code for the default value of each field that is not required
+        :param direct_construct: create the objects without validation by filling their attributes directly,
+            like ``construct`` does, but with the set fields and the defaults known at code generation
+        :param private_attributes: if the model has private attributes, that need to be initialized
+        """
         super().__init__(name=name, fields=fields, alias_name=alias_name)
         self.use_construct = use_construct
         self.allow_population_by_field_name = allow_population_by_field_name
+        self.defaults = defaults or {}
+        self.direct_construct = direct_construct
+        self.private_attributes = private_attributes
 
     @staticmethod
     def has_validators(clazz: Any) -> bool:
         return bool(clazz.__validators__) or bool(clazz.__pre_root_validators__) or bool(clazz.__post_root_validators__)
 
-    def return_statement(self) -> cg.Return:
+    def constructor_call(self, arguments: Dict[str, str], d: Optional[str] = None) -> cg.Expression:
         if self.use_construct:
-            return cg.Return(f"{self.alias_name}.construct(**d)")
+            return cg.Call(f"{self.alias_name}.construct", keywords=dict(arguments), unpack=d)
         else:
-            return super().return_statement()
+            return super().constructor_call(arguments, d)
+
+    def construct(
+        self,
+        arguments: Dict[str, str],
+        d: Optional[str] = None,
+        variable: str = "obj",
+        d_keys: Collection[str] = (),
+    ) -> Tuple[List[cg.Statement], Union[str, cg.Expression]]:
+        if not (self.use_construct and self.direct_construct):
+            return super().construct(arguments, d, variable, d_keys)
+
+        # the same as `construct`, but the set fields and the defaults are already known
+        values, fields_set = f"{variable}_values", f"{variable}_fields_set"
+        set_fields = [f'"{name}"' for name in self.fields if name in arguments]
+        if d is not None:
+            set_fields.append(f"*{d}")
+        statements: List[cg.Statement] = [
+            cg.Assignment(name=variable, rhs=f"object.__new__({self.alias_name})"),
+            *fields_dict_code(values, self.fields, arguments, d, d_keys, self.defaults, defaults_last=False),
+            cg.Assignment(name=fields_set, rhs=f"{{{', '.join(set_fields)}}}" if set_fields else "set()"),
+            cg.ExpressionStatement(f'object.__setattr__({variable}, "__dict__", {values})'),
+            cg.ExpressionStatement(f'object.__setattr__({variable}, "__fields_set__", {fields_set})'),
+        ]
+        if self.private_attributes:
+            statements.append(cg.ExpressionStatement(f"{variable}._init_private_attributes()"))
+        return statements, variable
+
+    def keeps_argument_values(self) -> bool:
+        return self.use_construct
+
+    def trusting(self) -> "PydanticV1ClassMeta":
+        meta = copy(self)
+        meta.use_construct = True
+        return meta
 
     def get_assignment_name(self, field: FieldMeta) -> str:
         if self.use_construct or self.allow_population_by_field_name:
@@ -72,13 +121,35 @@ class PydanticV1ClassMeta(ClassMeta):
 
     @classmethod
     def from_clazz(cls, clazz: Any, namespace: Namespace) -> "PydanticV1ClassMeta":
+        alias_name = f"_{get_class_identifier(clazz)}"
         return cls(
             name=cast(str, clazz.__name__),
+            alias_name=alias_name,
             fields=cls._fields(clazz, namespace=namespace),
             use_construct=not cls.has_validators(clazz),
             allow_population_by_field_name=getattr(clazz.Config, "allow_population_by_field_name", False),
+            defaults={
+                name: cls._default_code(alias_name, name, field)
+                for name, field in clazz.__fields__.items()
+                if not field.required
+            },
+            direct_construct=True,
+            private_attributes=bool(clazz.__private_attributes__),
         )
 
+    @staticmethod
+    def _default_code(clazz_alias: str, name: str, field: Any) -> str:
+        """The code for the default value, like ``field.get_default()``"""
+        lookup = f'{clazz_alias}.__fields__["{name}"]'
+        if field.default_factory is not None:
+            return LITERAL_FACTORIES.get(field.default_factory, f"{lookup}.default_factory()")
+        if (literal := literal_code(field.default)) is not None:
+            return literal
+        if type(field.default) in LITERAL_FACTORIES and not field.default:
+            # a copy of an empty collection
+            return LITERAL_FACTORIES[type(field.default)]
+        return f"{lookup}.get_default()"
+
     @classmethod
     def only_if_set(cls, source_cls: Any, target_field: FieldMeta, source_field: FieldMeta) -> bool:
         # maintain Pydantic's unset property
@@ -89,10 +160,21 @@ class PydanticV1ClassMeta(ClassMeta):
             and source_cls._type == DataclassType.PYDANTIC
         )
 
+    @classmethod
+    def fields_set(cls, obj: str = "self") -> str:
+        return f"{obj}.__fields_set__"
+
     @classmethod
     def post_process(
-        cls, code: cg.Statement, source_cls: Any, target_field: FieldMeta, source_field: FieldMeta
+        cls,
+        code: cg.Statement,
+        source_cls: Any,
+        target_field: FieldMeta,
+        source_field: FieldMeta,
+        obj: str = "self",
+        fields_set: Optional[str] = None,
     ) -> cg.Statement:
         if cls.only_if_set(source_cls=source_cls, source_field=source_field, target_field=target_field):
-            code = cg.IfElse(condition=f"'{source_field.name}' in self.__fields_set__", if_block=code)
+            fields_set = fields_set or cls.fields_set(obj)
+            code = cg.IfElse(condition=f"'{source_field.name}' in {fields_set}", if_block=code)
         return code
@@ -1,9 +1,10 @@
-from typing import Any, Dict, Optional, Tuple, cast
+from copy import copy
+from typing import Any, Collection, Dict, List, Optional, Tuple, Union, cast
 
 import dataclass_mapper.code_generator as cg
-from dataclass_mapper.implementations.utils import parse_version
+from dataclass_mapper.implementations.utils import LITERAL_FACTORIES, fields_dict_code, literal_code, parse_version
 from dataclass_mapper.namespace import Namespace
-from dataclass_mapper.utils import is_optional, remove_NoneType
+from dataclass_mapper.utils import get_class_identifier, is_optional, remove_NoneType
 
 from .base import ClassMeta, DataclassType, FieldMeta
 
@@ -13,6 +14,15 @@ def pydantic_version() -> Tuple[int, int, int]:
     return parse_version(cast(str, pydantic.__version__))
 
 
+# the versions whose `model_construct` is reproduced by the direct construction, other versions use `model_construct`
+# (e.g. since 2.10 the default factories can take the validated data as argument)
+_DIRECT_CONSTRUCT_VERSIONS = ((2, 0, 0), (2, 10, 0))
+
+
+def _supports_direct_construct() -> bool:
+    return _DIRECT_CONSTRUCT_VERSIONS[0] <= pydantic_version() < _DIRECT_CONSTRUCT_VERSIONS[1]
+
+
 class PydanticV2FieldMeta(FieldMeta):
     @classmethod
     def from_pydantic(cls, field: Any, name: str) -> "PydanticV2FieldMeta":
@@ -35,10 +45,26 @@ class PydanticV2ClassMeta(ClassMeta):
         use_construct: bool,
         populate_by_name: bool = False,
         alias_name: Optional[str] = None,
+        defaults: Optional[Dict[str, str]] = None,
+        direct_construct: bool = False,
+        extra_allowed: bool = False,
+        post_init: bool = False,
     ) -> None:
+        """
+        :param use_construct: create the objects without validation (the model has no validators)
+        :param defaults: code for the default value of each field that is not required
+        :param direct_construct: create the objects without validation by filling their attributes directly,
+            like ``model_construct`` does, but with the set fields and the defaults known at code generation
+        :param extra_allowed: if the model allows extra fields
+        :param post_init: if the model has a ``model_post_init`` method (or private attributes)
+        """
         super().__init__(name=name, fields=fields, alias_name=alias_name)
         self.use_construct = use_construct
         self.populate_by_name = populate_by_name
+        self.defaults = defaults or {}
+        self.direct_construct = direct_construct
+        self.extra_allowed = extra_allowed
+        self.post_init = post_init
 
     @staticmethod
     def has_validators(clazz: Any) -> bool:
@@ -50,11 +76,52 @@ class PydanticV2ClassMeta(ClassMeta):
             or bool(vals.model_validators)
         )
 
-    def return_statement(self) -> cg.Return:
+    def constructor_call(self, arguments: Dict[str, str], d: Optional[str] = None) -> cg.Expression:
         if self.use_construct:
-            return cg.Return(f"{self.alias_name}.model_construct(**d)")
+            return cg.Call(f"{self.alias_name}.model_construct", keywords=dict(arguments), unpack=d)
         else:
-            return super().return_statement()
+            return super().constructor_call(arguments, d)
+
+    def construct(
+        self,
+        arguments: Dict[str, str],
+        d: Optional[str] = None,
+        variable: str = "obj",
+        d_keys: Collection[str] = (),
+    ) -> Tuple[List[cg.Statement], Union[str, cg.Expression]]:
+        if not (self.use_construct and self.direct_construct):
+            return super().construct(arguments, d, variable, d_keys)
+
+        # the same as `model_construct`, but the set fields and the defaults are already known
+        values, fields_set = f"{variable}_values", f"{variable}_fields_set"
+        set_fields = [f'"{name}"' for name in self.fields if name in arguments]
+        if d is not None:
+            set_fields.append(f"*{d}")
+        extra = "{}" if self.extra_allowed else "None"
+        return [
+            cg.Assignment(name=variable, rhs=f"object.__new__({self.alias_name})"),
+            # before 2.6, `model_construct` adds the defaults after all the set fields
+            *fields_dict_code(
+                values, self.fields, arguments, d, d_keys, self.defaults, defaults_last=pydantic_version() < (2, 6, 0)
+            ),
+            cg.Assignment(name=fields_set, rhs=f"{{{', '.join(set_fields)}}}" if set_fields else "set()"),
+            cg.ExpressionStatement(f'object.__setattr__({variable}, "__dict__", {values})'),
+            cg.ExpressionStatement(f'object.__setattr__({variable}, "__pydantic_fields_set__", {fields_set})'),
+            cg.ExpressionStatement(f'object.__setattr__({variable}, "__pydantic_extra__", {extra})'),
+            cg.ExpressionStatement(
+                f"{variable}.model_post_init(None)"
+                if self.post_init
+                else f'object.__setattr__({variable}, "__pydantic_private__", None)'
+            ),
+        ], variable
+
+    def keeps_argument_values(self) -> bool:
+        return self.use_construct and not self.post_init
+
+    def trusting(self) -> "PydanticV2ClassMeta":
+        meta = copy(self)
+        meta.use_construct = True
+        return meta
 
     def get_assignment_name(self, field: FieldMeta) -> str:
         if self.use_construct or self.populate_by_name:
@@ -78,13 +145,36 @@ class PydanticV2ClassMeta(ClassMeta):
 
     @classmethod
     def from_clazz(cls, clazz: Any, namespace: Namespace) -> "PydanticV2ClassMeta":
+        alias_name = f"_{get_class_identifier(clazz)}"
         return cls(
             name=cast(str, clazz.__name__),
+            alias_name=alias_name,
             fields=cls._fields(clazz, namespace=namespace),
             use_construct=not cls.has_validators(clazz),
             populate_by_name=clazz.model_config.get("populate_by_name", False),
+            defaults={
+                name: cls._default_code(alias_name, name, field)
+                for name, field in clazz.model_fields.items()
+                if not field.is_required()
+            },
+            direct_construct=not clazz.__pydantic_root_model__ and _supports_direct_construct(),
+            extra_allowed=clazz.model_config.get("extra") == "allow",
+            post_init=bool(clazz.__pydantic_post_init__),
         )
 
+    @staticmethod
+    def _default_code(clazz_alias: str, name: str, field: Any) -> str:
+        """The code for the default value, like ``field.get_default(call_default_factory=True)``"""
+        lookup = f'{clazz_alias}.model_fields["{name}"]'
+        if field.default_factory is not None:
+            return LITERAL_FACTORIES.get(field.default_factory, f"{lookup}.default_factory()")
+        if (literal := literal_code(field.default)) is not None:
+            return literal
+        if type(field.default) in LITERAL_FACTORIES and not field.default:
+            # a copy of an empty collection
+            return LITERAL_FACTORIES[type(field.default)]
+        return f"{lookup}.get_default(call_default_factory=True)"
+
     @classmethod
     def only_if_set(cls, source_cls: Any, target_field: FieldMeta, source_field: FieldMeta) -> bool:
         # maintain Pydantic's unset property
@@ -95,10 +185,21 @@ class PydanticV2ClassMeta(ClassMeta):
             and source_cls._type == DataclassType.PYDANTIC
         )
 
+    @classmethod
+    def fields_set(cls, obj: str = "self") -> str:
+        return f"{obj}.model_fields_set"
+
     @classmethod
     def post_process(
-        cls, code: cg.Statement, source_cls: Any, target_field: FieldMeta, source_field: FieldMeta
+        cls,
+        code: cg.Statement,
+        source_cls: Any,
+        target_field: FieldMeta,
+        source_field: FieldMeta,
+        obj: str = "self",
+        fields_set: Optional[str] = None,
     ) -> cg.Statement:
         if cls.only_if_set(source_cls=source_cls, source_field=source_field, target_field=target_field):
-            code = cg.IfElse(condition=f"'{source_field.name}' in self.model_fields_set", if_block=code)
+            fields_set = fields_set or cls.fields_set(obj)
+            code = cg.IfElse(condition=f"'{source_field.name}' in {fields_set}", if_block=code)
         return code
@@ -1,8 +1,91 @@
+import math
 import re
-from typing import Tuple
+from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple
+
+import dataclass_mapper.code_generator as cg
+
+# factories whose result can be written directly as literal
+LITERAL_FACTORIES: Dict[Any, str] = {list: "[]", dict: "{}", set: "set()"}
 
 
 def parse_version(version: str) -> Tuple[int, int, int]:
     if m := re.search(r"(\d+)\.(\d+)\.(\d+)", version):
         return (int(m.group(1)), int(m.group(2)), int(m.group(3)))
     return (0, 0, 0)
+
+
+def literal_code(value: Any) -> Optional[str]:
+    """The literal for an immutable default value, or ``None`` if the value has no valid literal (e.g. ``nan``)"""
+    is_literal = value is None or type(value) in (bool, int, float, str, bytes)
+    if is_literal and not (isinstance(value, float) and not math.isfinite(value)):
+        return repr(value)
+    return None
+
+
+def fields_dict_code(
+    variable: str,
+    field_names: Iterable[str],
+    arguments: Dict[str, str],
+    d: Optional[str],
+    d_keys: Collection[str],
+    defaults: Dict[str, str],
+    defaults_last: bool,
+) -> List[cg.Statement]:
+    """The statements that create the dictionary ``variable`` with the values of the fields, like the ``construct``
+    methods of Pydantic do at runtime: the values of the set fields (from the keyword arguments, or from the
+    dictionary ``d``) and the defaults of the unset fields.
+    Only the fields in ``d_keys`` are looked up in ``d``, the other fields that aren't in the keyword arguments always
+    get their defaults.
+
+    :param defaults: code for the default value of each field that is not required
+    :param defaults_last: the defaults come after all the set fields (Pydantic v2 before 2.6), instead of in the
+        order of the fields
+    """
+    field_names = list(field_names)
+    items: List[str] = []
+    statements: List[cg.Statement] = []
+    # if it's only known at runtime which fields use their defaults, they are collected in a separate dictionary
+    defaults_variable = f"{variable}_defaults"
+    collect_defaults = defaults_last and d is not None and any(name in defaults for name in d_keys)
+
+    def assign(name: str, value: str) -> None:
+        # the leading values are part of the dictionary literal, the others are set one by one to keep the order
+        if not statements:
+            items.append(f'"{name}": {value}')
+        else:
+            statements.append(cg.Assignment(name=f'{variable}["{name}"]', rhs=value))
+
+    def assign_default(name: str, default: str) -> cg.Assignment:
+        target = defaults_variable if collect_defaults else variable
+        return cg.Assignment(name=f'{target}["{name}"]', rhs=default)
+
+    trailing_defaults: List[Tuple[str, str]] = []
+    for name in field_names:
+        default = defaults.get(name)
+        if name in arguments:
+            assign(name, arguments[name])
+        elif d is not None and name in d_keys:
+            statements.append(
+                cg.IfElse(
+                    condition=f'"{name}" in {d}',
+                    if_block=cg.Assignment(name=f'{variable}["{name}"]', rhs=f'{d}["{name}"]'),
+                    else_block=None if default is None else assign_default(name, default),
+                )
+            )
+        elif default is not None and collect_defaults:
+            statements.append(assign_default(name, default))
+        elif default is not None and defaults_last:
+            trailing_defaults.append((name, default))
+        elif default is not None:
+            assign(name, default)
+    for name, default in trailing_defaults:
+        assign(name, default)
+
+    if not collect_defaults:
+        return [cg.Assignment(name=variable, rhs=f"{{{', '.join(items)}}}"), *statements]
+    return [
+        cg.Assignment(name=variable, rhs=f"{{{', '.join(items)}}}"),
+        cg.Assignment(name=defaults_variable, rhs="{}"),
+        *statements,
+        cg.ExpressionStatement(f"{variable}.update({defaults_variable})"),
+    ]
@@ -0,0 +1,128 @@
+"""Opt-in runtime statistics of the mappers.
+
+The instrumentation is disabled by default.
+It can be enabled with the environment variable ``DATACLASS_MAPPER_STATS``, or with ``enable_stats``.
+Only mappers that are compiled while it is enabled get instrumented, all other mappers run the generated code directly.
+"""
+import os
+import threading
+from dataclasses import dataclass, replace
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+from weakref import WeakKeyDictionary
+
+from .registry import MapperFunctions
+
+
+@dataclass
+class MapperStats:
+    """Runtime statistics of one mapper
+
+    :param calls: number of calls of the mapper functions (a call of ``map_many`` counts once)
+    :param objects: number of objects that the mapper created
+    :param nested_objects: number of objects that other instrumented mappers created during the calls
+        (nested mappers that got inlined, or enum fields, are not counted)
+    :param total_time: time spent in the mapper functions in seconds, including the nested mappers
+    :param self_time: time spent in the mapper functions in seconds, excluding the other instrumented mappers
+    """
+
+    calls: int = 0
+    objects: int = 0
+    nested_objects: int = 0
+    total_time: float = 0.0
+    self_time: float = 0.0
+
+
+_enabled = bool(os.environ.get("DATACLASS_MAPPER_STATS"))
+# the statistics of the instrumented mappers, stored by source class and target class
+_stats: "WeakKeyDictionary[Any, Dict[Any, MapperStats]]" = WeakKeyDictionary()
+# the active calls of the instrumented mappers in the current thread
+_local = threading.local()
+
+
+class _Frame:
+    """Time and objects of the nested mappers of one active call"""
+
+    __slots__ = ("time", "objects")
+
+    def __init__(self) -> None:
+        self.time = 0.0
+        self.objects = 0
+
+
+def enable_stats(enabled: bool = True) -> None:
+    """Enables the collection of runtime statistics (see ``stats``) for all mappers that are compiled afterwards.
+    The instrumentation adds some overhead to every call, it's meant for finding the mappings that dominate the
+    runtime.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def stats_enabled() -> bool:
+    return _enabled
+
+
+def stats() -> Dict[Tuple[Any, Any], MapperStats]:
+    """Returns a snapshot of the runtime statistics of all instrumented mappers, by source and target class
+    (see ``enable_stats``)."""
+    return {
+        (source_cls, target_cls): replace(mapper_stats)
+        for source_cls, records in list(_stats.items())
+        for target_cls, mapper_stats in records.items()
+    }
+
+
+def reset_stats() -> None:
+    """Resets the runtime statistics of all instrumented mappers"""
+    for records in list(_stats.values()):
+        for mapper_stats in records.values():
+            mapper_stats.calls = mapper_stats.objects = mapper_stats.nested_objects = 0
+            mapper_stats.total_time = mapper_stats.self_time = 0.0
+
+
+def _frames() -> List[_Frame]:
+    try:
+        return _local.frames  # type: ignore[no-any-return]
+    except AttributeError:
+        _local.frames = []
+        return _local.frames  # type: ignore[no-any-return]
+
+
+def _measure(function: Callable, mapper_stats: MapperStats, many: bool) -> Callable:
+    @wraps(function)
+    def measured(*args: Any) -> Any:
+        frames = _frames()
+        frame = _Frame()
+        frames.append(frame)
+        objects = 0
+        start = perf_counter()
+        try:
+            result = function(*args)
+            objects = len(result) if many else 1
+            return result
+        finally:
+            elapsed = perf_counter() - start
+            frames.pop()
+            mapper_stats.calls += 1
+            mapper_stats.objects += objects
+            mapper_stats.nested_objects += frame.objects
+            mapper_stats.total_time += elapsed
+            mapper_stats.self_time += elapsed - frame.time
+            if frames:
+                frames[-1].time += elapsed
+                frames[-1].objects += objects + frame.objects
+
+    return measured
+
+
+def instrument(source_cls: Any, target_cls: Any, functions: MapperFunctions) -> MapperFunctions:
+    """Wraps the mapper functions, so that they record their runtime statistics"""
+    mapper_stats = _stats.setdefault(source_cls, {}).setdefault(target_cls, MapperStats())
+    return MapperFunctions(
+        convert=_measure(functions.convert, mapper_stats, many=False),
+        convert_many=_measure(functions.convert_many, mapper_stats, many=True),
+        convert_without_extra=_measure(functions.convert_without_extra, mapper_stats, many=False),
+        convert_many_without_extra=_measure(functions.convert_many_without_extra, mapper_stats, many=True),
+    )
@@ -1,31 +1,135 @@
+import linecache
+import os
+import re
 import warnings
+from concurrent.futures import Executor
 from copy import deepcopy
 from importlib import import_module
-from itertools import zip_longest
-from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, cast
-
-from .assignments import get_map_to_func_name
+from itertools import count, zip_longest
+from types import CodeType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union, cast
+from weakref import WeakKeyDictionary, finalize, ref
+
+from . import cache, instrumentation
+from .assignments import (
+    FunctionAssignment,
+    Variables,
+    get_enum_table,
+    get_enum_table_name,
+    get_map_many_func_name,
+    get_map_many_without_extra_func_name,
+    get_map_to_func_name,
+    get_map_without_extra_func_name,
+)
 from .classmeta import get_class_meta
-from .enum import EnumMapping, make_enum_mapper
+from .enum import (
+    EnumMapping,
+    make_enum_batch_mapper,
+    make_enum_batch_mapper_without_extra,
+    make_enum_mapper,
+    make_enum_mapper_without_extra,
+)
+from .implementations.base import ClassMeta
 from .mapping_method import (
     AssumeNotNone,
     InitWithDefault,
+    Inliner,
     MappingMethodSourceCode,
     ProvideWithExtra,
     Spezial,
     StringFieldMapping,
 )
 from .namespace import Namespace, get_namespace
+from .optimizer import optimize_function
+from .parallel import map_chunks
+from .registry import (
+    CompiledMapper,
+    MapperFunctions,
+    get_compiled_mapper,
+    nested_compiled_mappers,
+    register_compiled_mapper,
+)
+from .utils import get_class_identifier, type_atoms
+
+
+def _function_names(compiled_mapper: CompiledMapper) -> Dict[str, str]:
+    """Readable names of the generated functions (e.g. ``map_Source_to_Target``), that show up in profilers and
+    tracebacks, for each field of ``MapperFunctions``"""
+    source_name = re.sub(r"\W", "_", compiled_mapper.source_cls.__name__)
+    target_name = re.sub(r"\W", "_", compiled_mapper.target_cls.__name__)
+    return {
+        "convert": f"map_{source_name}_to_{target_name}",
+        "convert_many": f"map_many_{source_name}_to_{target_name}",
+        "convert_without_extra": f"map_{source_name}_to_{target_name}_without_extra",
+        "convert_many_without_extra": f"map_many_{source_name}_to_{target_name}_without_extra",
+    }
+
+
+def _make_mapper(compiled_mapper: CompiledMapper, optimize: bool = True) -> str:
+    """Generates the code for the mapper functions ``convert`` and ``convert_many``, and for their variants
+    ``convert_without_extra`` and ``convert_many_without_extra``, that skip all the handling of the ``extra``
+    dictionaries (named like in ``_function_names``)
+
+    :param optimize: apply the peephole optimizations to the generated code
+    """
+    names = _function_names(compiled_mapper)
+    inliner = _make_inliner(compiled_mapper) if compiled_mapper.inline else None
+    source_code = _make_source_code(compiled_mapper, inliner=inliner)
+    inliner = _make_inliner(compiled_mapper) if compiled_mapper.inline else None
+    source_code_without_extra = _make_source_code(compiled_mapper, variables=Variables(extra=None), inliner=inliner)
+    functions = [
+        source_code.function(names["convert"]),
+        source_code.batch_function(names["convert_many"]),
+        source_code_without_extra.function(names["convert"]),
+        source_code_without_extra.batch_function(names["convert_many"]),
+    ]
+    if optimize:
+        functions = [optimize_function(function) for function in functions]
+    return "\n\n".join(function.to_string(0) for function in functions)
+
+
+def _make_inliner(compiled_mapper: CompiledMapper) -> Inliner:
+    """Creates an inliner, that generates the code of the compiled nested mappers using numbered variables.
+    A mapper is not inlined into itself, so recursive types still call the mapper method at some point.
+    """
+    numbers = count(1)
+    active = [(compiled_mapper.source_cls, compiled_mapper.target_cls)]
+
+    def inliner(source_cls: Any, target_cls: Any, variables: Variables) -> Optional[MappingMethodSourceCode]:
+        nested = get_compiled_mapper(source_cls, target_cls)
+        if nested is None or (source_cls, target_cls) in active:
+            return None
+        active.append((source_cls, target_cls))
+        try:
+            return _make_source_code(nested, variables=variables.nested(next(numbers)), inliner=inliner)
+        finally:
+            active.pop()
 
+    return inliner
 
-def _make_mapper(
-    mapping: StringFieldMapping, source_cls: Any, target_cls: Any, namespace: Namespace
-) -> Tuple[str, Dict[str, Callable], Dict[str, Any]]:
-    source_cls_meta = get_class_meta(source_cls, namespace=namespace)
-    target_cls_meta = get_class_meta(target_cls, namespace=namespace)
+
+def _warn_deprecated(mapping: StringFieldMapping) -> None:
+    """Emits the deprecation warnings of the mapping.
+    It happens before looking up the cached code, so that the warnings are also emitted if the code isn't generated.
+    """
+    for raw_source in mapping.values():
+        if raw_source is Spezial.USE_DEFAULT:
+            warnings.warn("USE_DEFAULT is deprecated, use init_with_default() instead", DeprecationWarning)
+        if raw_source is Spezial.IGNORE_MISSING_MAPPING:
+            warnings.warn("IGNORE_MISSING_MAPPING is deprecated, use init_with_default() instead", DeprecationWarning)
+
+
+def _make_source_code(
+    compiled_mapper: CompiledMapper, variables: Variables = Variables(), inliner: Optional[Inliner] = None
+) -> MappingMethodSourceCode:
+    mapping = compiled_mapper.mapping
+    source_cls, target_cls = compiled_mapper.source_cls, compiled_mapper.target_cls
+    source_cls_meta, target_cls_meta = compiled_mapper.source_cls_meta, compiled_mapper.target_cls_meta
     actual_source_fields = source_cls_meta.fields
     actual_target_fields = target_cls_meta.fields
-    source_code = MappingMethodSourceCode(source_cls=source_cls_meta, target_cls=target_cls_meta)
+    source_code = MappingMethodSourceCode(
+        source_cls=source_cls_meta, target_cls=target_cls_meta, variables=variables, inliner=inliner
+    )
 
     for target_field_name, target_field in actual_target_fields.items():
         # mapping exists
@@ -57,17 +161,6 @@ def _make_mapper(
                     Spezial.USE_DEFAULT,
                     Spezial.IGNORE_MISSING_MAPPING,
                 ) or isinstance(raw_source, InitWithDefault):
-                    if raw_source is Spezial.USE_DEFAULT:
-                        warnings.warn(
-                            "USE_DEFAULT is deprecated, use init_with_default() instead",
-                            DeprecationWarning,
-                        )
-                    if raw_source is Spezial.IGNORE_MISSING_MAPPING:
-                        warnings.warn(
-                            "IGNORE_MISSING_MAPPING is deprecated, use init_with_default() instead",
-                            DeprecationWarning,
-                        )
-
                     if target_field.required:
                         # leaving the target empty and using the default value/factory is not possible,
                         # as the target doesn't have a default value/factory
@@ -94,13 +187,62 @@ def _make_mapper(
             f"'{target_field_name}' of mapping in '{source_cls.__name__}' doesn't exist in '{target_cls.__name__}'"
         )
 
-    return str(source_code), source_code.methods, {target_cls_meta.alias_name: target_cls}
+    return source_code
+
+
+def _make_enum_tables(source_cls_meta: ClassMeta, target_cls_meta: ClassMeta) -> Dict[str, Dict[Any, Any]]:
+    """The lookup tables of the enum mappers between the types of the fields, that the generated code uses"""
+    source_types = {atom for field in source_cls_meta.fields.values() for atom in type_atoms(field.type)}
+    target_types = {atom for field in target_cls_meta.fields.values() for atom in type_atoms(field.type)}
+    tables: Dict[str, Dict[Any, Any]] = {}
+    for source_type in source_types:
+        for target_type in target_types:
+            if (table := get_enum_table(source_type, target_type)) is not None:
+                tables[get_enum_table_name(source_type, target_type)] = table
+    return tables
+
+
+def _make_functions(compiled_mapper: CompiledMapper) -> Dict[str, Callable]:
+    """The custom conversion functions, that the generated code calls (bound as globals of the generated code)"""
+    functions: Dict[str, Callable] = {}
+    source_cls_meta, target_cls_meta = compiled_mapper.source_cls_meta, compiled_mapper.target_cls_meta
+    for target_field_name, raw_source in compiled_mapper.mapping.items():
+        if callable(raw_source) and target_field_name in target_cls_meta.fields:
+            function_assignment = FunctionAssignment(
+                function=raw_source,
+                target=target_cls_meta.fields[target_field_name],
+                target_cls_name=target_cls_meta.name,
+                source_cls_alias_name=source_cls_meta.alias_name,
+                target_cls_alias_name=target_cls_meta.alias_name,
+            )
+            functions[function_assignment.function_name()] = raw_source
+    return functions
 
 
 T = TypeVar("T")
 
+# if the mappers with `trusted=True` skip the validation of the target objects
+_trusted_enabled = not os.environ.get("DATACLASS_MAPPER_DISABLE_TRUSTED")
+
 
-def mapper(TargetCls: Any, mapping: Optional[StringFieldMapping] = None) -> Callable[[T], T]:
+def enable_trusted(enabled: bool = True) -> None:
+    """Enables or disables the trusted mode (see the parameter ``trusted`` of ``mapper``) for all mappers that are
+    compiled afterwards.
+    Disabling it, e.g. in tests, makes the mappers with ``trusted=True`` validate the target objects again.
+    It can also be disabled with the environment variable ``DATACLASS_MAPPER_DISABLE_TRUSTED``.
+    """
+    global _trusted_enabled
+    _trusted_enabled = enabled
+
+
+def mapper(
+    TargetCls: Any,
+    mapping: Optional[StringFieldMapping] = None,
+    lazy: bool = False,
+    inline: bool = False,
+    bypass_init: bool = False,
+    trusted: bool = False,
+) -> Callable[[T], T]:
     """Class decorator that adds a private mapper method, that maps the current class to the ``TargetCls``.
     The mapper method can be called using the ``map_to`` function.
 
@@ -128,6 +270,21 @@ def mapper(TargetCls: Any, mapping: Optional[StringFieldMapping] = None) -> Call
           If no source field name is given, it will additionally assume that the source field is also called ``x``.
         - ``{"x": provide_with_extra()}`` means, that you don't fill this field with any field of the source class,
           but with the extra dictionary given by the `map_to` method.
+    :param lazy: If ``True``, the mapper method is only analyzed and compiled when it's used the first time
+        (or when ``compile_all`` is called).
+        Errors in the mapping definition will then also be raised only at that point.
+    :param inline: If ``True``, the code of the nested mappers (for fields with mapped classes, or lists and
+        dictionaries of them) is inlined into the mapper method, instead of calling their mapper methods.
+        This saves one function call per nested object.
+        Only nested mappers that are already compiled get inlined, and the nested objects are mapped with the
+        mapper of the annotated field type, even if they are instances of a subclass with its own mapper.
+    :param bypass_init: If ``True``, the target objects are created with ``object.__new__`` and their fields are
+        filled directly, instead of calling the ``__init__`` method (default values and factories are still applied).
+        Only possible for dataclasses without ``__post_init__`` method and without ``InitVar`` fields.
+    :param trusted: If ``True``, Pydantic target objects are created without validation, even if the Pydantic model
+        has validators (which are then not called).
+        Only use it if the source objects are already valid, e.g. if they are created by your own code.
+        It can be turned off globally with ``enable_trusted(False)``, e.g. in tests.
     """
 
     namespace = get_namespace()
@@ -138,55 +295,317 @@ def mapper(TargetCls: Any, mapping: Optional[StringFieldMapping] = None) -> Call
             TargetCls=TargetCls,
             mapping=mapping,
             namespace=namespace,
+            lazy=lazy,
+            inline=inline,
+            bypass_init=bypass_init,
+            trusted=trusted,
         )
         return SourceCls
 
     return wrapped
 
 
-def mapper_from(SourceCls: Any, mapping: Optional[StringFieldMapping] = None) -> Callable[[T], T]:
+def mapper_from(
+    SourceCls: Any,
+    mapping: Optional[StringFieldMapping] = None,
+    lazy: bool = False,
+    inline: bool = False,
+    bypass_init: bool = False,
+    trusted: bool = False,
+) -> Callable[[T], T]:
     """Class decorator that adds a private mapper method, that maps an object of ``SourceCls`` to the current class.
     The mapper method can be called using the ``map_to`` function.
 
     :param SourceCls: the class (source class) that you want to map an object from to the current (target) class.
     :param mapping: an optional dictionary which which it's possible to describe how each field in the target class
         gets initialized.
+    :param lazy: if ``True``, the mapper method is only analyzed and compiled when it's used the first time
+        (or when ``compile_all`` is called).
+    :param inline: if ``True``, the code of the nested mappers is inlined into the mapper method.
+    :param bypass_init: if ``True``, the objects of the current class are created without calling ``__init__``.
+    :param trusted: if ``True``, the objects of the current class are created without validation.
     """
 
     namespace = get_namespace()
 
     def wrapped(TargetCls: T) -> T:
-        add_mapper_function(SourceCls=SourceCls, TargetCls=TargetCls, mapping=mapping, namespace=namespace)
+        add_mapper_function(
+            SourceCls=SourceCls,
+            TargetCls=TargetCls,
+            mapping=mapping,
+            namespace=namespace,
+            lazy=lazy,
+            inline=inline,
+            bypass_init=bypass_init,
+            trusted=trusted,
+        )
         return TargetCls
 
     return wrapped
 
 
+# mappers that were registered with `lazy=True`, and that are not compiled yet: map SourceCls to a dictionary, that maps
+# id(TargetCls) to the function that compiles the mapper.
+# The classes are only referenced weakly, the entries get removed once one of the classes dies.
+_uncompiled_mappers: "WeakKeyDictionary[Any, Dict[int, Callable[[], None]]]" = WeakKeyDictionary()
+
+
+def _get_uncompiled_mapper(SourceCls: Any, TargetCls: Any) -> Optional[Callable[[], None]]:
+    return _uncompiled_mappers.get(SourceCls, {}).get(id(TargetCls))
+
+
+# dispatch tables of `map_to`: map (id(SourceCls), id(TargetCls)) to the mapper function (with and without extra).
+# The ids are used to not keep dynamically created classes alive, the entries get removed once one of the classes dies.
+_mapper_functions: Dict[Tuple[int, int], Callable[[Any, Dict], Any]] = {}
+_mapper_functions_without_extra: Dict[Tuple[int, int], Callable[[Any], Any]] = {}
+
+
+def _register_mapper_function(
+    SourceCls: Any, TargetCls: Any, convert: Callable[[Any, Dict], Any], convert_without_extra: Callable[[Any], Any]
+) -> None:
+    key = (id(SourceCls), id(TargetCls))
+    if key not in _mapper_functions:
+        for mapper_functions in (_mapper_functions, _mapper_functions_without_extra):
+            finalize(SourceCls, mapper_functions.pop, key, None)
+            finalize(TargetCls, mapper_functions.pop, key, None)
+    _mapper_functions[key] = convert
+    _mapper_functions_without_extra[key] = convert_without_extra
+
+
+def _set_mapper_function(SourceCls: Any, name: str, function: Callable, static: bool = False) -> None:
+    """Stores the function in the class.
+    Its qualified name points to the class attribute, like for a method that is defined in the class, so that the
+    function can be pickled by reference (e.g. for sending it to worker processes)."""
+    function.__module__ = SourceCls.__module__
+    function.__qualname__ = f"{SourceCls.__qualname__}.{name}"
+    setattr(SourceCls, name, staticmethod(function) if static else function)
+
+
+def _set_mapper_functions(SourceCls: Any, TargetCls: Any, functions: MapperFunctions) -> None:
+    _set_mapper_function(SourceCls, get_map_to_func_name(TargetCls), functions.convert)
+    _set_mapper_function(SourceCls, get_map_many_func_name(TargetCls), functions.convert_many, static=True)
+    _set_mapper_function(SourceCls, get_map_without_extra_func_name(TargetCls), functions.convert_without_extra)
+    _set_mapper_function(
+        SourceCls, get_map_many_without_extra_func_name(TargetCls), functions.convert_many_without_extra, static=True
+    )
+    _register_mapper_function(SourceCls, TargetCls, functions.convert, functions.convert_without_extra)
+
+
+def _find_mapper_function(SourceCls: Any, TargetCls: Any) -> Callable[[Any, Dict], Any]:
+    """Finds the mapper function, also if it is defined in a base class, and adds it to the dispatch tables"""
+    convert = getattr(SourceCls, get_map_to_func_name(TargetCls), None)
+    convert_without_extra = getattr(SourceCls, get_map_without_extra_func_name(TargetCls), None)
+    if convert is None or convert_without_extra is None:
+        raise NotImplementedError(f"Object of type '{SourceCls.__name__}' cannot be mapped to '{TargetCls.__name__}'")
+    _register_mapper_function(SourceCls, TargetCls, convert, convert_without_extra)
+    return cast(Callable[[Any, Dict], Any], convert)
+
+
 def add_mapper_function(
-    SourceCls: Any, TargetCls: Any, mapping: Optional[StringFieldMapping], namespace: Namespace
+    SourceCls: Any,
+    TargetCls: Any,
+    mapping: Optional[StringFieldMapping],
+    namespace: Namespace,
+    lazy: bool = False,
+    inline: bool = False,
+    bypass_init: bool = False,
+    trusted: bool = False,
 ) -> None:
-    field_mapping = mapping or cast(StringFieldMapping, {})
+    if hasattr(SourceCls, get_map_to_func_name(TargetCls)):
+        raise AttributeError(
+            f"There already exists a mapping between '{SourceCls.__name__}' and '{TargetCls.__name__}'"
+        )
 
-    map_code, factories, context = _make_mapper(
-        field_mapping,
+    if lazy:
+        # the local classes of the forward references are needed later, when the mapper gets compiled
+        namespace.keep_forward_references(SourceCls, TargetCls)
+        add_lazy_mapper_function(
+            SourceCls=SourceCls,
+            TargetCls=TargetCls,
+            mapping=mapping,
+            namespace=namespace,
+            inline=inline,
+            bypass_init=bypass_init,
+            trusted=trusted,
+        )
+    else:
+        compile_mapper_function(
+            SourceCls=SourceCls,
+            TargetCls=TargetCls,
+            mapping=mapping,
+            namespace=namespace,
+            inline=inline,
+            bypass_init=bypass_init,
+            trusted=trusted,
+        )
+
+
+def compile_mapper_function(
+    SourceCls: Any,
+    TargetCls: Any,
+    mapping: Optional[StringFieldMapping],
+    namespace: Namespace,
+    inline: bool = False,
+    bypass_init: bool = False,
+    trusted: bool = False,
+) -> None:
+    field_mapping = mapping or cast(StringFieldMapping, {})
+    _warn_deprecated(field_mapping)
+    target_cls_meta = get_class_meta(TargetCls, namespace=namespace)
+    if bypass_init:
+        target_cls_meta = target_cls_meta.bypassing_init()
+    if trusted and _trusted_enabled:
+        target_cls_meta = target_cls_meta.trusting()
+    compiled_mapper = CompiledMapper(
         source_cls=SourceCls,
         target_cls=TargetCls,
-        namespace=namespace,
+        mapping=field_mapping,
+        source_cls_meta=get_class_meta(SourceCls, namespace=namespace),
+        target_cls_meta=target_cls_meta,
+        inline=inline,
     )
-    module = import_module(SourceCls.__module__)
 
-    d: Dict = {}
+    mapper_globals = _mapper_globals(compiled_mapper)
     setattr(SourceCls, "__zip_longest", zip_longest)
+
+    key: Optional[str] = None
+    if cache.get_cache_dir() is not None or cache.has_precompiled():
+        key = cache.fingerprint(
+            SourceCls,
+            TargetCls,
+            compiled_mapper.source_cls_meta,
+            compiled_mapper.target_cls_meta,
+            field_mapping,
+            inline=inline,
+        )
+
+    functions: Optional[MapperFunctions] = None
+    if key is not None:
+        functions = cache.get_precompiled(key, mapper_globals)
+    if functions is None:
+        code: Optional[CodeType] = None
+        if key is not None and cache.get_cache_dir() is not None:
+            code = cache.load(key)
+        if code is None:
+            filename = _source_filename(SourceCls, TargetCls)
+            source = _make_mapper(compiled_mapper)
+            _register_source(SourceCls, filename, source)
+            code = compile(source, filename, "exec")
+            if key is not None and cache.get_cache_dir() is not None:
+                cache.store(key, code)
+        d: Dict = {}
+        exec(code, mapper_globals, d)
+        names = _function_names(compiled_mapper)
+        functions = MapperFunctions(*(d[names[field]] for field in MapperFunctions._fields))
+
+    if instrumentation.stats_enabled():
+        functions = instrumentation.instrument(SourceCls, TargetCls, functions)
+
+    _set_mapper_functions(SourceCls, TargetCls, functions)
+    register_compiled_mapper(compiled_mapper)
+
+
+def _mapper_globals(compiled_mapper: CompiledMapper) -> Dict[str, Any]:
+    """The globals of the generated code: the globals of the module of the source class, the target class, and the
+    conversion functions and enum tables (also of the nested mappers, if they get inlined)"""
+    module = import_module(compiled_mapper.source_cls.__module__)
+    context: Dict[str, Any] = {compiled_mapper.target_cls_meta.alias_name: compiled_mapper.target_cls}
+    context.update(_make_functions(compiled_mapper))
+    context.update(_make_enum_tables(compiled_mapper.source_cls_meta, compiled_mapper.target_cls_meta))
+    if compiled_mapper.inline:
+        # the inlined code creates the objects of the nested mappers, and calls their conversion functions
+        for nested in nested_compiled_mappers(compiled_mapper.source_cls_meta, compiled_mapper.target_cls_meta):
+            context[nested.target_cls_meta.alias_name] = nested.target_cls
+            context.update(_make_functions(nested))
+            context.update(_make_enum_tables(nested.source_cls_meta, nested.target_cls_meta))
     # Support older versions of python by calling {**a, **b} rather than a|b
-    exec(map_code, {**module.__dict__, **context}, d)
+    return {**module.__dict__, **context}
+
+
+def _source_filename(SourceCls: Any, TargetCls: Any) -> str:
+    """Synthetic filename of the generated code"""
+    return f"<dataclass-mapper {get_class_identifier(SourceCls)} to {get_class_identifier(TargetCls)}>"
+
+
+def _register_source(SourceCls: Any, filename: str, source: str) -> None:
+    """Registers the generated code in ``linecache``, so that tracebacks and profilers can show its lines.
+    The entry is removed together with the source class."""
+    # an entry without modification time is never invalidated by `linecache.checkcache`
+    linecache.cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+    finalize(SourceCls, linecache.cache.pop, filename, None)
+
+
+def add_lazy_mapper_function(
+    SourceCls: Any,
+    TargetCls: Any,
+    mapping: Optional[StringFieldMapping],
+    namespace: Namespace,
+    inline: bool = False,
+    bypass_init: bool = False,
+    trusted: bool = False,
+) -> None:
+    """Adds placeholder mapper methods, that compile the actual mapper methods when they are called the first time"""
     map_func_name = get_map_to_func_name(TargetCls)
-    if hasattr(SourceCls, map_func_name):
-        raise AttributeError(
-            f"There already exists a mapping between '{SourceCls.__name__}' and '{TargetCls.__name__}'"
-        )
-    setattr(SourceCls, map_func_name, d["convert"])
-    for name, factory in factories.items():
-        setattr(SourceCls, name, factory)
+    map_many_func_name = get_map_many_func_name(TargetCls)
+    map_without_extra_func_name = get_map_without_extra_func_name(TargetCls)
+    map_many_without_extra_func_name = get_map_many_without_extra_func_name(TargetCls)
+
+    # the compile function is stored in `_uncompiled_mappers`, so it must not keep the classes alive
+    source_ref, target_ref = ref(SourceCls), ref(TargetCls)
+
+    def compile_mapper() -> None:
+        nonlocal namespace
+        SourceCls, TargetCls = source_ref(), target_ref()
+        if SourceCls is not None and TargetCls is not None and _get_uncompiled_mapper(SourceCls, TargetCls) is not None:
+            compile_mapper_function(
+                SourceCls=SourceCls,
+                TargetCls=TargetCls,
+                mapping=mapping,
+                namespace=namespace,
+                inline=inline,
+                bypass_init=bypass_init,
+                trusted=trusted,
+            )
+            uncompiled_mappers = _uncompiled_mappers[SourceCls]
+            uncompiled_mappers.pop(id(TargetCls), None)
+            if not uncompiled_mappers:
+                del _uncompiled_mappers[SourceCls]
+            # the placeholders might still be referenced somewhere, they shouldn't keep the namespace alive
+            namespace = Namespace(locals={}, globals={})
+
+    def convert(self: Any, extra: Dict) -> Any:
+        compile_mapper()
+        return getattr(self, map_func_name)(extra)
+
+    def convert_many(objs: Iterable[Any], extras: Iterable[Dict]) -> List[Any]:
+        compile_mapper()
+        return cast(List[Any], getattr(SourceCls, map_many_func_name)(objs, extras))
+
+    def convert_without_extra(self: Any) -> Any:
+        compile_mapper()
+        return getattr(self, map_without_extra_func_name)()
+
+    def convert_many_without_extra(objs: Iterable[Any]) -> List[Any]:
+        compile_mapper()
+        return cast(List[Any], getattr(SourceCls, map_many_without_extra_func_name)(objs))
+
+    uncompiled_mappers = _uncompiled_mappers.setdefault(SourceCls, {})
+    if id(TargetCls) not in uncompiled_mappers:
+        finalize(TargetCls, uncompiled_mappers.pop, id(TargetCls), None)
+    uncompiled_mappers[id(TargetCls)] = compile_mapper
+    _set_mapper_functions(
+        SourceCls, TargetCls, MapperFunctions(convert, convert_many, convert_without_extra, convert_many_without_extra)
+    )
+
+
+def compile_all() -> None:
+    """Compiles all mappers that were registered with ``lazy=True`` and that haven't been used yet.
+    Calling it once after importing all modules with mappings moves the compilation cost to the startup, and
+    raises errors in the mapping definitions immediately.
+    """
+    for uncompiled_mappers in list(_uncompiled_mappers.values()):
+        for compile_mapper in list(uncompiled_mappers.values()):
+            compile_mapper()
 
 
 def enum_mapper(TargetCls: Any, mapping: Optional[EnumMapping] = None) -> Callable[[T], T]:
@@ -251,7 +670,16 @@ def add_enum_mapper_function(SourceCls: Any, TargetCls: Any, mapping: Optional[E
         raise AttributeError(
             f"There already exists a mapping between '{SourceCls.__name__}' and '{TargetCls.__name__}'"
         )
-    setattr(SourceCls, map_func_name, convert_function)
+    _set_mapper_functions(
+        SourceCls,
+        TargetCls,
+        MapperFunctions(
+            convert=convert_function,
+            convert_many=make_enum_batch_mapper(convert_function),
+            convert_without_extra=make_enum_mapper_without_extra(convert_function),
+            convert_many_without_extra=make_enum_batch_mapper_without_extra(convert_function),
+        ),
+    )
 
 
 def map_to(obj, TargetCls: Type[T], extra: Optional[Dict[str, Any]] = None) -> T:
@@ -264,10 +692,145 @@ def map_to(obj, TargetCls: Type[T], extra: Optional[Dict[str, Any]] = None) -> T
     :param extra: dictionary with the values for the `provide_with_extra()` fields
     :return: the mapped object
     """
+    key = (id(type(obj)), id(TargetCls))
     if extra is None:
-        extra = {}
-    func_name = get_map_to_func_name(TargetCls)
-    if hasattr(obj, func_name):
-        return cast(T, getattr(obj, func_name)(extra))
+        # use the variant of the mapper function, that doesn't handle any extra dictionaries
+        try:
+            convert_without_extra = _mapper_functions_without_extra[key]
+        except KeyError:
+            _find_mapper_function(type(obj), TargetCls)
+            convert_without_extra = _mapper_functions_without_extra[key]
+        return cast(T, convert_without_extra(obj))
+
+    try:
+        convert = _mapper_functions[key]
+    except KeyError:
+        convert = _find_mapper_function(type(obj), TargetCls)
+    return cast(T, convert(obj, extra))
+
+
+def get_mapper(SourceCls: Any, TargetCls: Type[T]) -> Callable[[Any, Dict[str, Any]], T]:
+    """Returns the mapper function, that maps objects of type ``SourceCls`` to objects of type ``TargetCls``.
+    Calling it is equivalent to calling ``map_to``, but skips looking up the mapper function for every object.
+    Raises an ``NotImplementedError`` if no such mapping is defined.
 
-    raise NotImplementedError(f"Object of type '{type(obj).__name__}' cannot be mapped to '{TargetCls.__name__}'")
+    The returned function has to be called with the source object and the ``extra`` dictionary,
+    e.g. ``convert(obj, {})``.
+
+    :param SourceCls: the (source) class that you want to map from.
+    :param TargetCls: the (target) class that you want to map to.
+    :return: the mapper function
+    """
+    for cls in getattr(SourceCls, "__mro__", ()):
+        if (compile_mapper := _get_uncompiled_mapper(cls, TargetCls)) is not None:
+            compile_mapper()
+    return _find_mapper_function(SourceCls, TargetCls)
+
+
+def inspect_mapper(SourceCls: Any, TargetCls: Any) -> str:
+    """Returns the generated code of the mapper, that maps objects of type ``SourceCls`` to objects of type
+    ``TargetCls``.
+    The code contains the functions ``map_<Source>_to_<Target>`` (used by ``map_to``) and
+    ``map_many_<Source>_to_<Target>`` (used by ``map_many``), and their variants for mapping without ``extra``.
+    Raises an ``NotImplementedError`` if no such mapping is defined (or if it is an enum mapping, which has no
+    generated code).
+
+    :param SourceCls: the (source) class that you want to map from.
+    :param TargetCls: the (target) class that you want to map to.
+    :return: the source code of the generated functions
+    """
+    compiled_mapper = _find_compiled_mapper(SourceCls, TargetCls)
+    return _make_mapper(compiled_mapper)
+
+
+def _find_compiled_mapper(SourceCls: Any, TargetCls: Any) -> CompiledMapper:
+    """Finds the compiled mapper, also if it is defined in a base class (lazy mappers get compiled).
+    Raises an ``NotImplementedError`` if there is no generated mapper (e.g. for enum mappings)."""
+    for cls in getattr(SourceCls, "__mro__", ()):
+        if (compile_mapper := _get_uncompiled_mapper(cls, TargetCls)) is not None:
+            compile_mapper()
+        if (compiled_mapper := get_compiled_mapper(cls, TargetCls)) is not None:
+            return compiled_mapper
+    raise NotImplementedError(f"There is no generated mapper between '{SourceCls.__name__}' and '{TargetCls.__name__}'")
+
+
+def map_many(
+    objs: Iterable[Any],
+    TargetCls: Type[T],
+    extras: Optional[Iterable[Dict[str, Any]]] = None,
+    executor: Optional[Union[str, Executor]] = None,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[T]:
+    """Maps all the given objects to objects of type ``TargetCls``.
+    Gives the same result as calling ``map_to`` for each object, but the whole batch is mapped by one generated loop,
+    so the dispatching overhead of ``map_to`` only occurs once.
+    Objects of classes with different mappings are mapped in one batch per mapping.
+
+    :param objs: the source objects that you want to map to objects of type ``TargetCls``
+    :param TargetCls: the (target) class that you want to map to.
+    :param extras: optional iterable with one `extra` dictionary per object (see ``map_to``), a ``ValueError`` is
+        raised if the number of dictionaries differs from the number of objects
+    :param executor: if ``"process"``, the batch is split into chunks, which are mapped in parallel in a pool of
+        worker processes (an existing ``concurrent.futures.Executor`` can also be given).
+        The classes of the mapping need to be defined at the top level of a module, and the objects need to be
+        picklable.
+    :param workers: number of worker processes (by default the number of CPUs)
+    :param chunksize: number of objects per chunk (by default a few chunks per worker)
+    :return: a list with the mapped objects
+    """
+    objs = list(objs)
+    extras = None if extras is None else list(extras)
+    if extras is not None and len(extras) != len(objs):
+        raise ValueError(f"Got {len(objs)} objects, but {len(extras)} extra dictionaries")
+
+    func_name = get_map_many_without_extra_func_name(TargetCls) if extras is None else get_map_many_func_name(TargetCls)
+    convert_many_functions: Dict[Any, Callable] = {}
+    for cls in dict.fromkeys(map(type, objs)):
+        if not hasattr(cls, func_name):
+            raise NotImplementedError(f"Object of type '{cls.__name__}' cannot be mapped to '{TargetCls.__name__}'")
+        convert_many_functions[cls] = getattr(cls, func_name)
+
+    if len(set(convert_many_functions.values())) <= 1:
+        if not objs:
+            return []
+        convert_many = next(iter(convert_many_functions.values()))
+        return cast(List[T], _map_batch(convert_many, objs, extras, TargetCls, executor, workers, chunksize))
+
+    # classes with different mappings: map one batch per mapping, and put the results back in the original order
+    batches: Dict[Callable, List[int]] = {}
+    for index, obj in enumerate(objs):
+        batches.setdefault(convert_many_functions[type(obj)], []).append(index)
+    result: List[Any] = [None] * len(objs)
+    for convert_many, indices in batches.items():
+        batch_extras = None if extras is None else [extras[index] for index in indices]
+        batch = [objs[index] for index in indices]
+        mapped = _map_batch(convert_many, batch, batch_extras, TargetCls, executor, workers, chunksize)
+        for index, target in zip(indices, mapped):
+            result[index] = target
+    return result
+
+
+def _map_batch(
+    convert_many: Callable,
+    objs: List[Any],
+    extras: Optional[List[Dict[str, Any]]],
+    TargetCls: Any,
+    executor: Optional[Union[str, Executor]],
+    workers: Optional[int],
+    chunksize: Optional[int],
+) -> List[Any]:
+    """Maps a batch of objects that all use the same mapping, optionally in worker processes"""
+    if executor is not None:
+        return map_chunks(
+            convert_many,
+            objs=objs,
+            extras=extras,
+            modules=list(dict.fromkeys([type(objs[0]).__module__, TargetCls.__module__])),
+            executor=executor,
+            workers=workers,
+            chunksize=chunksize,
+        )
+    if extras is None:
+        return cast(List[Any], convert_many(objs))
+    return cast(List[Any], convert_many(objs, extras))
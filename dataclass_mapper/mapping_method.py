@@ -1,17 +1,20 @@
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 from . import code_generator as cg
 from .assignments import (
     Assignment,
     CallableWithMax1Parameter,
+    DictEnumAssignment,
     DictRecursiveAssignment,
+    EnumAssignment,
     FunctionAssignment,
+    ListEnumAssignment,
     ListRecursiveAssignment,
     RecursiveAssignment,
     SimpleAssignment,
-    get_var_name,
+    Variables,
 )
 from .implementations.base import ClassMeta, FieldMeta
 
@@ -100,68 +103,157 @@ class AssignmentOptions:
         )
 
 
+# generates the code of the nested mapper between the two classes (using variables derived from the variables of the
+# parent mapping), so that it can be inlined, returns None if the nested mapper can't be inlined
+Inliner = Callable[[Any, Any, Variables], Optional["MappingMethodSourceCode"]]
+
+
 class MappingMethodSourceCode:
     """Source code of the mapping method"""
 
     AssignmentClasses: List[Type[Assignment]] = [
         SimpleAssignment,
+        EnumAssignment,
+        ListEnumAssignment,
+        DictEnumAssignment,
         RecursiveAssignment,
         ListRecursiveAssignment,
         DictRecursiveAssignment,
     ]
 
-    def __init__(self, source_cls: ClassMeta, target_cls: ClassMeta) -> None:
+    def __init__(
+        self,
+        source_cls: ClassMeta,
+        target_cls: ClassMeta,
+        variables: Variables = Variables(),
+        inliner: Optional[Inliner] = None,
+    ) -> None:
+        """
+        :param variables: names of the variables in the generated code
+        :param inliner: if given, the code of nested mappers gets inlined instead of calling their mapper methods
+        """
         self.source_cls = source_cls
         self.target_cls = target_cls
-        self.function = cg.Function(
-            "convert",
-            args="self, extra: dict",
-            return_type=self.target_cls.name,
-            body=cg.Block(cg.Assignment(name="d", rhs="{}")),
-        )
-        self.methods: Dict[str, Callable] = {}
-
-    @classmethod
-    def _get_asssigment(cls, target: FieldMeta, source: FieldMeta) -> Optional[Assignment]:
-        for AssignmentCls in cls.AssignmentClasses:
-            if (assignment := AssignmentCls(source=source, target=target)).applicable():
+        self.variables = variables
+        self.inliner = inliner
+        # statements that compute the values, and set the conditional fields in the dictionary `d`
+        self.body = cg.Block()
+        # keyword arguments for the constructor call, for the fields that are always set
+        self.arguments: Dict[str, str] = {}
+        self.uses_dict = False
+        # the keys that the conditional fields can set in the dictionary `d`
+        self.dict_keys: List[str] = []
+        # the explicitly set fields of the source object are read once into a local variable, if any field needs them
+        self.uses_fields_set = False
+        # if the code reads the `extra` dictionary (directly, or by passing it to nested mappers)
+        self.uses_extra = False
+
+    def _get_asssigment(
+        self, target: FieldMeta, source: FieldMeta, variables: Optional[Variables] = None
+    ) -> Optional[Assignment]:
+        variables = variables or self.variables
+        for AssignmentCls in self.AssignmentClasses:
+            if (assignment := AssignmentCls(source=source, target=target, variables=variables)).applicable():
                 return assignment
         return None
 
+    def _reads_source_repeatedly(self, source: FieldMeta, assignment: Assignment, options: AssignmentOptions) -> bool:
+        """Whether the code for an Optional source field reads the field more than once (in the ``None`` check and
+        in the right side), so that it's worth reading it once into a local variable"""
+        if not source.allow_none or self.variables.columns:
+            return False
+        return options.only_if_not_None or assignment.right_side() != self.variables.source(source)
+
     def _field_assignment(
         self,
         source: FieldMeta,
         target: FieldMeta,
         right_side: str,
         options: AssignmentOptions,
-    ) -> cg.Statement:
+        setup: Sequence[cg.Statement] = (),
+        variables: Optional[Variables] = None,
+    ) -> None:
         """Generate code for setting the target field to the right side.
         Only do it for a couple of conditions.
 
+        If the field is always set, the value is passed directly as keyword argument to the constructor
+        (or via a local variable if it needs some statements to compute it).
+        Otherwise the value is stored in the dictionary ``d``, which is unpacked in the constructor call.
+
         :param right_side: some expression (code) that will be assigned to the target if conditions allow it
+        :param setup: statements that need to run before the right side can be evaluated
+        :param variables: the variables used by the right side, if they differ from the variables of the mapping
+            (e.g. if the source field is read from a local variable)
         """
-        if options.if_None and not options.only_if_not_None:
-            right_side = f"None if {get_var_name(source)} is None else {right_side}"
-        code: cg.Statement = self._get_assignment(target, right_side)
+        variables = variables or self.variables
+        variable_name = self.target_cls.get_assignment_name(target)
+        lookup = cg.DictLookup(dict_name=self.variables.d, key=variable_name)
+        code = self._assignment_code(lookup, source, right_side, options, setup, variables)
+        post_processed_code = code
+        if not self.variables.columns:
+            # rows of columns have no information about which fields were set, all of them are treated as set
+            post_processed_code = self.target_cls.post_process(
+                code,
+                source_cls=self.source_cls,
+                source_field=source,
+                target_field=target,
+                obj=self.variables.obj,
+                fields_set=self.variables.temporary("fields_set"),
+            )
 
-        if options.only_if_not_None:
-            code = cg.IfElse(condition=f"{get_var_name(source)} is not None", if_block=code)
+        if options.only_if_not_None or post_processed_code is not code:
+            self.uses_dict = True
+            self.dict_keys.append(variable_name)
+            self.uses_fields_set |= post_processed_code is not code
+            self.body.append(post_processed_code)
+        elif isinstance(code, cg.Assignment):
+            self.arguments[variable_name] = str(code.rhs)
+        else:
+            local_name = self.variables.local(target.name)
+            self.body.append(self._assignment_code(local_name, source, right_side, options, setup, variables))
+            self.arguments[variable_name] = local_name
 
-        code = self.target_cls.post_process(code, source_cls=self.source_cls, source_field=source, target_field=target)
-        return code
+    def _assignment_code(
+        self,
+        name: Union[str, cg.Expression],
+        source: FieldMeta,
+        right_side: str,
+        options: AssignmentOptions,
+        setup: Sequence[cg.Statement],
+        variables: Variables,
+    ) -> cg.Statement:
+        source_var_name = variables.source(source)
+        code: cg.Statement
+        if setup:
+            code = cg.Block(*setup, cg.Assignment(name=name, rhs=right_side))
+            if options.if_None and not options.only_if_not_None:
+                code = cg.IfElse(
+                    condition=f"{source_var_name} is None",
+                    if_block=cg.Assignment(name=name, rhs="None"),
+                    else_block=code,
+                )
+        else:
+            if options.if_None and not options.only_if_not_None:
+                right_side = f"None if {source_var_name} is None else {right_side}"
+            code = cg.Assignment(name=name, rhs=right_side)
 
-    def _get_assignment(self, target: FieldMeta, right_side: str) -> cg.Assignment:
-        variable_name = self.target_cls.get_assignment_name(target)
-        lookup = cg.DictLookup(dict_name="d", key=variable_name)
-        return cg.Assignment(name=lookup, rhs=right_side)
+        if options.only_if_not_None:
+            code = cg.IfElse(condition=f"{source_var_name} is not None", if_block=code)
+        if source_var_name != (attribute := self.variables.source(source)):
+            code = cg.Block(cg.Assignment(name=source_var_name, rhs=attribute), code)
+        return code
 
     def add_mapping(self, target: FieldMeta, source: Union[FieldMeta, Callable]) -> None:
         if callable(source):
             function_assignment = FunctionAssignment(
-                function=source, target=target, methods=self.methods, target_cls_name=self.target_cls.name
+                function=source,
+                target=target,
+                target_cls_name=self.target_cls.name,
+                source_cls_alias_name=self.source_cls.alias_name,
+                target_cls_alias_name=self.target_cls.alias_name,
+                obj=None if self.variables.columns else self.variables.obj,
             )
-            right_side = function_assignment.right_side()
-            self.function.body.append(self._get_assignment(target, right_side))
+            self.arguments[self.target_cls.get_assignment_name(target)] = function_assignment.right_side()
         else:
             assert isinstance(source, FieldMeta)
 
@@ -169,13 +261,35 @@ class MappingMethodSourceCode:
                 source_cls=self.source_cls, target_cls=self.target_cls, source=source, target=target
             )
             if assignment := self._get_asssigment(source=source, target=target):
-                self.function.body.append(
-                    self._field_assignment(
-                        source=source,
-                        target=target,
-                        right_side=assignment.right_side(),
-                        options=options,
+                if self._reads_source_repeatedly(source, assignment, options):
+                    assignment = self._get_asssigment(
+                        source=source, target=target, variables=self.variables.load(source.name)
+                    )
+                    assert assignment is not None
+                setup: Sequence[cg.Statement] = ()
+                right_side = assignment.right_side()
+                if (
+                    self.inliner is not None
+                    and isinstance(assignment, RecursiveAssignment)
+                    and (nested := self.inliner(*assignment.item_types(), self.variables)) is not None
+                ):
+                    body, constructor_call = nested.construction()
+                    # the nested code gets its `extra` dictionary only if it reads it
+                    setup, right_side = assignment.inlined_right_side(
+                        variables=nested.variables if nested.uses_extra else nested.variables.without_extra(),
+                        body=body,
+                        constructor_call=constructor_call,
                     )
+                    self.uses_extra |= nested.uses_extra
+                elif isinstance(assignment, RecursiveAssignment):
+                    self.uses_extra |= self.variables.extra is not None
+                self._field_assignment(
+                    source=source,
+                    target=target,
+                    right_side=right_side,
+                    options=options,
+                    setup=setup,
+                    variables=assignment.variables,
                 )
             else:  # impossible
                 raise TypeError(f"{source} of '{self.source_cls.name}' cannot be converted to {target}")
@@ -186,11 +300,161 @@ class MappingMethodSourceCode:
             f"When mapping an object of '{self.source_cls.name}' to '{self.target_cls.name}' "
             f"the field '{variable_name}' needs to be provided in the `extra` dictionary"
         )
-        self.function.body.append(
-            cg.IfElse(condition=f'"{variable_name}" not in extra', if_block=cg.Raise(f'TypeError("{exception_msg}")'))
+        if self.variables.extra is None:
+            # without any `extra` dictionary the mapping can never succeed
+            self.body.append(cg.Raise(f'TypeError("{exception_msg}")'))
+            return
+        self.uses_extra = True
+        self.body.append(
+            cg.IfElse(
+                condition=f'"{variable_name}" not in {self.variables.extra}',
+                if_block=cg.Raise(f'TypeError("{exception_msg}")'),
+            )
+        )
+        self.arguments[variable_name] = f'{self.variables.extra}["{variable_name}"]'
+
+    def statements(self) -> List[cg.Statement]:
+        """The statements that need to run before the constructor call"""
+        statements: List[cg.Statement] = []
+        if self.uses_dict:
+            statements.append(cg.Assignment(name=self.variables.d, rhs="{}"))
+        if self.uses_fields_set:
+            fields_set = self.source_cls.fields_set(self.variables.obj)
+            statements.append(cg.Assignment(name=self.variables.temporary("fields_set"), rhs=fields_set))
+        return [*statements, *self.body.statements]
+
+    def construction(self) -> Tuple[List[cg.Statement], str]:
+        """All the statements for creating the target object, and the expression of the created object"""
+        statements, expression = self.target_cls.construct(
+            self.arguments,
+            self.variables.d if self.uses_dict else None,
+            variable=self.variables.temporary("new"),
+            d_keys=self.dict_keys,
+        )
+        return [*self.statements(), *statements], str(expression)
+
+    def function(self, name: str = "convert") -> cg.Function:
+        """
+        :param name: name of the function, the variant without extra gets the suffix ``_without_extra``
+        """
+        statements, expression = self.construction()
+        if self.variables.extra is None:
+            name, args = f"{name}_without_extra", "self"
+        else:
+            args = "self, extra: dict"
+        return cg.Function(
+            name,
+            args=args,
+            return_type=self.target_cls.name,
+            body=cg.Block(*statements, cg.Return(expression)),
+        )
+
+    def batch_function(self, name: str = "convert_many") -> cg.Function:
+        """Function that maps a whole batch of objects in a single loop, instead of calling ``convert`` per object.
+        The variant with extra expects two lists of the same length.
+
+        :param name: name of the function, the variant without extra gets the suffix ``_without_extra``
+        """
+        statements, expression = self.construction()
+        checks: List[cg.Statement] = []
+        if self.variables.extra is None:
+            name, args, loop_variables, iterable = f"{name}_without_extra", "objs", "self", "objs"
+        else:
+            args, loop_variables, iterable = "objs, extras", "self, extra", "zip(objs, extras)"
+            # `zip` would silently drop the surplus objects or extras (`strict=True` is only available since 3.10)
+            checks.append(
+                cg.IfElse(
+                    condition="len(objs) != len(extras)",
+                    if_block=cg.Raise('ValueError(f"Got {len(objs)} objects, but {len(extras)} extra dictionaries")'),
+                )
+            )
+        return cg.Function(
+            name,
+            args=args,
+            return_type=f"List[{self.target_cls.name}]",
+            body=cg.Block(
+                *checks,
+                cg.Assignment(name="result", rhs="[]"),
+                cg.Assignment(name="append", rhs="result.append"),
+                cg.For(
+                    variables=loop_variables,
+                    iterable=iterable,
+                    body=cg.Block(*statements, cg.ExpressionStatement(f"append({expression})")),
+                ),
+                cg.Return("result"),
+            ),
+        )
+
+    def columns_function(self, name: str = "convert_columns") -> Optional[cg.Function]:
+        """Function that maps a whole batch of objects into one list per target field (by field name), without
+        creating the target objects.
+        Returns ``None`` if not every target field is always passed to the constructor (e.g. fields that use their
+        default value), or if the construction can modify the values (e.g. ``__post_init__`` or validators), as the
+        values are then only known after creating the target objects.
+
+        :param name: name of the function
+        """
+        assert self.variables.extra is None, "the columns are only generated without the handling of `extra`"
+        names = {
+            field_name: self.target_cls.get_assignment_name(field)
+            for field_name, field in self.target_cls.fields.items()
+        }
+        if not self.target_cls.keeps_argument_values():
+            return None
+        if self.uses_dict or any(argument not in self.arguments for argument in names.values()):
+            return None
+
+        columns = {field_name: self.variables.temporary(f"column_{field_name}") for field_name in names}
+        setup: List[cg.Statement] = []
+        appends: List[cg.Statement] = []
+        for field_name, column in columns.items():
+            setup.append(cg.Assignment(name=column, rhs="[]"))
+            setup.append(cg.Assignment(name=f"{column}_append", rhs=f"{column}.append"))
+            appends.append(cg.ExpressionStatement(f"{column}_append({self.arguments[names[field_name]]})"))
+        result = ", ".join(f'"{field_name}": {column}' for field_name, column in columns.items())
+        return cg.Function(
+            name,
+            args="objs",
+            return_type="Dict[str, list]",
+            body=cg.Block(
+                *setup,
+                cg.For(
+                    variables=self.variables.obj,
+                    iterable="objs",
+                    body=cg.Block(*self.statements(), *appends) if appends else cg.ExpressionStatement("pass"),
+                ),
+                cg.Return(f"{{{result}}}"),
+            ),
+        )
+
+    def from_columns_function(self, name: str = "convert_from_columns") -> cg.Function:
+        """Function that maps a whole batch of rows, given as one sequence (column) per source field in the order of
+        the source fields, to target objects, without any source objects.
+
+        :param name: name of the function
+        """
+        assert self.variables.columns, "the code needs to be generated with the variables of the columns mode"
+        if not self.source_cls.fields:
+            raise ValueError(f"'{self.source_cls.name}' has no fields, that could be read from columns")
+        statements, expression = self.construction()
+        row = ", ".join(self.variables.source(field) for field in self.source_cls.fields.values())
+        if len(self.source_cls.fields) == 1:
+            row += ","
+        return cg.Function(
+            name,
+            args="columns",
+            return_type=f"List[{self.target_cls.name}]",
+            body=cg.Block(
+                cg.Assignment(name="result", rhs="[]"),
+                cg.Assignment(name="append", rhs="result.append"),
+                cg.For(
+                    variables=row,
+                    iterable="zip(*columns)",
+                    body=cg.Block(*statements, cg.ExpressionStatement(f"append({expression})")),
+                ),
+                cg.Return("result"),
+            ),
         )
-        self.function.body.append(self._get_assignment(target=target, right_side=f'extra["{variable_name}"]'))
 
     def __str__(self) -> str:
-        self.function.body.append(self.target_cls.return_statement())
-        return self.function.to_string(0)
+        return self.function().to_string(0)
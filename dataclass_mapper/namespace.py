@@ -1,12 +1,77 @@
+import re
 import sys
-from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Callable, Dict, ForwardRef, Optional, Set
+from weakref import ref
+
+from .utils import type_atoms
+
+# modules of the objects that can be used in type annotations besides classes, e.g. `List[int]` or `Optional[int]`
+_TYPING_MODULES = ("typing", "types", "typing_extensions")
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
+
+
+def _reference(value: Any) -> Optional[Callable[[], Any]]:
+    """Reference to a value of the local namespace, that might be needed to resolve a forward reference.
+    Classes are only referenced weakly, other objects used in type annotations (e.g. type aliases) are kept.
+    All other values (e.g. data) can't occur in type annotations, and are not referenced at all.
+    """
+    if isinstance(value, type):
+        return ref(value)
+    if type(value).__module__ in _TYPING_MODULES:
+        return _strong_reference(value)
+    return None
+
+
+def _strong_reference(value: Any) -> Callable[[], Any]:
+    return lambda: value
 
 
-@dataclass
 class Namespace:
-    locals: Dict[str, Any]
-    globals: Dict[str, Any]
+    """The namespace for resolving forward references in the type annotations.
+
+    The local variables of the defining function are not pinned: only the names that can occur in type annotations
+    are kept, and classes are only referenced weakly.
+    The names in the forward references of the mapped classes can be kept strongly with
+    ``keep_forward_references``, for mappings that are only compiled later.
+    """
+
+    def __init__(self, locals: Dict[str, Any], globals: Dict[str, Any]) -> None:
+        self.globals = globals
+        # None for the global scope of a module, where the locals are identical to the globals
+        self._locals: Optional[Dict[str, Callable[[], Any]]] = None
+        if locals is not globals:
+            self._locals = {
+                name: reference for name, value in locals.items() if (reference := _reference(value)) is not None
+            }
+
+    def keep_forward_references(self, *classes: Any) -> None:
+        """Keeps the local values strongly, whose names occur in the forward references of the classes' annotations
+        (e.g. ``"Child"`` or ``List["Child"]``), so that they can still be resolved after the defining function
+        returned"""
+        if self._locals is None:
+            return
+        for name in _forward_reference_names(classes) & self._locals.keys():
+            if (value := self._locals[name]()) is not None:
+                self._locals[name] = _strong_reference(value)
+
+    @property
+    def locals(self) -> Dict[str, Any]:
+        if self._locals is None:
+            return self.globals
+        return {name: value for name, reference in self._locals.items() if (value := reference()) is not None}
+
+
+def _forward_reference_names(classes: Any) -> Set[str]:
+    names: Set[str] = set()
+    for cls in classes:
+        for base in getattr(cls, "__mro__", (cls,)):
+            for annotation in base.__dict__.get("__annotations__", {}).values():
+                for atom in type_atoms(annotation):
+                    if isinstance(atom, ForwardRef):
+                        atom = atom.__forward_arg__
+                    if isinstance(atom, str):
+                        names.update(_IDENTIFIER.findall(atom))
+    return names
 
 
 def get_namespace(parent_depth: int = 2) -> Namespace:
@@ -0,0 +1,133 @@
+"""Peephole optimizations of the generated code.
+
+The pass works on the statement tree of the ``code_generator``, before it gets converted to a string.
+The expressions in the tree are mostly strings already, so the expression rewrites only match the exact patterns
+that the assignments generate.
+"""
+import re
+from typing import List, Optional, Set
+
+from . import code_generator as cg
+
+# `None if x is None else x` is just `x`, for variables and attribute loads (e.g. Optional -> Optional fields),
+# as long as the conditional expression is the complete argument / value
+_NONE_IF_NONE = re.compile(
+    r"(?:^|(?<=[=(,:\s]))None if (?P<value>[A-Za-z_][\w.]*) is None else (?P=value)(?=\s*(?:[,)}\]]|$))"
+)
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
+
+
+def optimize_expression(expression: str) -> str:
+    return _NONE_IF_NONE.sub(lambda match: match.group("value"), expression)
+
+
+def _assigned_names(statement: cg.Statement) -> Set[str]:
+    """The variables that the statement assigns (or modifies with an item assignment)"""
+    if isinstance(statement, cg.Assignment):
+        match = _IDENTIFIER.match(str(statement.name))
+        return {match.group()} if match else set()
+    if isinstance(statement, cg.Block):
+        return {name for child in statement.statements for name in _assigned_names(child)}
+    if isinstance(statement, cg.IfElse):
+        names = _assigned_names(statement.if_block)
+        if statement.else_block is not None:
+            names |= _assigned_names(statement.else_block)
+        return names
+    if isinstance(statement, cg.For):
+        return {*_IDENTIFIER.findall(statement.variables), *_assigned_names(statement.body)}
+    return set()
+
+
+def _is_empty(statement: cg.Statement) -> bool:
+    return isinstance(statement, cg.Block) and all(_is_empty(child) for child in statement.statements)
+
+
+def _block_statements(statement: cg.Statement) -> List[cg.Statement]:
+    return list(statement.statements) if isinstance(statement, cg.Block) else [statement]
+
+
+def _optimize_block(block: cg.Block) -> cg.Block:
+    """Optimizes the statements, flattens nested blocks, and merges adjacent conditions on the same variables"""
+    statements: List[cg.Statement] = []
+    for statement in block.statements:
+        optimized = optimize(statement)
+        if optimized is None:
+            continue
+        if isinstance(optimized, cg.Block):
+            statements.extend(optimized.statements)
+            continue
+        previous = statements[-1] if statements else None
+        if (
+            isinstance(previous, cg.IfElse)
+            and isinstance(optimized, cg.IfElse)
+            and previous.else_block is None
+            and optimized.else_block is None
+            and str(previous.condition) == str(optimized.condition)
+            # the first block must not change the value of the condition
+            and not _assigned_names(previous.if_block) & set(_IDENTIFIER.findall(str(previous.condition)))
+        ):
+            if_block = cg.Block(*_block_statements(previous.if_block), *_block_statements(optimized.if_block))
+            statements[-1] = cg.IfElse(condition=previous.condition, if_block=if_block)
+            continue
+        statements.append(optimized)
+    return cg.Block(*statements)
+
+
+def _optimize_if_else(statement: cg.IfElse) -> Optional[cg.Statement]:
+    condition = optimize_expression(str(statement.condition))
+    if_block = optimize(statement.if_block)
+    else_block = None if statement.else_block is None else optimize(statement.else_block)
+    if else_block is not None and _is_empty(else_block):
+        else_block = None
+
+    # dead branches
+    if condition == "True":
+        return if_block
+    if condition == "False":
+        return else_block
+    if if_block is None or _is_empty(if_block):
+        if else_block is None:
+            return None
+        if_block, else_block, condition = else_block, None, f"not ({condition})"
+    # both branches do the same (the conditions of the generated code have no side effects)
+    if else_block is not None and if_block.to_string(0) == else_block.to_string(0):
+        return if_block
+    # `if c: if c: ...`
+    if (
+        else_block is None
+        and isinstance(if_block, cg.IfElse)
+        and if_block.else_block is None
+        and str(if_block.condition) == condition
+    ):
+        if_block = if_block.if_block
+    return cg.IfElse(condition=condition, if_block=if_block, else_block=else_block)
+
+
+def optimize(statement: cg.Statement) -> Optional[cg.Statement]:
+    """Returns the optimized statement, or ``None`` if the statement can be removed"""
+    if isinstance(statement, cg.Function):
+        return cg.Function(
+            statement.name, args=statement.args, return_type=statement.return_type, body=_optimize_block(statement.body)
+        )
+    if isinstance(statement, cg.Block):
+        return _optimize_block(statement)
+    if isinstance(statement, cg.IfElse):
+        return _optimize_if_else(statement)
+    if isinstance(statement, cg.For):
+        body = optimize(statement.body)
+        if body is None or _is_empty(body):
+            body = cg.ExpressionStatement("pass")
+        return cg.For(variables=statement.variables, iterable=statement.iterable, body=body)
+    if isinstance(statement, cg.Assignment):
+        return cg.Assignment(name=statement.name, rhs=optimize_expression(str(statement.rhs)))
+    if isinstance(statement, cg.ExpressionStatement):
+        return cg.ExpressionStatement(optimize_expression(str(statement.expression)))
+    if isinstance(statement, cg.Return):
+        return cg.Return(optimize_expression(str(statement.rhs)))
+    return statement
+
+
+def optimize_function(function: cg.Function) -> cg.Function:
+    optimized = optimize(function)
+    assert isinstance(optimized, cg.Function)
+    return optimized
@@ -0,0 +1,75 @@
+"""Mapping batches in worker processes.
+
+The generated mapper functions can be pickled by reference (their qualified name points to the attribute of the
+source class), so the workers only receive the name of the mapper function and the chunks of objects.
+They find the mapper function by importing the module of the source class, which defines the mapping again.
+"""
+import os
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from importlib import import_module
+from itertools import chain
+from math import ceil
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+# number of chunks per worker, if no chunk size is given (more chunks than workers balance uneven chunks)
+_CHUNKS_PER_WORKER = 4
+
+
+def _import_modules(modules: Sequence[str]) -> None:
+    """Initializer of the worker processes, imports the modules with the mappings once at startup"""
+    for module in modules:
+        import_module(module)
+
+
+def _chunks(items: List[Any], chunksize: int) -> List[List[Any]]:
+    return [items[start : start + chunksize] for start in range(0, len(items), chunksize)]
+
+
+def map_chunks(
+    convert_many: Callable,
+    objs: List[Any],
+    extras: Optional[List[Dict[str, Any]]],
+    modules: Sequence[str],
+    executor: Union[str, Executor],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[Any]:
+    """Splits the objects (and the ``extra`` dictionaries) into chunks, and maps them with the executor
+
+    :param convert_many: the mapper function for a batch of objects (with or without ``extras``)
+    :param modules: the modules that define the mapping, that the worker processes import at startup
+    :param executor: ``"process"`` for creating a process pool for the batch, or an existing executor
+    :param workers: number of worker processes (by default the number of CPUs), for an existing executor it's only
+        used for computing the chunk size
+    :param chunksize: number of objects per chunk (by default the objects are split into a few chunks per worker)
+    """
+    if not isinstance(executor, Executor) and executor != "process":
+        raise ValueError(f"Unknown executor {executor!r}, only 'process' or an Executor instance are supported")
+    if workers is not None and workers < 1:
+        raise ValueError("`workers` must be at least 1")
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("`chunksize` must be at least 1")
+    # the chunks are zipped, so the surplus objects or extras would be silently dropped
+    if extras is not None and len(extras) != len(objs):
+        raise ValueError(f"Got {len(objs)} objects, but {len(extras)} extra dictionaries")
+
+    if not isinstance(executor, ThreadPoolExecutor):
+        try:
+            pickle.dumps(convert_many)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise ValueError(
+                f"The mapper function '{convert_many.__qualname__}' can't be sent to worker processes, "
+                "the classes of the mapping need to be defined at the top level of a module"
+            ) from e
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = chunksize or max(1, ceil(len(objs) / (workers * _CHUNKS_PER_WORKER)))
+    arguments = [_chunks(objs, chunksize)]
+    if extras is not None:
+        arguments.append(_chunks(extras, chunksize))
+
+    if isinstance(executor, Executor):
+        return list(chain.from_iterable(executor.map(convert_many, *arguments)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_import_modules, initargs=(modules,)) as pool:
+        return list(chain.from_iterable(pool.map(convert_many, *arguments)))
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, cast
+from weakref import WeakSet
+
+from .implementations.base import ClassMeta
+from .utils import type_atoms
+
+# the compiled mappers are stored in the source classes, so that they can be garbage collected together
+COMPILED_MAPPERS_ATTRIBUTE = "__dataclass_mapper_compiled_mappers__"
+
+_source_classes: "WeakSet[Any]" = WeakSet()
+
+
+class MapperFunctions(NamedTuple):
+    """The functions of one mapper, a variant with and without the handling of the ``extra`` dictionaries"""
+
+    convert: Callable
+    convert_many: Callable
+    convert_without_extra: Callable
+    convert_many_without_extra: Callable
+
+
+@dataclass
+class CompiledMapper:
+    """Everything that was necessary for generating the code of one mapper"""
+
+    source_cls: Any
+    target_cls: Any
+    mapping: Dict[str, Any]
+    source_cls_meta: ClassMeta
+    target_cls_meta: ClassMeta
+    inline: bool = False
+
+
+def register_compiled_mapper(compiled_mapper: CompiledMapper) -> None:
+    source_cls = compiled_mapper.source_cls
+    if COMPILED_MAPPERS_ATTRIBUTE not in source_cls.__dict__:
+        setattr(source_cls, COMPILED_MAPPERS_ATTRIBUTE, {})
+    source_cls.__dict__[COMPILED_MAPPERS_ATTRIBUTE][compiled_mapper.target_cls] = compiled_mapper
+    _source_classes.add(source_cls)
+
+
+def get_compiled_mapper(source_cls: Any, target_cls: Any) -> Optional[CompiledMapper]:
+    """The compiled mapper between the two classes, if it exists and is already compiled"""
+    compiled_mappers = getattr(source_cls, "__dict__", {}).get(COMPILED_MAPPERS_ATTRIBUTE, {})
+    return cast(Optional[CompiledMapper], compiled_mappers.get(target_cls))
+
+
+def all_compiled_mappers() -> Iterator[CompiledMapper]:
+    for source_cls in list(_source_classes):
+        yield from source_cls.__dict__.get(COMPILED_MAPPERS_ATTRIBUTE, {}).values()
+
+
+def nested_compiled_mappers(source_cls_meta: ClassMeta, target_cls_meta: ClassMeta) -> List[CompiledMapper]:
+    """The compiled mappers between the types of the fields of the two classes, and recursively between the types
+    of the fields of those classes"""
+    nested: List[CompiledMapper] = []
+    seen: Set[Tuple[Any, Any]] = set()
+    pending = [(source_cls_meta, target_cls_meta)]
+    while pending:
+        source_meta, target_meta = pending.pop()
+        source_types = {atom for field in source_meta.fields.values() for atom in type_atoms(field.type)}
+        target_types = {atom for field in target_meta.fields.values() for atom in type_atoms(field.type)}
+        for source_type in source_types:
+            for target_type in target_types:
+                if (source_type, target_type) in seen:
+                    continue
+                seen.add((source_type, target_type))
+                if (compiled_mapper := get_compiled_mapper(source_type, target_type)) is not None:
+                    nested.append(compiled_mapper)
+                    pending.append((compiled_mapper.source_cls_meta, compiled_mapper.target_cls_meta))
+    return nested
@@ -0,0 +1,91 @@
+"""Mapping the items of async iterables (e.g. database cursors or message consumers) in an asyncio event loop.
+
+The items are mapped in chunks with the generated batch mappers, and the control is given back to the event loop
+after every chunk, so that mapping large result sets doesn't block other coroutines.
+"""
+import asyncio
+from contextlib import suppress
+from typing import Any, AsyncIterable, AsyncIterator, List, Type, TypeVar
+
+from .mapper import map_many
+
+T = TypeVar("T")
+
+# marks the end of the source in the queue of prefetched chunks
+_DONE = object()
+
+
+class _Failure:
+    """An exception of the source, that gets passed through the queue of prefetched chunks"""
+
+    def __init__(self, exception: Exception) -> None:
+        self.exception = exception
+
+
+async def _chunks(items: AsyncIterable[Any], size: int) -> AsyncIterator[List[Any]]:
+    chunk: List[Any] = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _prefetched(chunks: AsyncIterator[List[Any]], queue_size: int) -> AsyncIterator[List[Any]]:
+    """Reads the chunks in a separate task into a bounded queue, while the previous chunks get mapped.
+    The task stops reading from the source while the queue is full (backpressure)."""
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=queue_size)
+
+    async def produce() -> None:
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(_Failure(e))
+        else:
+            await queue.put(_DONE)
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while (item := await queue.get()) is not _DONE:
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+async def amap_iter(
+    items: AsyncIterable[Any], TargetCls: Type[T], chunk: int = 1000, queue_size: int = 0
+) -> AsyncIterator[T]:
+    """Maps the items of the async iterable to objects of type ``TargetCls``, and yields them.
+    The items are mapped in chunks (like with ``map_many``), and after each chunk the control is given back to the
+    event loop.
+    The items can be of different classes, items with different mappings are mapped in one batch per mapping,
+    and the order of the items is kept.
+
+    :param items: the async iterable with the source objects, e.g. a database cursor
+    :param TargetCls: the (target) class that you want to map to.
+    :param chunk: number of items that get mapped at once
+    :param queue_size: if greater than zero, the next chunks are already read from the source by a separate task,
+        while the current chunk gets mapped and consumed.
+        At most ``queue_size`` chunks are buffered, afterwards the reading pauses until the consumer catches up.
+        By default the source is only read on demand.
+    :return: async iterator over the mapped objects
+    """
+    if chunk < 1:
+        raise ValueError("`chunk` must be at least 1")
+    if queue_size < 0:
+        raise ValueError("`queue_size` must not be negative")
+
+    chunks = _chunks(items, chunk)
+    if queue_size > 0:
+        chunks = _prefetched(chunks, queue_size)
+    async for objs in chunks:
+        for target in map_many(objs, TargetCls):
+            yield target
+        await asyncio.sleep(0)
@@ -1,5 +1,10 @@
 import sys
-from typing import Any, Union, get_args, get_origin
+from hashlib import sha1
+from typing import Any, Iterator, Union, get_args, get_origin
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+_class_identifiers: "WeakKeyDictionary[Any, str]" = WeakKeyDictionary()
+_identifier_classes: "WeakValueDictionary[str, Any]" = WeakValueDictionary()
 
 
 def is_union_type(type_: Any) -> bool:
@@ -12,6 +17,15 @@ def is_union_type(type_: Any) -> bool:
         return origin in (Union, UnionType)
 
 
+def type_atoms(type_: Any) -> Iterator[Any]:
+    """All the types that occur in a (generic) type, e.g. ``int`` and ``str`` for ``Dict[str, List[int]]``"""
+    if args := get_args(type_):
+        for arg in args:
+            yield from type_atoms(arg)
+    else:
+        yield type_
+
+
 def is_optional(type_: Any) -> bool:
     # requires Python 3.8
     return is_union_type(type_) and type(None) in get_args(type_)
@@ -37,3 +51,32 @@ def is_union_subtype(type1: Any, type2: Any) -> bool:
             return type1 in get_args(type2)
     else:
         return bool(type1 == type2)
+
+
+def get_class_identifier(cls: Any) -> str:
+    """Computes a name for the class, that is unique in the current process.
+    It only depends on the name and the location (module and qualified name) of the class,
+    so it's also identical in different processes (necessary for caching generated code).
+    """
+    try:
+        return _class_identifiers[cls]
+    except KeyError:
+        pass
+    except TypeError:
+        raise TypeError("Bad Type")
+
+    try:
+        location = f"{cls.__module__}.{cls.__qualname__}"
+        identifier = f"{cls.__name__}_{sha1(location.encode()).hexdigest()[:10]}"
+    except AttributeError:
+        raise TypeError("Bad Type")
+
+    # classes with the same location (e.g. classes created in a factory function) get an additional counter
+    unique_identifier, cnt = identifier, 1
+    while _identifier_classes.get(unique_identifier, cls) is not cls:
+        cnt += 1
+        unique_identifier = f"{identifier}_{cnt}"
+
+    _identifier_classes[unique_identifier] = cls
+    _class_identifiers[cls] = unique_identifier
+    return unique_identifier
@@ -153,6 +153,24 @@ def test_pydantic_with_alias():
     assert map_to(foo, BarWithAlias) == bar
 
 
+def test_pydantic_with_alias_that_is_no_identifier():
+    class BarWithAlias(BaseModel):
+        x: int = Field(alias="x-x")
+        y: int = Field(alias="from")
+
+        @validator("x")
+        def val_x(cls, v):
+            return v
+
+    @mapper(BarWithAlias)
+    class Foo(BaseModel):
+        x: int
+        y: int
+
+    bar = BarWithAlias(**{"x-x": 42, "from": 1})
+    assert map_to(Foo(x=42, y=1), BarWithAlias) == bar
+
+
 def test_pydantic_with_alias_allow_population_with_fields():
     class BarWithAliasAllowFieldPopulation(BaseModel):
         x: int = Field(alias="x x")
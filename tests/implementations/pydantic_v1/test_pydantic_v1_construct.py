@@ -0,0 +1,92 @@
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel, Field, PrivateAttr
+
+from dataclass_mapper import init_with_default, inspect_mapper, map_to, mapper
+from dataclass_mapper.implementations.pydantic_v1 import pydantic_version
+
+if pydantic_version() >= (2, 0, 0):
+    pytest.skip("V1 construct", allow_module_level=True)
+
+
+def assert_same_object(mapped: Any, expected: Any) -> None:
+    """The object is identical to the one created by `construct`, including the order of the fields"""
+    assert type(mapped) is type(expected)
+    assert list(mapped.__dict__.items()) == list(expected.__dict__.items())
+    assert mapped.__fields_set__ == expected.__fields_set__
+    assert repr(mapped) == repr(expected)
+
+
+class Target(BaseModel):
+    a: Optional[int] = None
+    b: int
+    c: Optional[str] = "c"
+    d: List[int] = Field(default_factory=list)
+    e: Dict[str, int] = {}
+    f: tuple = (1, 2)
+    g: int = 0
+
+
+@mapper(Target, {"e": init_with_default(), "f": init_with_default(), "g": init_with_default()})
+class Source(BaseModel):
+    a: Optional[int] = None
+    b: int
+    c: Optional[str] = None
+    d: List[int] = []
+
+
+@pytest.mark.parametrize(
+    "source, values",
+    [
+        (Source(b=1), dict(b=1, d=[])),
+        (Source(a=None, b=1, c="x", d=[1]), dict(a=None, b=1, c="x", d=[1])),
+        (Source(a=2, b=1), dict(a=2, b=1, d=[])),
+        (Source(b=1, c=None), dict(b=1, c=None, d=[])),
+    ],
+)
+def test_same_object_as_construct(source: Source, values: Dict[str, Any]) -> None:
+    assert_same_object(map_to(source, Target), Target.construct(**values))
+
+
+def test_defaults_are_not_shared() -> None:
+    first, second = map_to(Source(b=1), Target), map_to(Source(b=2), Target)
+    assert first.e == {} and first.e is not second.e
+    assert first.d is not second.d
+    assert first.__fields_set__ is not second.__fields_set__
+
+
+def test_private_attributes() -> None:
+    class PrivateTarget(BaseModel):
+        x: int
+        _cache: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    @mapper(PrivateTarget)
+    class PrivateSource(BaseModel):
+        x: int
+
+    mapped = map_to(PrivateSource(x=1), PrivateTarget)
+    assert_same_object(mapped, PrivateTarget.construct(x=1))
+    assert mapped._cache == {}
+
+
+def test_alias() -> None:
+    class AliasTarget(BaseModel):
+        x: int = Field(alias="xxx")
+        y: int = Field(1, alias="yyy")
+
+    @mapper(AliasTarget, {"y": init_with_default()})
+    class AliasSource(BaseModel):
+        x: int
+
+    mapped = map_to(AliasSource(x=1), AliasTarget)
+    assert_same_object(mapped, AliasTarget.construct(x=1))
+    assert mapped.dict(by_alias=True) == {"xxx": 1, "yyy": 1}
+
+
+def test_only_conditional_fields_are_looked_up_in_d():
+    code = inspect_mapper(Source, Target)
+    assert 'if "a" in d:' in code
+    assert 'if "c" in d:' in code
+    for name in "befg":
+        assert f'"{name}" in d' not in code
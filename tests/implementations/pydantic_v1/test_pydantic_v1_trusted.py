@@ -0,0 +1,57 @@
+from typing import Iterator
+
+import pytest
+from pydantic import BaseModel, Field
+
+from dataclass_mapper import enable_trusted, map_to, mapper
+from dataclass_mapper.implementations.pydantic_v1 import pydantic_version
+
+if pydantic_version() >= (2, 0, 0):
+    pytest.skip("V1 validators syntax", allow_module_level=True)
+
+from pydantic import validator
+
+
+class Animal(BaseModel):
+    name: str
+    greeting: str = Field(alias="greetingSound")
+
+    @validator("greeting")
+    def repeat_greeting(cls, v: str) -> str:
+        return " ".join([v] * 3)
+
+
+@pytest.fixture
+def trusted_disabled() -> Iterator[None]:
+    enable_trusted(False)
+    yield
+    enable_trusted()
+
+
+def test_trusted_skips_validators() -> None:
+    @mapper(Animal, trusted=True)
+    class Pet(BaseModel):
+        name: str
+        greeting: str
+
+    animal = map_to(Pet(name="Rocky", greeting="Woof"), Animal)
+    assert animal.greeting == "Woof"
+    assert animal.__fields_set__ == {"name", "greeting"}
+
+
+def test_not_trusted_by_default() -> None:
+    @mapper(Animal)
+    class Pet(BaseModel):
+        name: str
+        greeting: str
+
+    assert map_to(Pet(name="Rocky", greeting="Woof"), Animal).greeting == "Woof Woof Woof"
+
+
+def test_trusted_mode_disabled(trusted_disabled: None) -> None:
+    @mapper(Animal, trusted=True)
+    class Pet(BaseModel):
+        name: str
+        greeting: str
+
+    assert map_to(Pet(name="Rocky", greeting="Woof"), Animal).greeting == "Woof Woof Woof"
@@ -3,6 +3,7 @@ from typing import List
 import pytest
 from pydantic import BaseModel, Field
 
+from dataclass_mapper import map_many, map_to_columns, mapper
 from dataclass_mapper.implementations.pydantic_v1 import PydanticV1ClassMeta, pydantic_version
 from dataclass_mapper.mapper import get_class_meta
 from dataclass_mapper.namespace import Namespace
@@ -103,3 +104,22 @@ def test_pydantic_has_validators():
     assert not PydanticV1ClassMeta.has_validators(Pydantic8), "max_length is not a validator"
     assert field_x_meta.type is not str, "max_length changes the type of the field from str"
     assert field_x_meta.type is not ConstrainedStr, "to ConstrainedStr"
+
+
+def test_map_to_columns_runs_validators():
+    pytest.importorskip("numpy")
+
+    class UpperTarget(BaseModel):
+        name: str
+
+        @validator("name")
+        def upper_name(cls, v):
+            return v.upper()
+
+    @mapper(UpperTarget)
+    class LowerSource(BaseModel):
+        name: str
+
+    sources = [LowerSource(name="a"), LowerSource(name="b")]
+    assert map_to_columns(sources, UpperTarget)["name"].tolist() == ["A", "B"]
+    assert [target.name for target in map_many(sources, UpperTarget)] == ["A", "B"]
@@ -0,0 +1,153 @@
+# mypy: disable-error-code="attr-defined"
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel, Field, PrivateAttr
+
+from dataclass_mapper import init_with_default, inspect_mapper, map_to, mapper
+from dataclass_mapper.implementations import pydantic_v2
+from dataclass_mapper.implementations.pydantic_v1 import pydantic_version
+
+if pydantic_version() < (2, 0, 0):
+    pytest.skip("V2 model_construct", allow_module_level=True)
+
+from pydantic import ConfigDict
+
+
+def assert_same_object(mapped: Any, expected: Any) -> None:
+    """The object is identical to the one created by `model_construct`, including the order of the fields"""
+    assert type(mapped) is type(expected)
+    assert list(mapped.__dict__.items()) == list(expected.__dict__.items())
+    assert mapped.model_fields_set == expected.model_fields_set
+    assert mapped.__pydantic_extra__ == expected.__pydantic_extra__
+    # a custom `model_post_init` doesn't initialize the private attributes
+    assert getattr(mapped, "__pydantic_private__", "unset") == getattr(expected, "__pydantic_private__", "unset")
+    assert repr(mapped) == repr(expected)
+
+
+class Target(BaseModel):
+    a: Optional[int] = None
+    b: int
+    c: Optional[str] = "c"
+    d: List[int] = Field(default_factory=list)
+    e: Dict[str, int] = {}
+    f: tuple = (1, 2)
+    g: int = 0
+
+
+@mapper(Target, {"e": init_with_default(), "f": init_with_default(), "g": init_with_default()})
+class Source(BaseModel):
+    a: Optional[int] = None
+    b: int
+    c: Optional[str] = None
+    d: List[int] = []
+
+
+@pytest.mark.parametrize(
+    "source, values",
+    [
+        (Source(b=1), dict(b=1, d=[])),
+        (Source(a=None, b=1, c="x", d=[1]), dict(a=None, b=1, c="x", d=[1])),
+        (Source(a=2, b=1), dict(a=2, b=1, d=[])),
+        (Source(b=1, c=None), dict(b=1, c=None, d=[])),
+    ],
+)
+def test_same_object_as_model_construct(source: Source, values: Dict[str, Any]) -> None:
+    assert_same_object(map_to(source, Target), Target.model_construct(**values))
+
+
+def test_defaults_are_not_shared() -> None:
+    first, second = map_to(Source(b=1), Target), map_to(Source(b=2), Target)
+    assert first.e == {} and first.e is not second.e
+    assert first.d is not second.d
+    assert first.model_fields_set is not second.model_fields_set
+
+
+def test_extra_allowed() -> None:
+    class ExtraTarget(BaseModel):
+        x: int
+        y: int = 1
+
+        model_config = ConfigDict(extra="allow")
+
+    @mapper(ExtraTarget, {"y": init_with_default()})
+    class ExtraSource(BaseModel):
+        x: int
+
+    assert_same_object(map_to(ExtraSource(x=1), ExtraTarget), ExtraTarget.model_construct(x=1))
+
+
+def test_private_attributes() -> None:
+    class PrivateTarget(BaseModel):
+        x: int
+        _cache: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    @mapper(PrivateTarget)
+    class PrivateSource(BaseModel):
+        x: int
+
+    mapped = map_to(PrivateSource(x=1), PrivateTarget)
+    assert_same_object(mapped, PrivateTarget.model_construct(x=1))
+    assert mapped._cache == {}
+
+
+def test_model_post_init() -> None:
+    class PostInitTarget(BaseModel):
+        x: int
+        calls: List[Any] = []
+
+        def model_post_init(self, __context: Any) -> None:
+            self.calls.append(__context)
+
+    @mapper(PostInitTarget, {"calls": init_with_default()})
+    class PostInitSource(BaseModel):
+        x: int
+
+    mapped = map_to(PostInitSource(x=1), PostInitTarget)
+    assert_same_object(mapped, PostInitTarget.model_construct(x=1))
+    assert mapped.calls == [None]
+
+
+def test_alias() -> None:
+    class AliasTarget(BaseModel):
+        x: int = Field(alias="xxx")
+        y: int = Field(1, alias="yyy")
+
+    @mapper(AliasTarget, {"y": init_with_default()})
+    class AliasSource(BaseModel):
+        x: int
+
+    mapped = map_to(AliasSource(x=1), AliasTarget)
+    assert_same_object(mapped, AliasTarget.model_construct(xxx=1))  # type: ignore[call-arg]
+    assert mapped.model_dump(by_alias=True) == {"xxx": 1, "yyy": 1}
+
+
+def test_model_construct_for_untested_versions(monkeypatch):
+    monkeypatch.setattr(pydantic_v2, "pydantic_version", lambda: (2, 10, 0))
+
+    class NewTarget(BaseModel):
+        x: int
+        y: Optional[int] = 1
+
+    @mapper(NewTarget, {"y": init_with_default()})
+    class NewSource(BaseModel):
+        x: int
+
+    assert "model_construct" in inspect_mapper(NewSource, NewTarget)
+    assert_same_object(map_to(NewSource(x=1), NewTarget), NewTarget.model_construct(x=1))
+
+
+@pytest.mark.skipif(not pydantic_v2._supports_direct_construct(), reason="uses model_construct")
+def test_conditional_fields_are_checked_once():
+    code = inspect_mapper(Source, Target)
+    assert 'if "c" in d:' in code
+    assert "not in d" not in code
+
+
+@pytest.mark.skipif(not pydantic_v2._supports_direct_construct(), reason="uses model_construct")
+def test_only_conditional_fields_are_looked_up_in_d():
+    code = inspect_mapper(Source, Target)
+    assert 'if "a" in d:' in code
+    assert 'if "c" in d:' in code
+    for name in "befg":
+        assert f'"{name}" in d' not in code
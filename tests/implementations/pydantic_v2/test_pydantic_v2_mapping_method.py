@@ -47,8 +47,7 @@ def test_bypass_validators_option_for_pydantic() -> None:
     expected_code = prepare_expected_code(
         """
         def convert(self, extra: dict) -> "Target":
-            d = {}
-            return TargetAlias.model_construct(**d)
+            return TargetAlias.model_construct()
         """
     )
     assert str(code) == expected_code
@@ -72,8 +71,7 @@ def test_dont_bypass_validators_option_for_pydantic() -> None:
     expected_code = prepare_expected_code(
         """
         def convert(self, extra: dict) -> "Target":
-            d = {}
-            return TargetAlias(**d)
+            return TargetAlias()
         """
     )
     assert str(code) == expected_code
@@ -101,9 +99,7 @@ def test_pydantic_alias() -> None:
     expected_code = prepare_expected_code(
         """
         def convert(self, extra: dict) -> "Target":
-            d = {}
-            d["TARGET_VARIABLE_X"] = self.source_x
-            return TargetAlias(**d)
+            return TargetAlias(TARGET_VARIABLE_X=self.source_x)
         """
     )
     assert str(code) == expected_code
@@ -132,9 +128,7 @@ def test_pydantic_alias_allow_population_by_fields() -> None:
     expected_code = prepare_expected_code(
         """
         def convert(self, extra: dict) -> "Target":
-            d = {}
-            d["target_x"] = self.source_x
-            return TargetAlias(**d)
+            return TargetAlias(target_x=self.source_x)
         """
     )
     assert str(code) == expected_code
@@ -2,6 +2,7 @@
 import pytest
 from pydantic import BaseModel
 
+from dataclass_mapper import map_many, map_to_columns, mapper
 from dataclass_mapper.implementations.pydantic_v2 import PydanticV2ClassMeta, pydantic_version
 from dataclass_mapper.namespace import Namespace
 
@@ -84,3 +85,22 @@ def test_pydantic_has_validators():
     #
     # assert PydanticV2ClassMeta.has_validators(Pydantic8), "max_length is a validator in v2"
     # assert not PydanticV2ClassMeta.from_clazz(Pydantic8, namespace=empty_namespace).use_construct
+
+
+def test_map_to_columns_runs_validators():
+    pytest.importorskip("numpy")
+
+    class UpperTarget(BaseModel):
+        name: str
+
+        @field_validator("name")
+        def upper_name(cls, v):
+            return v.upper()
+
+    @mapper(UpperTarget)
+    class LowerSource(BaseModel):
+        name: str
+
+    sources = [LowerSource(name="a"), LowerSource(name="b")]
+    assert map_to_columns(sources, UpperTarget)["name"].tolist() == ["A", "B"]
+    assert [target.name for target in map_many(sources, UpperTarget)] == ["A", "B"]
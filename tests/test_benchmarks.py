@@ -0,0 +1,14 @@
+import pytest
+
+from benchmarks.__main__ import check, main
+from benchmarks.cases import all_cases
+
+
+@pytest.mark.parametrize("case", all_cases(), ids=lambda case: f"{case.name} ({case.backend})")
+def test_benchmark_case_matches_handwritten_code(case):
+    check(case)
+
+
+def test_run_benchmarks(capsys):
+    main(["--number", "1", "--repeat", "1", "--filter", "simple"])
+    assert "simple fields" in capsys.readouterr().out
@@ -0,0 +1,146 @@
+import sys
+from dataclasses import InitVar, dataclass, field
+from typing import Any, List, Optional, Tuple
+
+import pytest
+from pydantic import BaseModel
+
+from dataclass_mapper import init_with_default, map_many, map_to, mapper
+from dataclass_mapper.mapper import _make_mapper
+from dataclass_mapper.registry import get_compiled_mapper
+
+DEFAULT_TAGS = ("a", "b")
+
+
+@dataclass
+class Target:
+    x: int
+    y: Optional[str]
+    z: int = 5
+    tags: List[str] = field(default_factory=list)
+    labels: tuple = DEFAULT_TAGS
+    counter: List[int] = field(default_factory=lambda: [0])
+
+
+def test_bypass_init():
+    @mapper(
+        Target,
+        {"z": init_with_default(), "tags": init_with_default(), "counter": init_with_default()},
+        bypass_init=True,
+    )
+    @dataclass
+    class Source:
+        x: int
+        y: Optional[str]
+        labels: tuple
+
+    compiled_mapper = get_compiled_mapper(Source, Target)
+    assert compiled_mapper is not None
+    assert "object.__new__" in _make_mapper(compiled_mapper)
+
+    target = map_to(Source(x=1, y=None, labels=("c",)), Target)
+    assert target == Target(x=1, y=None, labels=("c",))
+    assert list(vars(target)) == ["x", "y", "z", "tags", "labels", "counter"]
+
+    first, second = map_many([Source(x=1, y="a", labels=()), Source(x=2, y="b", labels=())], Target)
+    assert first == Target(x=1, y="a", labels=())
+    # every object gets a new object from the factories
+    assert first.tags is not second.tags and first.counter is not second.counter
+
+
+def test_bypass_init_with_conditional_fields():
+    @mapper(Target, {"labels": init_with_default(), "tags": init_with_default()}, bypass_init=True)
+    @dataclass
+    class Source:
+        x: int
+        y: Optional[str]
+        z: Optional[int]
+        counter: Optional[List[int]]
+
+    assert map_to(Source(x=1, y=None, z=None, counter=None), Target) == Target(x=1, y=None)
+    assert map_to(Source(x=1, y=None, z=3, counter=[1]), Target) == Target(x=1, y=None, z=3, counter=[1])
+
+
+def test_bypass_init_frozen():
+    @dataclass(frozen=True)
+    class FrozenTarget:
+        x: int
+        y: int = 2
+
+    @mapper(FrozenTarget, {"y": init_with_default()}, bypass_init=True)
+    @dataclass
+    class Source:
+        x: int
+
+    assert map_to(Source(x=1), FrozenTarget) == FrozenTarget(x=1, y=2)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slots for dataclasses require Python 3.10")
+def test_bypass_init_slots():
+    @dataclass(frozen=True, slots=True)  # type: ignore[call-overload]
+    class SlotsTarget:
+        x: int
+        y: List[int] = field(default_factory=list)
+
+    @mapper(SlotsTarget, {"y": init_with_default()}, bypass_init=True)
+    @dataclass
+    class Source:
+        x: int
+
+    assert map_to(Source(x=1), SlotsTarget) == SlotsTarget(x=1, y=[])
+
+
+def test_bypass_init_not_supported():
+    @dataclass
+    class PostInitTarget:
+        x: int
+
+        def __post_init__(self):
+            pass
+
+    @dataclass
+    class InitVarTarget:
+        x: int
+        y: InitVar[int]
+
+    class PydanticTarget(BaseModel):
+        x: int
+
+    @dataclass
+    class Source:
+        x: int
+        y: int
+
+    for TargetCls in (PostInitTarget, InitVarTarget, PydanticTarget):
+        with pytest.raises(ValueError):
+            mapper(TargetCls, {"y": "y"} if TargetCls is InitVarTarget else {}, bypass_init=True)(Source)
+
+
+def test_bypass_init_calls_custom_init():
+    @dataclass
+    class CustomInitTarget:
+        x: int
+
+        def __init__(self, x: int) -> None:
+            self.x = x * 2
+
+    @dataclass
+    class ReplacedInitTarget:
+        x: int
+
+    def replaced_init(self, x: int) -> None:
+        self.x = x * 3
+
+    ReplacedInitTarget.__init__ = replaced_init  # type: ignore[assignment]
+
+    @dataclass
+    class Source:
+        x: int
+
+    cases: List[Tuple[Any, int]] = [(CustomInitTarget, 2), (ReplacedInitTarget, 3)]
+    for TargetCls, expected in cases:
+        mapper(TargetCls, bypass_init=True)(Source)
+        compiled_mapper = get_compiled_mapper(Source, TargetCls)
+        assert compiled_mapper is not None
+        assert "object.__new__" not in _make_mapper(compiled_mapper)
+        assert map_to(Source(x=1), TargetCls).x == expected
@@ -0,0 +1,178 @@
+from dataclasses import dataclass
+from importlib import import_module
+from typing import List, Optional
+
+import pytest
+
+from dataclass_mapper import USE_DEFAULT, init_with_default, map_to, mapper, set_cache_dir
+from dataclass_mapper.assignments import (
+    get_map_many_func_name,
+    get_map_many_without_extra_func_name,
+    get_map_to_func_name,
+    get_map_without_extra_func_name,
+)
+from dataclass_mapper.classmeta import get_class_meta
+from dataclass_mapper.mapping_method import MappingMethodSourceCode
+from dataclass_mapper.namespace import Namespace, get_namespace
+
+mapper_module = import_module("dataclass_mapper.mapper")
+cache_module = import_module("dataclass_mapper.cache")
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    set_cache_dir(tmp_path)
+    yield tmp_path
+    set_cache_dir(None)
+
+
+@dataclass
+class Item:
+    name: str
+
+
+@dataclass
+class Target:
+    x: int
+    y: Optional[str]
+    items: List[Item]
+    z: int = 0
+
+
+def test_generated_code_is_deterministic():
+    @mapper(Item)
+    @dataclass
+    class SourceItem:
+        name: str
+
+    @dataclass
+    class Source:
+        x: int
+        y: Optional[str]
+        items: List[SourceItem]
+
+    namespace = Namespace(locals={}, globals={})
+    codes = set()
+    for _ in range(2):
+        code = MappingMethodSourceCode(
+            source_cls=get_class_meta(Source, namespace=namespace),
+            target_cls=get_class_meta(Target, namespace=namespace),
+        )
+        code.add_mapping(target=code.target_cls.fields["z"], source=lambda self: self.x + 1)
+        codes.add(str(code))
+    assert len(codes) == 1
+
+
+def remove_mapper(SourceCls, TargetCls):
+    delattr(SourceCls, get_map_to_func_name(TargetCls))
+    delattr(SourceCls, get_map_many_func_name(TargetCls))
+    delattr(SourceCls, get_map_without_extra_func_name(TargetCls))
+    delattr(SourceCls, get_map_many_without_extra_func_name(TargetCls))
+
+
+def test_cache_stores_and_loads_code(cache_dir, monkeypatch):
+    @mapper(Item)
+    @dataclass
+    class SourceItem:
+        name: str
+
+    @mapper(Target, {"z": lambda self: self.x + 1})
+    @dataclass
+    class Source:
+        x: int
+        y: Optional[str]
+        items: List[SourceItem]
+
+    assert len(list(cache_dir.iterdir())) == 2
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the code should be loaded from the cache")
+
+    # compile the mapper again, this time the code must come from the cache
+    remove_mapper(Source, Target)
+    monkeypatch.setattr(mapper_module, "_make_mapper", fail)
+    mapper_module.compile_mapper_function(Source, Target, {"z": lambda self: self.x * 2}, namespace=get_namespace(1))
+
+    source = Source(x=42, y=None, items=[SourceItem(name="a")])
+    assert map_to(source, Target) == Target(x=42, y=None, items=[Item(name="a")], z=84)
+
+
+def test_cache_hit_emits_deprecation_warnings(cache_dir, monkeypatch):
+    @dataclass
+    class Source:
+        x: int
+        y: Optional[str]
+        items: List[Item]
+
+    with pytest.deprecated_call(match="USE_DEFAULT"):
+        mapper(Target, {"z": USE_DEFAULT})(Source)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the code should be loaded from the cache")
+
+    remove_mapper(Source, Target)
+    monkeypatch.setattr(mapper_module, "_make_mapper", fail)
+    with pytest.deprecated_call(match="USE_DEFAULT"):
+        mapper(Target, {"z": USE_DEFAULT})(Source)
+
+
+def test_cache_misses_for_different_mapping(cache_dir):
+    @dataclass
+    class Source:
+        x: int
+        y: Optional[str]
+        items: List[Item]
+
+    mapper(Target, {"z": "x"})(Source)
+    remove_mapper(Source, Target)
+    mapper(Target, {"z": lambda: 5})(Source)
+
+    assert len(list(cache_dir.iterdir())) == 2
+    assert map_to(Source(x=42, y=None, items=[]), Target) == Target(x=42, y=None, items=[], z=5)
+
+
+def test_cache_ignores_broken_files(cache_dir):
+    @dataclass
+    class Source:
+        x: int
+        y: Optional[str]
+        items: List[Item]
+
+    mapper(Target, {"z": init_with_default()})(Source)
+    (cache_file,) = cache_dir.iterdir()
+    cache_file.write_bytes(b"broken")
+
+    remove_mapper(Source, Target)
+    mapper(Target, {"z": init_with_default()})(Source)
+    assert map_to(Source(x=42, y="y", items=[]), Target) == Target(x=42, y="y", items=[])
+
+
+def test_fingerprint_of_inlined_mapper_depends_on_nested_mapping():
+    @dataclass
+    class Source:
+        x: int
+        y: Optional[str]
+        items: List["SourceItem"]
+
+    @dataclass
+    class SourceItem:
+        name: str
+        other_name: str
+
+    namespace = Namespace(locals={"SourceItem": SourceItem}, globals={})
+    source_meta = get_class_meta(Source, namespace=namespace)
+    target_meta = get_class_meta(Target, namespace=namespace)
+
+    mapper(Item)(SourceItem)
+    fingerprints = {
+        cache_module.fingerprint(Source, Target, source_meta, target_meta, {}, inline=inline)
+        for inline in (False, True)
+    }
+    remove_mapper(SourceItem, Item)
+    mapper(Item, {"name": "other_name"})(SourceItem)
+    fingerprints |= {
+        cache_module.fingerprint(Source, Target, source_meta, target_meta, {}, inline=inline)
+        for inline in (False, True)
+    }
+    # only the fingerprint of the inlined mapper changes
+    assert len(fingerprints) == 3
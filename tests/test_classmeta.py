@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from textwrap import dedent
+from typing import Any, Dict, List
+
+import pytest
+
+from dataclass_mapper import map_to, mapper
+from dataclass_mapper.classmeta import get_class_meta
+from dataclass_mapper.implementations.pydantic_v1 import pydantic_version
+from dataclass_mapper.namespace import Namespace, get_namespace
+
+
+@dataclass
+class Item:
+    name: str
+
+
+@dataclass
+class Order:
+    items: List["Item"]
+
+
+def test_class_meta_is_cached():
+    first = get_class_meta(Item, namespace=get_namespace(1))
+    assert get_class_meta(Item, namespace=Namespace(locals={"x": 1}, globals={})) is first
+
+
+def test_class_meta_with_forward_references_is_cached_per_module():
+    module_namespace = Namespace(locals=globals(), globals=globals())
+    first = get_class_meta(Order, namespace=module_namespace)
+    assert get_class_meta(Order, namespace=Namespace(locals=globals(), globals=globals())) is first
+    # the locals of a function might resolve the forward references differently
+    assert get_class_meta(Order, namespace=Namespace(locals={"Item": Item}, globals=globals())) is not first
+
+
+def test_forward_references_in_local_scope():
+    def make_mapper(item_name: str):
+        @dataclass
+        class LocalItem:
+            name: str
+
+        @mapper(Order, {"items": lambda: [Item(name=item_name)]})
+        @dataclass
+        class Source:
+            items: List["LocalItem"]
+
+        return Source, LocalItem
+
+    for name in ("a", "b"):
+        Source, LocalItem = make_mapper(name)
+        assert map_to(Source(items=[LocalItem(name="x")]), Order) == Order(items=[Item(name=name)])
+
+
+# a module, that maps a Pydantic model before its forward reference is defined, and again after `model_rebuild`
+REBUILT_MODULE = dedent(
+    """
+    from pydantic import BaseModel
+    from dataclass_mapper import map_to, mapper
+
+    class TargetChild(BaseModel):
+        x: int
+
+    class Target(BaseModel):
+        child: TargetChild
+
+    class Counter(BaseModel):
+        n: int = 0
+
+    class Source(BaseModel):
+        child: "SourceChild"
+        n: int = 0
+
+    mapper(Counter)(Source)
+
+    @mapper(TargetChild)
+    class SourceChild(BaseModel):
+        x: int
+
+    Source.model_rebuild()
+    mapper(Target)(Source)
+    result = map_to(Source(child=SourceChild(x=1)), Target)
+    """
+)
+
+
+@pytest.mark.skipif(pydantic_version() < (2, 0, 0), reason="V2 model_rebuild")
+def test_unresolved_forward_references_are_not_cached():
+    module: Dict[str, Any] = {"__name__": __name__}
+    exec(REBUILT_MODULE, module)
+    assert module["result"] == module["Target"](child=module["TargetChild"](x=1))
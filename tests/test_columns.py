@@ -0,0 +1,238 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from dataclass_mapper import (
+    init_with_default,
+    map_from_columns,
+    map_many,
+    map_to,
+    map_to_columns,
+    mapper,
+    provide_with_extra,
+)
+from dataclass_mapper.assignments import get_map_many_without_extra_func_name
+
+
+@dataclass
+class Target:
+    x: int
+    y: float
+    flag: bool
+    name: str
+    note: Optional[str]
+    tags: List[str]
+
+
+@mapper(Target, {"y": lambda self: self.x / 2, "note": "comment"})
+@dataclass
+class Source:
+    x: int
+    flag: bool
+    name: str
+    comment: Optional[str]
+    tags: List[str]
+
+
+def test_map_to_columns():
+    numpy = pytest.importorskip("numpy")
+    sources = [
+        Source(x=1, flag=True, name="a", comment=None, tags=["t"]),
+        Source(x=2, flag=False, name="b", comment="c", tags=[]),
+    ]
+    columns = map_to_columns(sources, Target)
+
+    assert list(columns) == ["x", "y", "flag", "name", "note", "tags"]
+    assert columns["x"].dtype == numpy.int64
+    assert columns["x"].tolist() == [1, 2]
+    assert columns["y"].dtype == numpy.float64
+    assert columns["y"].tolist() == [0.5, 1.0]
+    assert columns["flag"].dtype == numpy.bool_
+    assert columns["flag"].tolist() == [True, False]
+    assert columns["name"].dtype == object
+    assert columns["name"].tolist() == ["a", "b"]
+    assert columns["note"].dtype == object
+    assert columns["note"].tolist() == [None, "c"]
+    # lists stay objects, instead of becoming an additional dimension
+    assert columns["tags"].shape == (2,)
+    assert columns["tags"].tolist() == [["t"], []]
+
+
+def test_map_to_columns_doesnt_create_target_objects(monkeypatch):
+    pytest.importorskip("numpy")
+
+    @dataclass
+    class DirectTarget:
+        x: int
+
+    @mapper(DirectTarget)
+    @dataclass
+    class DirectSource:
+        x: int
+
+    def fail(objs):
+        raise AssertionError("the target objects should not be created")
+
+    monkeypatch.setattr(DirectSource, get_map_many_without_extra_func_name(DirectTarget), staticmethod(fail))
+    columns = map_to_columns((DirectSource(x=i) for i in range(3)), DirectTarget)
+    assert columns["x"].tolist() == [0, 1, 2]
+
+
+def test_map_to_columns_with_post_init():
+    pytest.importorskip("numpy")
+
+    @dataclass
+    class UpperTarget:
+        name: str
+
+        def __post_init__(self) -> None:
+            self.name = self.name.upper()
+
+    @mapper(UpperTarget)
+    @dataclass
+    class LowerSource:
+        name: str
+
+    sources = [LowerSource(name="a"), LowerSource(name="b")]
+    assert map_to_columns(sources, UpperTarget)["name"].tolist() == ["A", "B"]
+    assert [target.name for target in map_many(sources, UpperTarget)] == ["A", "B"]
+
+
+def test_map_to_columns_with_defaults():
+    pytest.importorskip("numpy")
+
+    @dataclass
+    class TargetWithDefaults:
+        x: int = 1
+        y: List[int] = field(default_factory=list)
+
+    @mapper(TargetWithDefaults, {"y": init_with_default()})
+    @dataclass
+    class SourceWithOptional:
+        x: Optional[int]
+
+    sources = [SourceWithOptional(x=None), SourceWithOptional(x=5)]
+    columns = map_to_columns(sources, TargetWithDefaults)
+    assert columns["x"].tolist() == [1, 5]
+    assert columns["y"].tolist() == [[], []]
+    assert columns["x"].tolist() == [target.x for target in map_many(sources, TargetWithDefaults)]
+
+
+def test_map_to_columns_recursive():
+    pytest.importorskip("numpy")
+
+    @dataclass
+    class Collection:
+        item: Target
+        size: int
+
+    @mapper(Collection, {"size": lambda self: len(self.item.tags)}, inline=True)
+    @dataclass
+    class SourceCollection:
+        item: Source
+
+    source = Source(x=1, flag=True, name="a", comment=None, tags=["t"])
+    columns = map_to_columns([SourceCollection(item=source)], Collection)
+    assert columns["item"].tolist() == [Target(x=1, y=0.5, flag=True, name="a", note=None, tags=["t"])]
+    assert columns["size"].tolist() == [1]
+
+
+def test_map_to_columns_empty():
+    numpy = pytest.importorskip("numpy")
+    columns = map_to_columns([], Target)
+    assert list(columns) == ["x", "y", "flag", "name", "note", "tags"]
+    assert columns["x"].dtype == numpy.int64
+    assert columns["name"].dtype == object
+    assert all(len(column) == 0 for column in columns.values())
+
+
+def test_map_to_columns_with_extra():
+    pytest.importorskip("numpy")
+
+    @mapper(Target, {"y": provide_with_extra(), "note": "comment"})
+    @dataclass
+    class SourceWithExtra:
+        x: int
+        flag: bool
+        name: str
+        comment: Optional[str]
+        tags: List[str]
+
+    with pytest.raises(TypeError):
+        map_to_columns([SourceWithExtra(x=1, flag=True, name="a", comment=None, tags=[])], Target)
+
+
+def test_map_to_columns_not_mappable():
+    pytest.importorskip("numpy")
+    with pytest.raises(NotImplementedError):
+        map_to_columns([Target(x=1, y=1.0, flag=True, name="a", note=None, tags=[])], Source)
+
+
+@dataclass
+class Point:
+    x: int
+    y: float
+    label: str = "point"
+
+
+@mapper(Point, {"y": "height", "label": lambda: "row"})
+@dataclass
+class Row:
+    x: int
+    height: float
+
+
+def test_map_from_columns_dict():
+    columns = {"x": [1, 2], "height": (0.5, 1.5)}
+    assert map_from_columns(columns, Row, Point) == [Point(x=1, y=0.5, label="row"), Point(x=2, y=1.5, label="row")]
+    assert map_from_columns({"x": [], "height": []}, Row, Point) == []
+
+
+def test_map_from_columns_structured_array():
+    numpy = pytest.importorskip("numpy")
+    rows = numpy.array([(1, 0.5), (2, 1.5)], dtype=[("x", "i8"), ("height", "f8")])
+
+    points = map_from_columns(rows, Row, Point)
+    assert points == [map_to(Row(x=1, height=0.5), Point), map_to(Row(x=2, height=1.5), Point)]
+    # the values are Python objects, not NumPy scalars
+    assert not isinstance(points[0].x, numpy.generic)
+
+    assert map_from_columns({"x": rows["x"], "height": rows["height"]}, Row, Point) == points
+    assert map_from_columns(memoryview(rows), Row, Point) == points
+
+
+def test_map_from_columns_nested_objects_and_optionals():
+    @dataclass
+    class Line:
+        start: Point
+        end: Optional[Point]
+        width: int = 1
+
+    @mapper(Line, inline=True)
+    @dataclass
+    class LineRow:
+        start: Row
+        end: Optional[Row]
+        width: Optional[int]
+
+    columns = {"start": [Row(x=1, height=2.0)] * 2, "end": [None, Row(x=3, height=4.0)], "width": [None, 5]}
+    assert map_from_columns(columns, LineRow, Line) == [
+        Line(start=Point(x=1, y=2.0, label="row"), end=None, width=1),
+        Line(start=Point(x=1, y=2.0, label="row"), end=Point(x=3, y=4.0, label="row"), width=5),
+    ]
+
+
+def test_map_from_columns_missing_column():
+    with pytest.raises(KeyError, match="'height' of 'Row'"):
+        map_from_columns({"x": [1]}, Row, Point)
+
+
+def test_map_from_columns_function_with_source_object():
+    with pytest.raises(ValueError, match="cannot be mapped from columns"):
+        map_from_columns({"x": [1], "flag": [True], "name": ["a"], "comment": [None], "tags": [[]]}, Source, Target)
+
+
+def test_map_from_columns_different_lengths():
+    with pytest.raises(ValueError, match="The column 'height' has 1 values, but the column 'x' has 3 values"):
+        map_from_columns({"x": [1, 2, 3], "height": [0.5]}, Row, Point)
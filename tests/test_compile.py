@@ -0,0 +1,74 @@
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+
+import pytest
+
+from dataclass_mapper import map_to
+from dataclass_mapper.assignments import (
+    get_map_many_func_name,
+    get_map_many_without_extra_func_name,
+    get_map_to_func_name,
+    get_map_without_extra_func_name,
+)
+from dataclass_mapper.compile import main
+from dataclass_mapper.namespace import get_namespace
+from dataclass_mapper.registry import MapperFunctions
+from tests.models import base, display, technical
+
+mapper_module = import_module("dataclass_mapper.mapper")
+cache_module = import_module("dataclass_mapper.cache")
+
+
+@pytest.fixture
+def precompiled_module(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "_precompiled", {})
+    output = tmp_path / "precompiled_mappers.py"
+    main(["tests.models.display", "tests.models.technical", "--output", str(output)])
+
+    spec = spec_from_file_location("precompiled_mappers", output)
+    assert spec is not None and spec.loader is not None
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_compile_generates_static_module(precompiled_module):
+    source = precompiled_module.__file__
+    with open(source) as f:
+        code = f.read()
+    assert "# tests.models.base.SongData -> tests.models.display.Song" in code
+    assert "# tests.models.base.SongData -> tests.models.technical.Song" in code
+    assert "exec" not in code
+
+    for functions in precompiled_module.MAPPERS.values():
+        assert len(functions) == len(MapperFunctions._fields)
+    assert "def map_SongData_to_Song(self, extra: dict)" in code
+    assert "def map_many_SongData_to_Song_without_extra(objs)" in code
+
+
+def test_mappers_use_precompiled_functions(precompiled_module, monkeypatch):
+    precompiled_module.load()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the precompiled function should be used")
+
+    monkeypatch.setattr(mapper_module, "_make_mapper", fail)
+    monkeypatch.setattr(mapper_module, "exec", fail, raising=False)
+
+    for TargetCls in (display.Song, technical.Song):
+        monkeypatch.delattr(base.SongData, get_map_to_func_name(TargetCls))
+        monkeypatch.delattr(base.SongData, get_map_many_func_name(TargetCls))
+        monkeypatch.delattr(base.SongData, get_map_without_extra_func_name(TargetCls))
+        monkeypatch.delattr(base.SongData, get_map_many_without_extra_func_name(TargetCls))
+        mapper_module.compile_mapper_function(base.SongData, TargetCls, None, namespace=get_namespace(1))
+
+    song = base.SongData(title="Ode to Joy", artist="Friedrich Schiller", genre="classic", length=123, encoding="mp3")
+    assert map_to(song, display.Song) == display.Song(title="Ode to Joy", artist="Friedrich Schiller", genre="classic")
+    assert map_to(song, technical.Song) == technical.Song(title="Ode to Joy", length=123, encoding="mp3")
+
+
+def test_precompiled_functions_of_other_version_are_ignored(precompiled_module, monkeypatch):
+    monkeypatch.setattr(precompiled_module, "LIBRARY_VERSION", "0.0.0-other")
+    with pytest.warns(RuntimeWarning):
+        precompiled_module.load()
+    assert not cache_module.has_precompiled()
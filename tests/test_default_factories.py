@@ -67,3 +67,23 @@ def test_refuse_factory_with_multiple_parameters():
             pass
 
     assert str(excinfo.value) == "'x' of 'Target' cannot be mapped using a factory with more than one parameter"
+
+
+def test_factories_are_not_stored_in_the_source_class():
+    @dataclass
+    class Target:
+        x: int
+        y: str
+
+    class Describer:
+        def __call__(self, obj) -> str:
+            return type(obj).__name__
+
+    @mapper(Target, {"x": lambda: 42, "y": Describer()})
+    @dataclass
+    class Source:
+        pass
+
+    assert map_to(Source(), Target) == Target(x=42, y="Source")
+    assert not any(isinstance(value, Describer) for value in vars(Source).values())
+    assert not any(getattr(value, "__name__", None) == "<lambda>" for value in vars(Source).values())
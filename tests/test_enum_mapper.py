@@ -1,9 +1,13 @@
 import sys
+from dataclasses import dataclass
 from enum import Enum, auto
+from typing import Dict, List, Optional
 
 import pytest
 
-from dataclass_mapper import enum_mapper, enum_mapper_from, map_to
+from dataclass_mapper import enum_mapper, enum_mapper_from, map_many, map_to, mapper
+from dataclass_mapper.mapper import _make_mapper
+from dataclass_mapper.registry import get_compiled_mapper
 
 
 class Foo(Enum):
@@ -108,3 +112,47 @@ def test_StrEnum():
 
     assert map_to(StrSource.ABC, StrTarget) == StrTarget.ABC
     assert map_to(StrSource.DEF, StrTarget) == StrTarget.DEF
+
+
+def test_enum_fields_use_lookup_table():
+    class Status(Enum):
+        OPEN = auto()
+        CLOSED = auto()
+
+    @enum_mapper(Status, {"DONE": "CLOSED"})
+    class StatusData(Enum):
+        OPEN = auto()
+        DONE = auto()
+
+    @dataclass
+    class Ticket:
+        status: Status
+        previous: Optional[Status]
+        history: List[Status]
+        by_user: Dict[str, Status]
+
+    @mapper(Ticket)
+    @dataclass
+    class TicketData:
+        status: StatusData
+        previous: Optional[StatusData]
+        history: List[StatusData]
+        by_user: Dict[str, StatusData]
+
+    compiled_mapper = get_compiled_mapper(TicketData, Ticket)
+    assert compiled_mapper is not None
+    code = _make_mapper(compiled_mapper)
+    assert "_map_to_" not in code and "_table_" in code
+
+    source = TicketData(
+        status=StatusData.DONE,
+        previous=None,
+        history=[StatusData.OPEN, StatusData.DONE],
+        by_user={"a": StatusData.OPEN},
+    )
+    expected = Ticket(
+        status=Status.CLOSED, previous=None, history=[Status.OPEN, Status.CLOSED], by_user={"a": Status.OPEN}
+    )
+    assert map_to(source, Ticket) == expected
+    assert map_to(source, Ticket, extra={}) == expected
+    assert map_many([source], Ticket) == [expected]
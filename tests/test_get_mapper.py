@@ -0,0 +1,123 @@
+import gc
+from dataclasses import dataclass
+from enum import Enum, auto
+from importlib import import_module
+from weakref import WeakKeyDictionary, ref
+
+import pytest
+
+from dataclass_mapper import enum_mapper, get_mapper, inspect_mapper, map_to, mapper, provide_with_extra
+
+mapper_module = import_module("dataclass_mapper.mapper")
+
+
+@dataclass
+class Target:
+    x: int
+    y: str
+
+
+@mapper(Target, {"y": provide_with_extra()})
+@dataclass
+class Source:
+    x: int
+
+
+def test_get_mapper():
+    convert = get_mapper(Source, Target)
+    assert convert(Source(x=1), {"y": "a"}) == Target(x=1, y="a")
+    assert convert(Source(x=1), {"y": "a"}) == map_to(Source(x=1), Target, extra={"y": "a"})
+
+
+def test_get_mapper_not_defined():
+    with pytest.raises(NotImplementedError):
+        get_mapper(Target, Source)
+    with pytest.raises(NotImplementedError):
+        map_to(Target(x=1, y="a"), Source)
+
+
+def test_get_mapper_of_subclass():
+    @dataclass
+    class SubSource(Source):
+        pass
+
+    assert get_mapper(SubSource, Target)(SubSource(x=1), {"y": "a"}) == Target(x=1, y="a")
+    assert map_to(SubSource(x=2), Target, extra={"y": "b"}) == Target(x=2, y="b")
+
+
+def test_get_mapper_of_enum():
+    class Color(Enum):
+        RED = auto()
+
+    @enum_mapper(Color)
+    class Farbe(Enum):
+        RED = auto()
+
+    assert get_mapper(Farbe, Color)(Farbe.RED, {}) is Color.RED
+
+
+def test_get_mapper_compiles_lazy_mapper(monkeypatch):
+    monkeypatch.setattr(mapper_module, "_uncompiled_mappers", WeakKeyDictionary())
+
+    @mapper(Target, {"y": lambda: "lazy"}, lazy=True)
+    @dataclass
+    class LazySource:
+        x: int
+
+    convert = get_mapper(LazySource, Target)
+    assert not mapper_module._uncompiled_mappers
+    assert convert(LazySource(x=1), {}) == Target(x=1, y="lazy")
+
+
+def test_dispatch_table_entry_is_removed_with_class():
+    @mapper(Target, {"y": lambda: "tmp"})
+    @dataclass
+    class TemporarySource:
+        x: int
+
+    key = (id(TemporarySource), id(Target))
+    assert map_to(TemporarySource(x=1), Target) == Target(x=1, y="tmp")
+    assert key in mapper_module._mapper_functions
+
+    del TemporarySource
+    gc.collect()
+    assert key not in mapper_module._mapper_functions
+
+
+def test_uncompiled_lazy_mapper_does_not_keep_classes_alive():
+    def define_mapper():
+        @dataclass
+        class TemporaryTarget:
+            x: int
+
+        @mapper(TemporaryTarget, lazy=True)
+        @dataclass
+        class TemporarySource:
+            x: int
+
+        return ref(TemporarySource), ref(TemporaryTarget)
+
+    source_ref, target_ref = define_mapper()
+    gc.collect()
+    assert source_ref() is None and target_ref() is None
+
+
+def test_inspect_mapper():
+    code = inspect_mapper(Source, Target)
+    assert "def map_Source_to_Target(self, extra: dict)" in code
+    assert "def map_many_Source_to_Target(objs, extras)" in code
+    with pytest.raises(NotImplementedError):
+        inspect_mapper(Target, Source)
+
+
+def test_generated_code_in_tracebacks():
+    @mapper(Target, {"y": lambda self: self.x.upper()})
+    @dataclass
+    class BrokenSource:
+        x: int
+
+    with pytest.raises(AttributeError) as excinfo:
+        map_to(BrokenSource(x=1), Target)
+    frame = excinfo.traceback[-2]
+    assert frame.name == "map_BrokenSource_to_Target_without_extra"
+    assert "y=" in str(frame.statement)
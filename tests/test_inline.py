@@ -0,0 +1,201 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from dataclass_mapper import map_many, map_to, mapper, provide_with_extra
+from dataclass_mapper.implementations.pydantic_v1 import pydantic_version
+from dataclass_mapper.mapper import _make_mapper
+from dataclass_mapper.registry import get_compiled_mapper
+
+
+@dataclass
+class Tag:
+    name: str
+    source: str
+
+
+@dataclass
+class Track:
+    title: str
+    tag: Optional[Tag]
+    tags: List[Tag]
+
+
+@dataclass
+class Album:
+    name: str
+    first: Track
+    tracks: List[Track]
+    by_disc: Dict[int, Track] = field(default_factory=dict)
+
+
+@mapper(Tag, {"source": provide_with_extra()})
+@dataclass
+class TagData:
+    name: str
+
+
+@mapper(Track)
+@dataclass
+class TrackData:
+    title: str
+    tag: Optional[TagData]
+    tags: List[TagData]
+
+
+@dataclass
+class AlbumData:
+    name: str
+    first: TrackData
+    tracks: List[TrackData]
+    by_disc: Dict[int, TrackData]
+
+
+mapper(Album, {"first": "first"}, inline=True)(AlbumData)
+
+
+def album_data() -> AlbumData:
+    first = TrackData(title="Intro", tag=TagData(name="a"), tags=[TagData(name="b")])
+    second = TrackData(title="Outro", tag=None, tags=[])
+    return AlbumData(name="Album", first=first, tracks=[first, second], by_disc={1: first, 2: second})
+
+
+def test_inlined_code_calls_no_nested_mapper():
+    compiled_mapper = get_compiled_mapper(AlbumData, Album)
+    assert compiled_mapper is not None
+    assert "_map_to_" not in _make_mapper(compiled_mapper)
+
+
+def test_inlined_mapping():
+    extra = {
+        "first": {"tag": {"source": "x"}, "tags": [{"source": "y"}]},
+        "tracks": [{"tag": {"source": "x"}, "tags": [{"source": "y"}]}],
+        "by_disc": {1: {"tag": {"source": "x"}, "tags": [{"source": "y"}]}},
+    }
+    first = Track(title="Intro", tag=Tag(name="a", source="x"), tags=[Tag(name="b", source="y")])
+    second = Track(title="Outro", tag=None, tags=[])
+    expected = Album(name="Album", first=first, tracks=[first, second], by_disc={1: first, 2: second})
+
+    assert map_to(album_data(), Album, extra=extra) == expected
+    assert map_many([album_data()], Album, extras=[extra]) == [expected]
+
+
+def test_inlined_mapping_checks_extra():
+    try:
+        map_to(album_data(), Album)
+    except TypeError as e:
+        assert "'source' needs to be provided" in str(e)
+    else:
+        raise AssertionError("missing extra wasn't detected")
+
+
+def test_recursive_type_is_not_inlined_into_itself():
+    @dataclass
+    class Node:
+        value: int
+        children: List["Node"]
+
+    @dataclass
+    class NodeData:
+        value: int
+        children: List["NodeData"]
+
+    @dataclass
+    class Tree:
+        root: Node
+
+    # a recursive mapping is only possible with a lazy mapper
+    mapper(Node, lazy=True)(NodeData)
+
+    @mapper(Tree, inline=True)
+    @dataclass
+    class TreeData:
+        root: NodeData
+
+    tree = TreeData(root=NodeData(value=1, children=[NodeData(value=2, children=[])]))
+    map_to(tree.root, Node)
+    # generate the code of the tree mapper again, now that the nested mapper is compiled
+    compiled_mapper = get_compiled_mapper(TreeData, Tree)
+    assert compiled_mapper is not None
+    assert _make_mapper(compiled_mapper).count("_map_to_") == 2  # convert and convert_many
+
+    assert map_to(tree, Tree) == Tree(root=Node(value=1, children=[Node(value=2, children=[])]))
+
+
+def test_inlined_pydantic_keeps_unset_fields():
+    class Target(BaseModel):
+        x: Optional[int] = None
+
+    class Parent(BaseModel):
+        child: Target
+
+    @mapper(Target)
+    class Source(BaseModel):
+        x: Optional[int] = None
+
+    @mapper(Parent, inline=True)
+    class SourceParent(BaseModel):
+        child: Source
+
+    for source, expected_fields_set in [(Source(), set()), (Source(x=None), {"x"})]:
+        child = map_to(SourceParent(child=source), Parent).child
+        if pydantic_version() < (2, 0, 0):
+            assert child.__fields_set__ == expected_fields_set
+        else:
+            assert child.model_fields_set == expected_fields_set
+
+
+def test_inlined_conversion_functions():
+    @dataclass
+    class Target:
+        x: int
+
+    @dataclass
+    class Parent:
+        child: Target
+
+    @mapper(Target, {"x": lambda self: self.y * 2})
+    @dataclass
+    class Source:
+        y: int
+
+    @mapper(Parent, inline=True)
+    @dataclass
+    class SourceParent:
+        child: Source
+
+    assert map_to(SourceParent(child=Source(y=2)), Parent) == Parent(child=Target(x=4))
+
+
+def test_inlined_code_without_extra_skips_extra_dictionaries():
+    @dataclass
+    class Target:
+        x: int
+
+    @dataclass
+    class Parent:
+        child: Target
+        children: List[Target]
+        by_name: Dict[str, Target]
+
+    @mapper(Target)
+    @dataclass
+    class Source:
+        x: int
+
+    @mapper(Parent, inline=True)
+    @dataclass
+    class SourceParent:
+        child: Source
+        children: List[Source]
+        by_name: Dict[str, Source]
+
+    compiled_mapper = get_compiled_mapper(SourceParent, Parent)
+    assert compiled_mapper is not None
+    code = _make_mapper(compiled_mapper)
+    assert "_extra1" not in code and "zip_longest" not in code and "extra.get" not in code
+
+    source = SourceParent(child=Source(x=1), children=[Source(x=2)], by_name={"a": Source(x=3)})
+    expected = Parent(child=Target(x=1), children=[Target(x=2)], by_name={"a": Target(x=3)})
+    assert map_to(source, Parent, extra={"child": {}}) == expected
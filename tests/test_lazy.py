@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from importlib import import_module
+from typing import List
+from weakref import WeakKeyDictionary
+
+import pytest
+
+from dataclass_mapper import compile_all, map_many, map_to, mapper, mapper_from
+from dataclass_mapper.assignments import get_map_to_func_name
+
+
+@pytest.fixture(autouse=True)
+def uncompiled_mappers(monkeypatch):
+    """don't let the lazy mappers of the tests affect each other"""
+    monkeypatch.setattr(import_module("dataclass_mapper.mapper"), "_uncompiled_mappers", WeakKeyDictionary())
+
+
+@dataclass
+class Target:
+    x: int
+
+
+def test_lazy_mapper_compiles_on_first_use():
+    @mapper(Target, lazy=True)
+    @dataclass
+    class Source:
+        x: int
+
+    lazy_convert = getattr(Source, get_map_to_func_name(Target))
+    assert map_to(Source(x=42), Target) == Target(x=42)
+    assert getattr(Source, get_map_to_func_name(Target)) is not lazy_convert
+    assert map_to(Source(x=43), Target) == Target(x=43)
+
+
+def test_lazy_mapper_from_with_map_many():
+    @dataclass
+    class Source:
+        x: int
+
+    @mapper_from(Source, lazy=True)
+    @dataclass
+    class LazyTarget:
+        x: int
+
+    assert map_many([Source(x=1), Source(x=2)], LazyTarget) == [LazyTarget(x=1), LazyTarget(x=2)]
+
+
+def test_lazy_mapper_errors_are_raised_on_first_use():
+    @mapper(Target, {"x": "y"}, lazy=True)
+    @dataclass
+    class Source:
+        x: int
+
+    with pytest.raises(ValueError) as excinfo:
+        map_to(Source(x=42), Target)
+    assert "'y' of mapping in 'Source' doesn't exist in 'Source'" in str(excinfo.value)
+
+    # still raises the same error, and doesn't end in an infinite recursion
+    with pytest.raises(ValueError):
+        map_to(Source(x=42), Target)
+
+
+def test_lazy_nested_mappers():
+    @dataclass
+    class TargetCollection:
+        items: List[Target]
+
+    @mapper(Target, lazy=True)
+    @dataclass
+    class Source:
+        x: int
+
+    @mapper(TargetCollection, lazy=True)
+    @dataclass
+    class SourceCollection:
+        items: List[Source]
+
+    assert map_to(SourceCollection(items=[Source(x=1)]), TargetCollection) == TargetCollection(items=[Target(x=1)])
+
+
+def test_lazy_mapper_duplicate_mapping():
+    with pytest.raises(AttributeError) as excinfo:
+
+        @mapper(Target, lazy=True)
+        @mapper(Target, lazy=True)
+        @dataclass
+        class Source:
+            x: int
+
+    assert "There already exists a mapping between 'Source' and 'Target'" in str(excinfo.value)
+
+
+def test_compile_all():
+    @mapper(Target, lazy=True)
+    @dataclass
+    class Source:
+        x: int
+
+    lazy_convert = getattr(Source, get_map_to_func_name(Target))
+    compile_all()
+    assert getattr(Source, get_map_to_func_name(Target)) is not lazy_convert
+    assert map_to(Source(x=42), Target) == Target(x=42)
+
+
+def test_compile_all_raises_errors():
+    @mapper(Target, {"x": "y"}, lazy=True)
+    @dataclass
+    class Source:
+        x: int
+
+    with pytest.raises(ValueError):
+        compile_all()
@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import List, Optional
+
+import pytest
+
+from dataclass_mapper import enum_mapper, map_many, map_to, mapper, provide_with_extra
+from dataclass_mapper.assignments import get_map_many_func_name
+
+
+@dataclass
+class Target:
+    x: int
+    y: Optional[str] = None
+
+
+@mapper(Target)
+@dataclass
+class Source:
+    x: int
+    y: Optional[str]
+
+
+def test_map_many():
+    sources = [Source(x=1, y="a"), Source(x=2, y=None)]
+    assert map_many(sources, Target) == [Target(x=1, y="a"), Target(x=2, y=None)]
+    assert map_many(sources, Target) == [map_to(source, Target) for source in sources]
+
+
+def test_map_many_empty():
+    assert map_many([], Target) == []
+
+
+def test_map_many_from_iterator():
+    sources = (Source(x=i, y=str(i)) for i in range(3))
+    assert map_many(sources, Target) == [Target(x=0, y="0"), Target(x=1, y="1"), Target(x=2, y="2")]
+
+
+def test_map_many_recursive():
+    @dataclass
+    class TargetCollection:
+        items: List[Target]
+        item: Target
+
+    @mapper(TargetCollection)
+    @dataclass
+    class SourceCollection:
+        items: List[Source]
+        item: Source
+
+    sources = [SourceCollection(items=[Source(x=1, y=None)], item=Source(x=2, y="b"))]
+    assert map_many(sources, TargetCollection) == [
+        TargetCollection(items=[Target(x=1, y=None)], item=Target(x=2, y="b"))
+    ]
+
+
+def test_map_many_with_extras():
+    @mapper(Target, {"y": provide_with_extra()})
+    @dataclass
+    class SourceWithExtra:
+        x: int
+
+    sources = [SourceWithExtra(x=1), SourceWithExtra(x=2)]
+    assert map_many(sources, Target, extras=[{"y": "a"}, {"y": "b"}]) == [Target(x=1, y="a"), Target(x=2, y="b")]
+
+    with pytest.raises(TypeError):
+        map_many(sources, Target)
+
+
+def test_map_many_enums():
+    class TargetEnum(Enum):
+        A = auto()
+        B = auto()
+
+    @enum_mapper(TargetEnum)
+    class SourceEnum(Enum):
+        A = auto()
+        B = auto()
+
+    assert map_many([SourceEnum.B, SourceEnum.A], TargetEnum) == [TargetEnum.B, TargetEnum.A]
+
+
+def test_map_many_not_mappable():
+    with pytest.raises(NotImplementedError) as excinfo:
+        map_many([Target(x=1)], Source)
+    assert "Object of type 'Target' cannot be mapped to 'Source'" in str(excinfo.value)
+
+
+def test_map_many_mixed_classes():
+    @mapper(Target, {"y": lambda: "other"})
+    @dataclass
+    class OtherSource:
+        x: int
+
+    @dataclass
+    class SubSource(Source):
+        pass
+
+    sources = [Source(x=1, y="a"), OtherSource(x=2), SubSource(x=3, y="c"), OtherSource(x=4)]
+    assert map_many(sources, Target) == [map_to(source, Target) for source in sources]
+
+
+def test_map_many_mixed_classes_not_mappable():
+    with pytest.raises(NotImplementedError) as excinfo:
+        map_many([Source(x=1, y="a"), Target(x=2)], Target)
+    assert "Object of type 'Target' cannot be mapped to 'Target'" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("extras", [[{"y": "a"}], [{"y": "a"}, {"y": "b"}, {"y": "c"}]])
+def test_map_many_extras_length_mismatch(extras):
+    @mapper(Target, {"y": provide_with_extra()})
+    @dataclass
+    class SourceWithExtra:
+        x: int
+
+    sources = [SourceWithExtra(x=1), SourceWithExtra(x=2)]
+    with pytest.raises(ValueError, match=f"Got 2 objects, but {len(extras)} extra dictionaries"):
+        map_many(sources, Target, extras=extras)
+    with pytest.raises(ValueError, match=f"Got 2 objects, but {len(extras)} extra dictionaries"):
+        getattr(SourceWithExtra, get_map_many_func_name(Target))(sources, extras)
@@ -4,6 +4,8 @@ from typing import Dict, List
 
 import pytest
 
+import dataclass_mapper.code_generator as cg
+from dataclass_mapper.assignments import get_map_to_func_name
 from dataclass_mapper.implementations.base import FieldMeta
 from dataclass_mapper.implementations.dataclasses import DataclassClassMeta
 from dataclass_mapper.mapper import mapper
@@ -39,9 +41,7 @@ def test_code_gen_add_normal_assignment(code: MappingMethodSourceCode) -> None:
     expected_code = prepare_expected_code(
         """
         def convert(self, extra: dict) -> "Target":
-            d = {}
-            d["target_x"] = self.source_x
-            return TargetAlias(**d)
+            return TargetAlias(target_x=self.source_x)
         """
     )
     assert str(code) == expected_code
@@ -56,14 +56,42 @@ def test_code_gen_add_assignment_only_if_not_None(code: MappingMethodSourceCode)
         """
         def convert(self, extra: dict) -> "Target":
             d = {}
-            if self.source_x is not None:
-                d["target_x"] = self.source_x
+            _source_source_x = self.source_x
+            if _source_source_x is not None:
+                d["target_x"] = _source_source_x
             return TargetAlias(**d)
         """
     )
     assert str(code) == expected_code
 
 
+def test_code_gen_mixed_conditional_assignments(code: MappingMethodSourceCode) -> None:
+    code.add_mapping(
+        target=FieldMeta(name="target_x", type=int, allow_none=False, required=False),
+        source=FieldMeta(name="source_x", type=int, allow_none=True, required=True),
+    )
+    code.add_mapping(
+        target=FieldMeta(name="target_y", type=int, allow_none=True, required=True),
+        source=FieldMeta(name="source_y", type=int, allow_none=True, required=True),
+    )
+    expected_code = prepare_expected_code(
+        """
+        def convert(self, extra: dict) -> "Target":
+            d = {}
+            _source_source_x = self.source_x
+            if _source_source_x is not None:
+                d["target_x"] = _source_source_x
+            return TargetAlias(target_y=None if self.source_y is None else self.source_y, **d)
+        """
+    )
+    assert str(code) == expected_code
+
+
+def test_code_gen_call_with_non_identifier_names() -> None:
+    call = cg.Call("Target", keywords={"x": "self.x", "y-y": "self.y", "class": "self.z"}, unpack="d")
+    assert str(call) == 'Target(x=self.x, **{"y-y": self.y, "class": self.z}, **d)'
+
+
 def test_bypass_validators_option_disabled_for_dataclasses() -> None:
     code = MappingMethodSourceCode(
         source_cls=DataclassClassMeta(
@@ -80,8 +108,7 @@ def test_bypass_validators_option_disabled_for_dataclasses() -> None:
     expected_code = prepare_expected_code(
         """
         def convert(self, extra: dict) -> "Target":
-            d = {}
-            return TargetAlias(**d)
+            return TargetAlias()
         """
     )
     assert str(code) == expected_code
@@ -92,11 +119,9 @@ def test_provide_with_extra_code_check(code: MappingMethodSourceCode):
     expected_code = prepare_expected_code(
         """
         def convert(self, extra: dict) -> "Target":
-            d = {}
             if "target_x" not in extra:
                 raise TypeError("When mapping an object of 'Source' to 'Target' the field 'target_x' needs to be provided in the `extra` dictionary")
-            d["target_x"] = extra["target_x"]
-            return TargetAlias(**d)
+            return TargetAlias(target_x=extra["target_x"])
         """  # noqa: E501
     )
     assert str(code) == expected_code
@@ -116,13 +141,11 @@ def test_provide_with_extra_code_list(code: MappingMethodSourceCode):
         target=FieldMeta(name="target_x", type=List[FooTarget], allow_none=False, required=True),
         source=FieldMeta(name="source_x", type=List[FooSource], allow_none=False, required=True),
     )
-    footarget_id = id(FooTarget)
+    map_func_name = get_map_to_func_name(FooTarget)
     expected_code = prepare_expected_code(
         f"""
         def convert(self, extra: dict) -> "Target":
-            d = {{}}
-            d["target_x"] = [x._map_to_FooTarget_{footarget_id}(e) for x, e in self.__zip_longest(self.source_x, extra.get("target_x", []), fillvalue=dict())]
-            return TargetAlias(**d)
+            return TargetAlias(target_x=[x.{map_func_name}(e) for x, e in self.__zip_longest(self.source_x, extra.get("target_x", []), fillvalue=dict())])
         """  # noqa: E501
     )
     assert str(code) == expected_code
@@ -142,13 +165,11 @@ def test_provide_with_extra_code_dict(code: MappingMethodSourceCode):
         target=FieldMeta(name="target_x", type=Dict[str, FooTarget], allow_none=False, required=True),
         source=FieldMeta(name="source_x", type=Dict[str, FooSource], allow_none=False, required=True),
     )
-    footarget_id = id(FooTarget)
+    map_func_name = get_map_to_func_name(FooTarget)
     expected_code = prepare_expected_code(
         f"""
         def convert(self, extra: dict) -> "Target":
-            d = {{}}
-            d["target_x"] = {{k: v._map_to_FooTarget_{footarget_id}(extra.get("target_x", {{}}).get(k, {{}})) for k, v in self.source_x.items()}}
-            return TargetAlias(**d)
+            return TargetAlias(target_x={{k: v.{map_func_name}(extra.get("target_x", {{}}).get(k, {{}})) for k, v in self.source_x.items()}})
         """  # noqa: E501
     )
     assert str(code) == expected_code
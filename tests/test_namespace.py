@@ -0,0 +1,107 @@
+import gc
+from dataclasses import dataclass
+from typing import List, Optional
+from weakref import ref
+
+from dataclass_mapper import compile_all, map_to, mapper
+from dataclass_mapper.namespace import Namespace, get_namespace
+
+
+class Data:
+    pass
+
+
+def test_namespace_does_not_pin_local_variables():
+    def define_mapper():
+        data = Data()
+
+        @dataclass
+        class Target:
+            x: int
+
+        @mapper(Target, lazy=True)
+        @dataclass
+        class Source:
+            x: int
+
+        return Source, Target, ref(data)
+
+    Source, Target, data_ref = define_mapper()
+    gc.collect()
+    assert data_ref() is None
+    assert map_to(Source(x=1), Target) == Target(x=1)
+
+
+def test_namespace_resolves_local_forward_references():
+    def define_mapper():
+        @dataclass
+        class Item:
+            name: str
+
+        @mapper(Item)
+        @dataclass
+        class ItemSource:
+            name: str
+
+        @dataclass
+        class Target:
+            items: List["Item"]
+
+        @mapper(Target, lazy=True)
+        @dataclass
+        class Source:
+            items: List["ItemSource"]
+
+        return Source, ItemSource, Target, Item
+
+    Source, ItemSource, Target, Item = define_mapper()
+    assert map_to(Source(items=[ItemSource(name="a")]), Target) == Target(items=[Item(name="a")])
+
+
+def test_lazy_mapper_keeps_local_forward_references():
+    @dataclass
+    class Child:
+        x: int
+
+    @dataclass
+    class Target:
+        child: Optional[Child]
+
+    def define_mapper():
+        @mapper(Child)
+        @dataclass
+        class LocalChild:
+            x: int
+
+        @mapper(Target, lazy=True)
+        @dataclass
+        class Source:
+            child: "Optional[LocalChild]"
+
+        return Source
+
+    Source = define_mapper()
+    # the local class is only referenced by the namespace of the lazy mapper
+    gc.collect()
+    compile_all()
+    assert map_to(Source(child=None), Target) == Target(child=None)
+
+
+def test_namespace_references_classes_weakly():
+    def define_class():
+        class Local:
+            pass
+
+        data = Data()  # noqa: F841
+        return get_namespace(1), ref(Local)
+
+    namespace, local_ref = define_class()
+    assert "data" not in namespace.locals
+    gc.collect()
+    assert local_ref() is None
+    assert "Local" not in namespace.locals
+
+
+def test_namespace_of_module():
+    namespace = Namespace(locals=globals(), globals=globals())
+    assert namespace.locals is globals()
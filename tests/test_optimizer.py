@@ -0,0 +1,210 @@
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from dataclass_mapper import code_generator as cg
+from dataclass_mapper import enum_mapper, init_with_default, mapper
+from dataclass_mapper.mapper import _function_names, _make_mapper, _mapper_globals
+from dataclass_mapper.optimizer import optimize, optimize_expression
+from dataclass_mapper.registry import get_compiled_mapper
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("None if self.x is None else self.x", "self.x"),
+        ("_T(a=None if self.a is None else self.a, b=self.b)", "_T(a=self.a, b=self.b)"),
+        ('{"a": None if _obj1.a is None else _obj1.a}', '{"a": _obj1.a}'),
+        ("None if self.x is None else self.x.y", "None if self.x is None else self.x.y"),
+        ("None if self.x is None else self.x._map_to_T()", "None if self.x is None else self.x._map_to_T()"),
+        ("None if self.x is None else self.xy", "None if self.x is None else self.xy"),
+        ("None if self.x is None else [v for v in self.x]", "None if self.x is None else [v for v in self.x]"),
+    ],
+)
+def test_optimize_expression(expression: str, expected: str) -> None:
+    assert optimize_expression(expression) == expected
+
+
+def render(statement: cg.Statement) -> str:
+    optimized = optimize(statement)
+    return "" if optimized is None else optimized.to_string(0)
+
+
+def test_remove_dead_branches() -> None:
+    assignment = cg.Assignment(name="x", rhs="1")
+    assert render(cg.IfElse(condition="True", if_block=assignment)) == "x = 1"
+    assert render(cg.IfElse(condition="False", if_block=assignment)) == ""
+    assert render(cg.IfElse(condition="False", if_block=assignment, else_block=cg.Assignment("x", "2"))) == "x = 2"
+    assert render(cg.IfElse(condition="self.x is None", if_block=cg.Block())) == ""
+    assert render(cg.IfElse(condition="c", if_block=assignment, else_block=cg.Assignment("x", "1"))) == "x = 1"
+
+
+def test_merge_conditions() -> None:
+    first = cg.IfElse(condition="self.x is not None", if_block=cg.Assignment(name='d["a"]', rhs="self.x"))
+    second = cg.IfElse(condition="self.x is not None", if_block=cg.Assignment(name='d["b"]', rhs="self.x"))
+    assert render(cg.Block(first, second)) == 'if self.x is not None:\n    d["a"] = self.x\n    d["b"] = self.x'
+    assert render(cg.IfElse(condition="c", if_block=cg.IfElse(condition="c", if_block=first))) == render(
+        cg.IfElse(condition="c", if_block=first)
+    )
+
+    # the first block changes the variable of the condition
+    reassign = cg.IfElse(condition="_obj1 is not None", if_block=cg.Assignment(name="_obj1", rhs="None"))
+    check = cg.IfElse(condition="_obj1 is not None", if_block=cg.Assignment(name="x", rhs="1"))
+    assert render(cg.Block(reassign, check)).count("if ") == 2
+
+
+class Color(Enum):
+    RED = auto()
+    GREEN = auto()
+
+
+@enum_mapper(Color)
+class ColorData(Enum):
+    RED = auto()
+    GREEN = auto()
+
+
+@dataclass
+class Item:
+    name: str
+    color: Optional[Color]
+
+
+@mapper(Item)
+@dataclass
+class ItemData:
+    name: str
+    color: Optional[ColorData]
+
+
+@dataclass
+class Order:
+    first: Optional[Item]
+    items: List[Item]
+    by_name: Optional[Dict[str, Item]]
+    note: Optional[str]
+    count: int = 0
+    tags: List[str] = field(default_factory=list)
+
+
+@mapper(Order, {"tags": init_with_default()})
+@dataclass
+class OrderData:
+    first: Optional[ItemData]
+    items: List[ItemData]
+    by_name: Optional[Dict[str, ItemData]]
+    note: Optional[str]
+    count: Optional[int]
+
+
+@mapper(Order, {"tags": lambda self: [self.note or ""]}, inline=True)
+@dataclass
+class InlinedOrderData:
+    first: Optional[ItemData]
+    items: List[ItemData]
+    by_name: Optional[Dict[str, ItemData]]
+    note: Optional[str]
+    count: Optional[int]
+
+
+class Settings(BaseModel):
+    name: Optional[str] = None
+    level: Optional[int] = None
+    limit: int = 10
+
+
+@mapper(Settings)
+class SettingsData(BaseModel):
+    name: Optional[str] = None
+    level: Optional[int] = None
+    limit: Optional[int] = None
+
+
+def fields_set(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_fields_set if hasattr(obj, "model_fields_set") else obj.__fields_set__
+    return None
+
+
+def compile_variants(source_cls: Any, target_cls: Any) -> List[Dict[str, Callable]]:
+    compiled_mapper = get_compiled_mapper(source_cls, target_cls)
+    assert compiled_mapper is not None
+    variants = []
+    for optimize_code in (False, True):
+        d: Dict[str, Any] = {}
+        exec(_make_mapper(compiled_mapper, optimize=optimize_code), _mapper_globals(compiled_mapper), d)
+        variants.append({field: d[name] for field, name in _function_names(compiled_mapper).items()})
+    return variants
+
+
+@pytest.mark.parametrize(
+    "source_cls, target_cls, sources",
+    [
+        (ItemData, Item, [ItemData(name="a", color=None), ItemData(name="b", color=ColorData.GREEN)]),
+        *[
+            (
+                cls,
+                Order,
+                [
+                    cls(first=None, items=[], by_name=None, note=None, count=None),
+                    cls(
+                        first=ItemData(name="a", color=ColorData.RED),
+                        items=[ItemData(name="b", color=None)],
+                        by_name={"c": ItemData(name="c", color=ColorData.GREEN)},
+                        note="n",
+                        count=3,
+                    ),
+                ],
+            )
+            for cls in (OrderData, InlinedOrderData)
+        ],
+        (
+            SettingsData,
+            Settings,
+            [
+                SettingsData(),
+                SettingsData(name=None, level=2),
+                SettingsData(name="a", limit=None),
+                SettingsData(limit=5),
+            ],
+        ),
+    ],
+)
+def test_optimized_code_is_equivalent(source_cls: Any, target_cls: Any, sources: List[Any]) -> None:
+    plain, optimized = compile_variants(source_cls, target_cls)
+    extras: List[Dict[str, Any]] = [{} for _ in sources]
+    for source in sources:
+        for name in ("convert", "convert_without_extra"):
+            args = (source, {}) if name == "convert" else (source,)
+            expected, actual = plain[name](*args), optimized[name](*args)
+            assert actual == expected
+            assert fields_set(actual) == fields_set(expected)
+    assert optimized["convert_many"](sources, extras) == plain["convert_many"](sources, extras)
+    assert optimized["convert_many_without_extra"](sources) == plain["convert_many_without_extra"](sources)
+
+
+def test_optimized_code_is_shorter() -> None:
+    compiled_mapper = get_compiled_mapper(SettingsData, Settings)
+    assert compiled_mapper is not None
+    plain, optimized = _make_mapper(compiled_mapper, optimize=False), _make_mapper(compiled_mapper)
+    assert "None if self.name is None else self.name" in plain
+    assert "None if self.name is None else self.name" not in optimized
+
+
+def test_source_fields_are_read_once() -> None:
+    compiled_mapper = get_compiled_mapper(SettingsData, Settings)
+    assert compiled_mapper is not None
+    plain = _make_mapper(compiled_mapper, optimize=False).split("\n\n")[0]
+    assert plain.count("_fields_set = self.") == 1
+    assert plain.count("in _fields_set") == 2
+    assert plain.count("self.limit") == 1
+
+    compiled_mapper = get_compiled_mapper(InlinedOrderData, Order)
+    assert compiled_mapper is not None
+    plain = _make_mapper(compiled_mapper, optimize=False).split("\n\n")[0]
+    for name in ("first", "by_name", "count"):
+        assert plain.count(f"self.{name}") == 1
+    assert plain.count("_obj1.color") == 1
@@ -0,0 +1,118 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import List
+
+import pytest
+
+from dataclass_mapper import get_mapper, map_many, mapper, provide_with_extra
+from dataclass_mapper.assignments import get_map_many_func_name
+from dataclass_mapper.parallel import map_chunks
+
+
+@dataclass
+class Target:
+    x: int
+    label: str
+
+
+@mapper(Target, {"label": provide_with_extra()})
+@dataclass
+class Source:
+    x: int
+
+
+@mapper(Target, {"label": lambda: "other"})
+@dataclass
+class OtherSource:
+    x: int
+
+
+@dataclass
+class Collection:
+    items: List[Target]
+
+
+@mapper(Collection)
+@dataclass
+class SourceCollection:
+    items: List[Source]
+
+
+def test_generated_functions_can_be_pickled():
+    convert = get_mapper(Source, Target)
+    assert pickle.loads(pickle.dumps(convert)) is convert
+
+
+def test_map_many_in_processes():
+    sources = [Source(x=i) for i in range(10)]
+    extras = [{"label": str(i)} for i in range(10)]
+    expected = map_many(sources, Target, extras=extras)
+    assert map_many(sources, Target, extras=extras, executor="process", workers=2, chunksize=3) == expected
+    assert map_many(iter(sources), Target, extras=iter(extras), executor="process", workers=2) == expected
+
+
+def test_map_many_in_processes_errors():
+    sources = [SourceCollection(items=[Source(x=i)]) for i in range(5)]
+    with pytest.raises(TypeError):
+        map_many(sources, Collection, executor="process", workers=2)
+
+
+def test_map_many_with_executor():
+    sources = [Source(x=i) for i in range(5)]
+    extras = [{"label": "a"}] * 5
+    expected = map_many(sources, Target, extras=extras)
+    # workers that are started fresh, find the mapper by importing this module
+    with ProcessPoolExecutor(max_workers=2, mp_context=get_context("spawn")) as executor:
+        assert map_many(sources, Target, extras=extras, executor=executor, chunksize=2) == expected
+    with ThreadPoolExecutor(max_workers=2) as thread_executor:
+        assert map_many(sources, Target, extras=extras, executor=thread_executor) == expected
+
+
+def test_map_many_in_processes_empty():
+    assert map_many([], Target, executor="process") == []
+
+
+def test_map_many_in_processes_local_classes():
+    @dataclass
+    class LocalTarget:
+        x: int
+
+    @mapper(LocalTarget)
+    @dataclass
+    class LocalSource:
+        x: int
+
+    with pytest.raises(ValueError, match="top level of a module"):
+        map_many([LocalSource(x=1)], LocalTarget, executor="process")
+    with ThreadPoolExecutor(max_workers=2) as thread_executor:
+        assert map_many([LocalSource(x=1)], LocalTarget, executor=thread_executor) == [LocalTarget(x=1)]
+
+
+def test_map_many_invalid_executor():
+    with pytest.raises(ValueError, match="Unknown executor"):
+        map_many([Source(x=1)], Target, executor="thread")
+    with pytest.raises(ValueError, match="workers"):
+        map_many([Source(x=1)], Target, executor="process", workers=0)
+
+
+def test_map_many_in_processes_mixed_classes():
+    sources = [Source(x=0), OtherSource(x=1), Source(x=2), OtherSource(x=3), Source(x=4)]
+    extras = [{"label": str(i)} for i in range(5)]
+    expected = [Target(x=0, label="0"), Target(x=1, label="other"), Target(x=2, label="2")]
+    expected += [Target(x=3, label="other"), Target(x=4, label="4")]
+    assert map_many(sources, Target, extras=extras, executor="process", workers=2, chunksize=2) == expected
+
+    with pytest.raises(NotImplementedError):
+        map_many([Source(x=0), Target(x=1, label="")], Target, extras=extras[:2], executor="process", workers=2)
+
+
+def test_map_many_in_processes_extras_length_mismatch():
+    sources = [Source(x=i) for i in range(5)]
+    with pytest.raises(ValueError, match="Got 5 objects, but 4 extra dictionaries"):
+        map_many(sources, Target, extras=[{"label": "a"}] * 4, executor="process", workers=2, chunksize=2)
+
+    convert_many = getattr(Source, get_map_many_func_name(Target))
+    with pytest.raises(ValueError, match="Got 5 objects, but 6 extra dictionaries"):
+        map_chunks(convert_many, sources, [{"label": "a"}] * 6, modules=[__name__], executor="process", chunksize=2)
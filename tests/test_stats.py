@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from importlib import import_module
+from typing import List
+
+import pytest
+
+from dataclass_mapper import enable_stats, map_many, map_to, mapper, reset_stats, stats
+
+instrumentation_module = import_module("dataclass_mapper.instrumentation")
+
+
+@dataclass
+class Item:
+    name: str
+
+
+@dataclass
+class Order:
+    items: List[Item]
+
+
+@pytest.fixture
+def instrumented(monkeypatch):
+    monkeypatch.setattr(instrumentation_module, "_enabled", False)
+    monkeypatch.setattr(instrumentation_module, "_stats", type(instrumentation_module._stats)())
+    enable_stats()
+
+
+def test_stats(instrumented):
+    @mapper(Item)
+    @dataclass
+    class ItemSource:
+        name: str
+
+    @mapper(Order)
+    @dataclass
+    class OrderSource:
+        items: List[ItemSource]
+
+    order = OrderSource(items=[ItemSource(name="a"), ItemSource(name="b")])
+    map_to(order, Order)
+    map_many([order, order], Order, extras=[{}, {}])
+
+    snapshot = stats()
+    order_stats = snapshot[(OrderSource, Order)]
+    assert (order_stats.calls, order_stats.objects, order_stats.nested_objects) == (2, 3, 6)
+    assert 0 < order_stats.self_time <= order_stats.total_time
+    item_stats = snapshot[(ItemSource, Item)]
+    assert (item_stats.calls, item_stats.objects, item_stats.nested_objects) == (6, 6, 0)
+    assert item_stats.self_time == pytest.approx(item_stats.total_time)
+
+    # the snapshot doesn't change anymore
+    map_to(order, Order)
+    assert snapshot[(OrderSource, Order)].calls == 2
+
+    reset_stats()
+    assert stats()[(OrderSource, Order)].calls == 0
+
+
+def test_no_instrumentation_by_default(instrumented):
+    enable_stats(False)
+
+    @mapper(Item)
+    @dataclass
+    class ItemSource:
+        name: str
+
+    map_to(ItemSource(name="a"), Item)
+    assert stats() == {}
@@ -0,0 +1,110 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, List
+
+import pytest
+
+from dataclass_mapper import amap_iter, mapper
+
+
+@dataclass
+class Target:
+    x: int
+
+
+@mapper(Target)
+@dataclass
+class Source:
+    x: int
+
+
+async def source_items(count: int, log: List[Any]) -> AsyncIterator[Source]:
+    for i in range(count):
+        log.append(("read", i))
+        yield Source(x=i)
+
+
+async def collect(items: AsyncIterator[Target]) -> List[Target]:
+    return [item async for item in items]
+
+
+def test_amap_iter():
+    log: List[Any] = []
+    result = asyncio.run(collect(amap_iter(source_items(5, log), Target, chunk=2)))
+    assert result == [Target(x=i) for i in range(5)]
+
+
+def test_amap_iter_mixed_classes():
+    @mapper(Target, {"x": "y"})
+    @dataclass
+    class OtherSource:
+        y: int
+
+    async def mixed_items() -> AsyncIterator[Any]:
+        for i in range(5):
+            yield Source(x=i) if i % 2 == 0 else OtherSource(y=i)
+
+    result = asyncio.run(collect(amap_iter(mixed_items(), Target, chunk=3)))
+    assert result == [Target(x=i) for i in range(5)]
+
+
+def test_amap_iter_yields_to_the_event_loop():
+    events: List[Any] = []
+
+    async def ticker() -> None:
+        for _ in range(3):
+            events.append("tick")
+            await asyncio.sleep(0)
+
+    async def consume() -> None:
+        async for target in amap_iter(source_items(6, []), Target, chunk=2):
+            events.append(target.x)
+
+    async def main() -> None:
+        await asyncio.gather(consume(), ticker())
+
+    asyncio.run(main())
+    # the other coroutine runs between the chunks
+    assert events.index("tick", 1) < events.index(4)
+
+
+def test_amap_iter_reads_on_demand():
+    log: List[Any] = []
+
+    async def main() -> None:
+        async for target in amap_iter(source_items(10, log), Target, chunk=2):
+            log.append(("mapped", target.x))
+            if target.x == 1:
+                break
+
+    asyncio.run(main())
+    assert log == [("read", 0), ("read", 1), ("mapped", 0), ("mapped", 1)]
+
+
+def test_amap_iter_backpressure():
+    log: List[Any] = []
+
+    async def main() -> None:
+        items = amap_iter(source_items(100, log), Target, chunk=2, queue_size=2)
+        assert (await items.__anext__()) == Target(x=0)
+        await asyncio.sleep(0.01)
+        # one chunk is consumed, two are queued, and the reader waits with one more chunk for a free slot
+        assert len([entry for entry in log if entry[0] == "read"]) == 8
+        assert [target async for target in items] == [Target(x=i) for i in range(1, 100)]
+
+    asyncio.run(main())
+
+
+def test_amap_iter_source_errors():
+    async def failing() -> AsyncIterator[Source]:
+        yield Source(x=1)
+        raise RuntimeError("connection lost")
+
+    for queue_size in (0, 1):
+        with pytest.raises(RuntimeError, match="connection lost"):
+            asyncio.run(collect(amap_iter(failing(), Target, queue_size=queue_size)))
+
+
+def test_amap_iter_invalid_chunk():
+    with pytest.raises(ValueError):
+        asyncio.run(collect(amap_iter(source_items(1, []), Target, chunk=0)))
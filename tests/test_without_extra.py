@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pytest
+
+from dataclass_mapper import map_many, map_to, mapper, provide_with_extra
+from dataclass_mapper.mapper import _make_mapper
+from dataclass_mapper.registry import get_compiled_mapper
+
+
+@dataclass
+class Item:
+    name: str
+
+
+@dataclass
+class Collection:
+    item: Item
+    optional_item: Optional[Item]
+    items: List[Item]
+    by_name: Dict[str, Item]
+
+
+@mapper(Item)
+@dataclass
+class ItemSource:
+    name: str
+
+
+@mapper(Collection)
+@dataclass
+class CollectionSource:
+    item: ItemSource
+    optional_item: Optional[ItemSource]
+    items: List[ItemSource]
+    by_name: Dict[str, ItemSource]
+
+
+def collection_source() -> CollectionSource:
+    return CollectionSource(
+        item=ItemSource(name="a"),
+        optional_item=None,
+        items=[ItemSource(name="b")],
+        by_name={"c": ItemSource(name="c")},
+    )
+
+
+EXPECTED = Collection(item=Item(name="a"), optional_item=None, items=[Item(name="b")], by_name={"c": Item(name="c")})
+
+
+def test_variant_without_extra_is_generated():
+    compiled_mapper = get_compiled_mapper(CollectionSource, Collection)
+    assert compiled_mapper is not None
+    code = _make_mapper(compiled_mapper)
+    assert "def map_CollectionSource_to_Collection_without_extra(self)" in code
+    assert "def map_many_CollectionSource_to_Collection_without_extra(objs)" in code
+    without_extra = code[code.index("def map_CollectionSource_to_Collection_without_extra") :]
+    assert "extra" not in without_extra.replace("_without_extra", "")
+
+
+def test_map_without_extra():
+    assert map_to(collection_source(), Collection) == EXPECTED
+    assert map_many([collection_source(), collection_source()], Collection) == [EXPECTED, EXPECTED]
+    # same result with the variant that handles the extra dictionaries
+    assert map_to(collection_source(), Collection, extra={}) == EXPECTED
+    assert map_many([collection_source()], Collection, extras=[{}]) == [EXPECTED]
+
+
+def test_map_without_extra_fails_if_extra_is_required():
+    @dataclass
+    class Target:
+        x: int
+        y: int
+
+    @mapper(Target, {"y": provide_with_extra()})
+    @dataclass
+    class Source:
+        x: int
+
+    with pytest.raises(TypeError, match="'y' needs to be provided"):
+        map_to(Source(x=1), Target)
+    with pytest.raises(TypeError, match="'y' needs to be provided"):
+        map_many([Source(x=1)], Target)
+    assert map_to(Source(x=1), Target, extra={"y": 2}) == Target(x=1, y=2)
+
+
+def test_lazy_mapper_without_extra():
+    @dataclass
+    class Target:
+        x: int
+
+    @mapper(Target, lazy=True)
+    @dataclass
+    class Source:
+        x: int
+
+    assert map_many([Source(x=1)], Target) == [Target(x=1)]
+    assert map_to(Source(x=2), Target) == Target(x=2)